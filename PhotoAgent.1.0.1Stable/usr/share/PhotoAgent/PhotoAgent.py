@@ -7,31 +7,50 @@ import os
 import hashlib
 import shutil
 import stat
+import struct
+import re
+import mmap
+import select
+import threading
 from datetime import datetime
 import getpass
 from urllib.parse import quote
 import subprocess
 import platform
+import time
+from collections import deque, OrderedDict
 import json
+import sqlite3
 import configparser 
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 
 # --- PYQT5 İMPORTLARI ---
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QLabel, QListWidget, QTableWidget,
-    QTableWidgetItem, QHeaderView, QGroupBox, QCheckBox, QProgressBar,
+    QPushButton, QLineEdit, QLabel, QListView, QTableView,
+    QHeaderView, QGroupBox, QCheckBox, QProgressBar,
     QAbstractItemView, QFileDialog, QMessageBox, QTextEdit,
     QRadioButton, QButtonGroup, QAbstractButton, QTabWidget,
-    QFileIconProvider, QMenu, QListWidgetItem, QSizePolicy 
+    QFileIconProvider, QMenu, QSizePolicy, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal as Signal, pyqtSlot as Slot, QThread, QLocale, QSize, QFileInfo
-from PyQt5.QtGui import QColor, QBrush, QIcon, QPixmap, QFont, QGuiApplication
+from PyQt5.QtCore import (
+    Qt, pyqtSignal as Signal, pyqtSlot as Slot, QThread, QLocale, QSize, QFileInfo,
+    QAbstractListModel, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QPoint, QTimer,
+    QBuffer, QByteArray, QIODevice
+)
+from PyQt5.QtGui import QColor, QBrush, QIcon, QPixmap, QImage, QImageReader, QFont, QGuiApplication
 # PyQt5'te QtSvg genellikle ayrı bir pakettedir. Bu yüzden belirtmek zorundayım. 
 try:
     from PyQt5.QtSvg import QSvgRenderer 
 except ImportError:
     # Eğer QtSvg yoksa, kodu çalıştırmaya devam et.
     QSvgRenderer = None
+# Benzer görsel araması (algısal hash) NumPy ile vektörel hesaplanır; yoksa bu mod kapalıdır.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 # --- PYQT5 İMPORTLARI SONU ---
 
 # --- GNOME/Qt Platform Plugin Fix ---
@@ -48,7 +67,8 @@ _texts = {}
 # FİLTRE SABİTLERİ 
 EXTENSION_FILTERS = {
     # Minimal sürümde sadece 'image' filtresi zorunludur.
-    "image": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico", ".raw"],
+    "image": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico", ".raw",
+              ".cr2", ".nef", ".arw", ".dng"],
 }
 
 # --- KARANLIK TEMA QSS TANIMI (Aynı Kaldı çünkü QT5de sistem temasına tam uyum yok böyle kalsın) ---
@@ -83,7 +103,7 @@ QPushButton:pressed {
 }
 
 /* Giriş Alanları, Listeler ve Tablolar */
-QLineEdit, QListWidget, QTableWidget {
+QLineEdit, QListView, QTableView {
     background-color: #3c3c3c;
     border: 1px solid #555555;
     color: #ffffff;
@@ -261,6 +281,74 @@ def load_language_preference():
     
     return DEFAULT_LANG
 
+# Performans ayarları (settings.ini -> [PERFORMANCE]). Değerlerin türü varsayılandan belirlenir.
+DEFAULT_PERFORMANCE_SETTINGS = {
+    "traversal_workers": 0,  # 0 = bağlama (mount) türüne göre otomatik
+    "hash_workers": 0,       # 0 = işlemci çekirdeği sayısı kadar
+    "hash_use_processes": False,  # True: iş parçacığı yerine süreç havuzu
+    "hash_algorithm": "blake2b",  # Gruplama için hızlı algoritma (HASH_ALGORITHMS anahtarlarından biri)
+    "confirm_algorithm": "",      # Boş değilse son gruplar bu güçlü algoritmayla doğrulanır (ör. sha256)
+    "use_hash_index": True,       # Değişmeyen dosyaların özetlerini ~/.photoagent altındaki dizinden kullan
+    "stream_results": True,       # Kopya grupları tarama bitmeden sonuç listesinde görünsün
+    "thumbnail_cache": True,      # Küçük resimleri ~/.cache/thumbnails altında paylaşımlı önbellekte tut
+    "thumbnail_cache_max_mb": 256,  # PhotoAgent'ın yazdığı küçük resimlerin üst sınırı; aşılınca en eskiler silinir
+    "pixmap_cache_mb": 64,        # Bellekteki küçük resim önbelleğinin bayt bütçesi
+    "similarity_hash": "phash",   # Benzer görsel modu: ahash, dhash veya phash
+    "similarity_threshold": 10,   # İki görsel en fazla bu kadar bit farklıysa benzer sayılır (0-64)
+}
+
+# Otomatik işaretleme ayarları (settings.ini -> [AUTOMARK])
+DEFAULT_AUTOMARK_SETTINGS = {
+    # Her grupta tutulacak dosyayı seçen kurallar, öncelik sırasıyla (AUTOMARK_RULES anahtarları)
+    "rules": "priority, resolution, oldest, shortest",
+    # "priority" kuralının klasörleri; os.pathsep (Linux'ta ':') ile ayrılır, önce yazılan önceliklidir
+    "priority_prefixes": "",
+}
+
+def _load_settings_section(section_name, defaults):
+    """settings.ini içindeki bir bölümü varsayılan değerlerle birleştirerek yükler."""
+    settings = dict(defaults)
+    config_file = os.path.join(os.path.expanduser('~/.photoagent'), 'settings.ini')
+
+    if os.path.exists(config_file):
+        try:
+            config = configparser.ConfigParser()
+            config.read(config_file, encoding='utf-8')
+
+            if section_name in config:
+                section = config[section_name]
+                for key, default in defaults.items():
+                    if key not in section:
+                        continue
+                    if isinstance(default, bool):
+                        settings[key] = section.getboolean(key)
+                    elif isinstance(default, int):
+                        settings[key] = section.getint(key)
+                    elif isinstance(default, float):
+                        settings[key] = section.getfloat(key)
+                    else:
+                        settings[key] = section[key]
+        except Exception as e:
+            print(f"{section_name} ayarları yüklenemedi: {e}")
+
+    return settings
+
+def load_performance_settings():
+    """settings.ini içindeki [PERFORMANCE] bölümünü varsayılan değerlerle birleştirerek yükler."""
+    return _load_settings_section("PERFORMANCE", DEFAULT_PERFORMANCE_SETTINGS)
+
+def load_automark_settings():
+    """[AUTOMARK] bölümünü yükler; kurallar ve öncelikli klasörler listeye çevrilir."""
+    settings = _load_settings_section("AUTOMARK", DEFAULT_AUTOMARK_SETTINGS)
+    rules = [rule.strip() for rule in settings["rules"].split(",") if rule.strip()]
+    for rule in rules:
+        if rule not in AUTOMARK_RULES:
+            print(f"HATA: Bilinmeyen otomatik işaretleme kuralı '{rule}' yok sayıldı.")
+    settings["rules"] = [rule for rule in rules if rule in AUTOMARK_RULES]
+    settings["priority_prefixes"] = [prefix.strip() for prefix in settings["priority_prefixes"].split(os.pathsep)
+                                     if prefix.strip()]
+    return settings
+
 # ----------------------------------------------------------------------
 # 0. YARDIMCI FONKSİYONLAR (Burası aynı kaldı değişikliğe gerek yok)
 # ----------------------------------------------------------------------
@@ -300,7 +388,14 @@ def open_path_in_os(path):
         return False
 
 def get_mount_point(path):
-    """Verilen dosya yolunun bağlı olduğu mount noktasını bulur."""
+    """Verilen dosya yolunun bağlı olduğu mount noktasını bulur.
+
+    Linux'ta bellekteki bağlama tablosundan okunur (bkz. MountTable); tablo
+    okunamazsa üst dizinlere doğru os.path.ismount ile aranır.
+    """
+    mount_point = _mount_table.mount_point(path)
+    if mount_point is not None:
+        return mount_point
     path = os.path.abspath(path)
     if platform.system() == "Linux" or platform.system() == "Darwin":
         while not os.path.ismount(path):
@@ -317,24 +412,1109 @@ def get_mount_point(path):
     else:
         return os.path.abspath(os.path.sep)
 
+# Gidiş-dönüş gecikmesi yüksek olan ağ/FUSE dosya sistemleri
+NETWORK_FILESYSTEMS = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs",
+    "fuse.sshfs", "fuse.rclone", "fuse.glusterfs", "davfs", "fuse.davfs2",
+}
+
+def _unescape_mount_field(field):
+    """/proc/self/mounts ve mountinfo alanlarındaki sekizlik kaçışları (ör. '\\040' = boşluk) çözer."""
+    if '\\' not in field:
+        return field
+    result = []
+    i = 0
+    while i < len(field):
+        if field[i] == '\\' and field[i + 1:i + 4].isdigit():
+            result.append(chr(int(field[i + 1:i + 4], 8)))
+            i += 4
+        else:
+            result.append(field[i])
+            i += 1
+    return ''.join(result)
+
+class MountTable:
+    """/proc/self/mountinfo'dan bir kez okunan, değişince yenilenen bağlama tablosu.
+
+    Yol aramaları üst dizinleri sözlükte arayarak yapılır (en uzun önek eşleşmesi),
+    diske stat çağrısı gerekmez. Aynı noktaya üst üste bağlananlarda görünür olan
+    (dosyada sonra gelen) kayıt geçerlidir. Çekirdek tablo her değiştiğinde dosya
+    tanıtıcısında POLLPRI bildirir; her aramada bekletmeden poll edilir.
+
+    Bağlama (bind) noktaları kendi kaydıyla döner: aynı dosya sisteminde olsalar da
+    başka bir bağlama noktasına rename yapılamaz (EXDEV). Aynı şey btrfs alt
+    birimleri için de geçerlidir; alt birimler mountinfo'da görünmez ama st_dev
+    değerleri farklıdır. Yolun st_dev'i bağlamanınkinden farklıysa aynı st_dev'i
+    taşıyan en üst dizin bulunur ve (bağlama noktası, st_dev) için saklanır.
+    """
+
+    MOUNTINFO_PATH = '/proc/self/mountinfo'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._file = None
+        self._poller = None
+        self._available = None  # None: henüz denenmedi
+        self._entries = {}
+        self._subvolume_roots = {}
+
+    def _ensure_current(self):
+        """Tablo hiç okunmadıysa veya çekirdek değişiklik bildirdiyse yeniden okur. Kullanılabilirse True."""
+        if self._available is None:
+            try:
+                self._file = open(self.MOUNTINFO_PATH, 'rb')
+                self._poller = select.poll()
+                self._poller.register(self._file.fileno(), select.POLLPRI)
+            except (OSError, AttributeError):
+                # Linux dışı sistemler: üst dizin aramasına düşülür
+                self._available = False
+                return False
+            self._available = True
+            self._load()
+        elif self._available and self._poller.poll(0):
+            self._load()
+        return self._available
+
+    def _load(self):
+        self._file.seek(0)
+        entries = {}
+        for line in self._file.read().decode('utf-8', errors='replace').splitlines():
+            # mount_id parent_id major:minor root mount_point seçenekler [isteğe bağlı...] - tür kaynak ...
+            fields = line.split()
+            try:
+                separator = fields.index('-', 6)
+                major, minor = fields[2].split(':')
+                mount_point = _unescape_mount_field(fields[4])
+                entries[mount_point] = {
+                    "mount_point": mount_point,
+                    "root": _unescape_mount_field(fields[3]),
+                    "device": os.makedev(int(major), int(minor)),
+                    "fstype": fields[separator + 1],
+                }
+            except (ValueError, IndexError):
+                continue
+        self._entries = entries
+        self._subvolume_roots = {}
+
+    def lookup(self, path):
+        """path'i içeren bağlama kaydını döndürür (path gerçek, mutlak yol olmalı). Tablo yoksa None."""
+        with self._lock:
+            if not self._ensure_current():
+                return None
+            entries = self._entries
+        while True:
+            entry = entries.get(path)
+            if entry is not None:
+                return entry
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+
+    @staticmethod
+    def _resolve(path):
+        """(gerçek yol, st_dev) döndürür; yol yoksa st_dev None'dır.
+
+        O_PATH ile tek açılış realpath'in bileşen başına lstat çağrılarından ucuzdur.
+        """
+        try:
+            fd = os.open(path, os.O_PATH)
+        except (OSError, AttributeError):
+            return os.path.realpath(path), None
+        try:
+            return os.readlink(f'/proc/self/fd/{fd}'), os.fstat(fd).st_dev
+        except OSError:
+            return os.path.realpath(path), None
+        finally:
+            os.close(fd)
+
+    def mount_point(self, path):
+        """path'in rename ile taşınabileceği en üst dizini (bağlama noktası veya btrfs alt birimi kökü) döndürür."""
+        path, device = self._resolve(path)
+        entry = self.lookup(path)
+        if entry is None:
+            return None
+        mount_point = entry["mount_point"]
+        if device is None or device == entry["device"]:
+            return mount_point
+
+        key = (mount_point, device)
+        root = self._subvolume_roots.get(key)
+        if root is not None and (path == root or path.startswith(root.rstrip(os.path.sep) + os.path.sep)):
+            return root
+        root = path
+        while root != mount_point:
+            parent = os.path.dirname(root)
+            try:
+                if os.stat(parent).st_dev != device:
+                    break
+            except OSError:
+                break
+            root = parent
+        self._subvolume_roots[key] = root
+        return root
+
+_mount_table = MountTable()
+
+def get_filesystem_type(path):
+    """Verilen yolun bulunduğu dosya sisteminin türünü (ör. 'ext4', 'nfs4') döndürür. Bilinmiyorsa ''."""
+    entry = _mount_table.lookup(os.path.realpath(path))
+    return entry["fstype"] if entry else ""
+
+def default_traversal_workers(path):
+    """Dizin taraması için varsayılan iş parçacığı sayısını bağlama türüne göre seçer.
+
+    Ağ dosya sistemlerinde süre gecikmeye bağlı olduğundan çok sayıda eşzamanlı istek
+    verimi artırır; yerel disklerde tek iş parçacıklı akış motoru yeterlidir.
+    """
+    if get_filesystem_type(path) in NETWORK_FILESYSTEMS:
+        return 16
+    return 1
+
 # ----------------------------------------------------------------------
 # 1. HASH VE TARAMA MANTIĞI (Aynı kaldı)
 # ----------------------------------------------------------------------
 
-def calculate_md5(filepath, chunk_size=4096):
+# Okuma tamponu sınırları: cihazın blok boyutuna göre 1-8 MiB arasında seçilir
+MIN_READ_CHUNK = 1024 * 1024
+MAX_READ_CHUNK = 8 * 1024 * 1024
+# Bu boyuttan büyük dosyalar mmap ile (çekirdekten kullanıcı alanına kopyalamadan) hashlenir
+MMAP_THRESHOLD = 256 * 1024 * 1024
+
+# Her iş parçacığının yeniden kullandığı önceden ayrılmış okuma tamponu
+_read_buffers = threading.local()
+
+def choose_chunk_size(block_size):
+    """Cihazın tercih ettiği blok boyutunun (st_blksize) katı olan bir okuma boyutu seçer."""
+    block_size = block_size or 4096
+    return max(MIN_READ_CHUNK, min(MAX_READ_CHUNK, block_size * 256))
+
+def _get_read_buffer(size):
+    """Bu iş parçacığına ait, en az 'size' bayt uzunluğundaki tamponu döndürür."""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = bytearray(size)
+        _read_buffers.buffer = buffer
+    return buffer
+
+def _update_from_file(hasher, file, chunk_size, limit=None):
+    """Dosyayı tek bir tampona readinto ile okuyarak hasher'a aktarır; okunan bayt sayısını döndürür.
+
+    Her parça için yeni bir bytes nesnesi oluşturulmaz, memoryview dilimleri kopyasız aktarılır.
+    limit verilirse en fazla o kadar bayt okunur.
+    """
+    view = memoryview(_get_read_buffer(chunk_size))[:chunk_size]
+    total = 0
+    with view:
+        while limit is None or total < limit:
+            want = chunk_size if limit is None else min(chunk_size, limit - total)
+            read_count = file.readinto(view[:want])
+            if not read_count:
+                break
+            hasher.update(view[:read_count])
+            total += read_count
+    return total
+
+def _update_from_mmap(hasher, file, file_size, chunk_size):
+    """Çok büyük dosyaları bellek eşlemesi (mmap) üzerinden parça parça hashler."""
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapped) as view:
+            for offset in range(0, file_size, chunk_size):
+                hasher.update(view[offset:offset + chunk_size])
+    return file_size
+
+def _hash_file(filepath, hasher, chunk_size=None, use_mmap=True):
+    """Dosyanın tüm içeriğini verilen hasher'a aktarır. Hata durumunda None, aksi halde hasher döner."""
+    try:
+        # buffering=0: readinto doğrudan tampona yazar, ara BufferedReader kopyası olmaz
+        with open(filepath, 'rb', buffering=0) as file:
+            file_stats = os.fstat(file.fileno())
+            chunk_size = chunk_size or choose_chunk_size(getattr(file_stats, "st_blksize", 0))
+            if use_mmap and file_stats.st_size >= MMAP_THRESHOLD:
+                _update_from_mmap(hasher, file, file_stats.st_size, chunk_size)
+            else:
+                _update_from_file(hasher, file, chunk_size)
+        return hasher
+    except (IOError, OSError, ValueError):
+        return None
+
+# Seçilebilir hash algoritmaları. md5 eski sürümlerle uyumluluk için korunur.
+HASH_ALGORITHMS = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+}
+DEFAULT_HASH_ALGORITHM = "blake2b"
+
+def resolve_hash_algorithm(name, default=DEFAULT_HASH_ALGORITHM):
+    """Ayarlardan gelen algoritma adını doğrular; bilinmeyen adlar için varsayılanı döndürür."""
+    name = (name or "").strip().lower()
+    if name in HASH_ALGORITHMS:
+        return name
+    if name:
+        print(f"UYARI: Bilinmeyen hash algoritması '{name}', '{default}' kullanılıyor.")
+    return default
+
+def new_hasher(algorithm=DEFAULT_HASH_ALGORITHM):
+    """Verilen algoritma adı için yeni bir hashlib nesnesi oluşturur."""
+    return HASH_ALGORITHMS[algorithm]()
+
+def calculate_hash(filepath, algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=None):
+    """Dosyanın tüm içeriğinin seçilen algoritmayla hash'ini hesaplar. Hata durumunda None döner."""
+    hasher = _hash_file(filepath, new_hasher(algorithm), chunk_size)
+    return hasher.hexdigest() if hasher else None
+
+def calculate_md5(filepath, chunk_size=None):
     """Büyük dosyalar için belleği yormadan MD5 hash'ini hesaplar."""
-    hasher = hashlib.md5()
+    return calculate_hash(filepath, "md5", chunk_size)
+
+# --- Meta veriden bağımsız içerik hash'i (yalnızca sıkıştırılmış görüntü verisi) ---
+PAYLOAD_HASH_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PNG'de yalnızca pikselleri belirleyen parçalar hashlenir; tEXt/iTXt/zTXt, eXIf, tIME,
+# renk profili (iCCP, gAMA ...) gibi yardımcı parçalar atlanır.
+PNG_PAYLOAD_CHUNKS = {b"IHDR", b"PLTE", b"tRNS", b"IDAT"}
+
+def _is_jpeg_metadata_marker(marker):
+    # APP0-APP15 (EXIF, XMP, JFIF, ICC, Photoshop ...) ve COM yorum bölümleri
+    return 0xE0 <= marker <= 0xEF or marker == 0xFE
+
+def _jpeg_header_segments(file, offset=0, end=None):
+    """JPEG'in SOS'a kadarki bölümlerini [(işaretçi, konum, uzunluk)] olarak döndürür.
+
+    Yalnızca 4 baytlık bölüm başlıkları okunur. offset ve end, başka bir dosyanın
+    içine gömülü JPEG'in (ör. RAW önizlemesi) bayt aralığıdır. İkinci değer ilk SOS
+    işaretçisinin konumudur; geçerli bir JPEG değilse veya aralık aşılırsa (None, None).
+    """
+    file.seek(offset)
+    if file.read(2) != b"\xff\xd8":
+        return None, None
+
+    segments = []
+    position = offset + 2
+    for _ in range(MAX_JPEG_MARKERS):
+        if end is not None and position + 4 > end:
+            return None, None
+        file.seek(position)
+        marker_header = file.read(4)
+        if len(marker_header) < 4 or marker_header[0] != 0xFF:
+            return None, None
+        marker = marker_header[1]
+        if marker == 0xFF: # Doldurma baytı
+            position += 1
+            continue
+        if marker == 0xDA:
+            return segments, position
+        (segment_length,) = struct.unpack(">H", marker_header[2:4])
+        segments.append((marker, position, 2 + segment_length))
+        position += 2 + segment_length
+    return None, None
+
+# Tarama (entropi) verisinde 0xFF ardından yalnızca 00 (doldurma), RST0-7 veya başka bir
+# 0xFF gelebilir; bunların dışındaki ilk 0xFF bir işaretçi başlatır
+_JPEG_ENTROPY_MARKER = re.compile(rb"\xff[^\x00\xd0-\xd7\xff]")
+
+def _jpeg_entropy_end(file, position, chunk_size):
+    """position'dan başlayan tarama verisinden sonraki ilk işaretçinin konumunu döndürür (yoksa None)."""
+    file.seek(position)
+    tail = b""
+    while True:
+        data = file.read(chunk_size)
+        if not data:
+            return None
+        window = tail + data
+        match = _JPEG_ENTROPY_MARKER.search(window)
+        if match:
+            return position - len(tail) + match.start()
+        tail = window[-1:]
+        position += len(data)
+
+def _jpeg_payload_end(file, segments, sos_position, file_size, chunk_size):
+    """JPEG'in EOI işaretçisinin bittiği konumu döndürür; EOI'den sonraki ekler hashlenmez.
+
+    Telefonlar ve fotoğraf yöneticileri EOI'nin ardına veri ekler (hareketli fotoğraf
+    videosu, MPF ek görüntüleri, üretici blokları). Dosya FF D9 ile bitiyor ve başlıkta
+    MPF (APP2) bölümü yoksa EOI dosya sonudur; yalnızca başlıklar okunmuş olur. Aksi
+    halde tarama verisi ve taramalar arası bölümler (aşamalı JPEG) dolaşılır. EOI
+    bulunamayan kesik dosyada dosya sonu döner.
+    """
+    has_mpf = any(marker == 0xE2 and _read_at(file, position + 4, 4) == b"MPF\x00"
+                  for marker, position, _length in segments)
+    if not has_mpf and file_size >= 2 and _read_at(file, file_size - 2, 2) == b"\xff\xd9":
+        return file_size
+
+    position = sos_position
+    for _ in range(MAX_JPEG_MARKERS):
+        marker_header = _read_at(file, position, 4)
+        if len(marker_header) < 2 or marker_header[0] != 0xFF:
+            break
+        marker = marker_header[1]
+        if marker == 0xD9:
+            return position + 2
+        if marker == 0xFF: # Doldurma baytı
+            position += 1
+            continue
+        if len(marker_header) < 4:
+            break
+        (segment_length,) = struct.unpack(">H", marker_header[2:4])
+        position += 2 + segment_length
+        if marker == 0xDA:
+            position = _jpeg_entropy_end(file, position, chunk_size)
+            if position is None:
+                break
+    return file_size
+
+def _png_bucket_key(file):
+    """PNG parça başlıklarını (veriyi okumadan atlayarak) dolaşıp ön gruplama anahtarını üretir."""
+    chunk = file.read(8 + 13)
+    if len(chunk) < 21 or chunk[4:8] != b"IHDR":
+        return None
+    ihdr = chunk[8:].hex()
+    file.seek(4, os.SEEK_CUR) # CRC
+    idat_length = 0
+    other_lengths = []
+    while True:
+        chunk_header = file.read(8)
+        # IEND'siz biten dosyada da calculate_payload_hash gibi dosya sonunda durulur
+        if len(chunk_header) < 8 or chunk_header[4:8] == b"IEND":
+            return ("png", ihdr, tuple(other_lengths), idat_length)
+        (length,) = struct.unpack(">I", chunk_header[:4])
+        chunk_type = chunk_header[4:8]
+        if chunk_type == b"IDAT":
+            idat_length += length
+        elif chunk_type in PNG_PAYLOAD_CHUNKS:
+            other_lengths.append((chunk_type.decode("ascii"), length))
+        file.seek(length + 4, os.SEEK_CUR)
+
+def payload_bucket_key(filepath):
+    """Meta veri yok sayılarak eşleşebilecek dosyaları ön gruplamak için ucuz bir anahtar.
+
+    JPEG: meta veri dışındaki bölümler + SOS'tan EOI'ye kadarki verinin uzunluğu
+    (hashlenecek baytların tam sayısı; EOI'yi bulmak için _jpeg_payload_end'e bakın). PNG: IHDR parçası (boyut, bit derinliği, renk
+    türü) + PLTE/tRNS uzunlukları + IDAT verisinin toplam uzunluğu; toplam, IDAT'ın
+    kaç parçaya bölündüğünden bağımsızdır. Yalnızca başlıklar okunur. JPEG/PNG
+    değilse veya ayrıştırılamazsa None.
+    """
+    if os.path.splitext(filepath)[1].lower() not in PAYLOAD_HASH_EXTENSIONS:
+        return None
+    try:
+        with open(filepath, 'rb', buffering=0) as file:
+            signature = file.read(8)
+            if signature[:2] == b"\xff\xd8":
+                segments, sos_position = _jpeg_header_segments(file)
+                if segments is None:
+                    return None
+                file_stats = os.fstat(file.fileno())
+                payload_end = _jpeg_payload_end(file, segments, sos_position, file_stats.st_size,
+                                                choose_chunk_size(getattr(file_stats, "st_blksize", 0)))
+                payload_length = sum(length for marker, _position, length in segments
+                                     if not _is_jpeg_metadata_marker(marker))
+                return ("jpeg", payload_length + payload_end - sos_position)
+            if signature == PNG_SIGNATURE:
+                return _png_bucket_key(file)
+    except (OSError, struct.error):
+        pass
+    return None
+
+def calculate_payload_hash(filepath, algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=None):
+    """JPEG/PNG dosyasının yalnızca sıkıştırılmış görüntü verisinin hash'ini hesaplar.
+
+    Pikseller çözülmez; dosya başlıkları akış halinde ayrıştırılıp meta veri bölümleri
+    atlanır. JPEG'de APPn/COM dışındaki bölümler ve SOS'tan EOI'ye kadar tarama verisi,
+    PNG'de IHDR/PLTE/tRNS ve IDAT verisi hashlenir (IDAT parça sınırları önemsizdir).
+    Okunan veri tam hash ile hemen hemen aynıdır. Hata durumunda None döner.
+    """
+    hasher = new_hasher(algorithm)
     try:
-        with open(filepath, 'rb') as file:
+        with open(filepath, 'rb', buffering=0) as file:
+            file_stats = os.fstat(file.fileno())
+            chunk_size = chunk_size or choose_chunk_size(getattr(file_stats, "st_blksize", 0))
+            signature = file.read(8)
+
+            if signature[:2] == b"\xff\xd8":
+                segments, sos_position = _jpeg_header_segments(file)
+                if segments is None:
+                    return None
+                for marker, position, length in segments:
+                    if _is_jpeg_metadata_marker(marker):
+                        continue
+                    file.seek(position)
+                    _update_from_file(hasher, file, chunk_size, length)
+                payload_end = _jpeg_payload_end(file, segments, sos_position, file_stats.st_size, chunk_size)
+                file.seek(sos_position)
+                _update_from_file(hasher, file, chunk_size, payload_end - sos_position)
+                return hasher.hexdigest()
+
+            if signature != PNG_SIGNATURE:
+                return None
             while True:
-                chunk = file.read(chunk_size)
-                if not chunk:
+                chunk_header = file.read(8)
+                if len(chunk_header) < 8:
                     break
-                hasher.update(chunk)
-        return hasher.hexdigest()
-    except IOError:
+                (length,) = struct.unpack(">I", chunk_header[:4])
+                chunk_type = chunk_header[4:8]
+                if chunk_type in PNG_PAYLOAD_CHUNKS:
+                    if chunk_type != b"IDAT":
+                        hasher.update(chunk_type)
+                    if _update_from_file(hasher, file, chunk_size, length) < length:
+                        return None # Kesik dosya
+                    file.seek(4, os.SEEK_CUR) # CRC
+                else:
+                    file.seek(length + 4, os.SEEK_CUR)
+                if chunk_type == b"IEND":
+                    break
+            return hasher.hexdigest()
+    except (IOError, OSError, ValueError, struct.error):
         return None
 
+def _debug_dump(title, stats):
+    """PHOTOAGENT_DEBUG ortam değişkeni tanımlıysa sayaçları konsola yazar."""
+    if os.environ.get("PHOTOAGENT_DEBUG"):
+        print(f"[PhotoAgent] {title}: {json.dumps(stats, sort_keys=True)}")
+
+def new_traversal_counters():
+    """Dizin tarama motorunun sayaçlarını içeren boş bir sözlük döndürür."""
+    return {"dirs": 0, "entries": 0, "stat_calls": 0, "errors": 0}
+
+def make_scan_filter(options):
+    """WorkerThread seçeneklerinden tarama motorunun kullandığı filtre sözlüğünü üretir."""
+    return {
+        "extensions": {ext.lower() for ext in EXTENSION_FILTERS.get("image", [])},
+        "ignore_hidden": options["ignore"]["ignore_system_hidden"],
+        "ignore_zero_byte": options["ignore"]["ignore_zero_byte"],
+    }
+
+def _iter_directory(dir_path, scan_filter, subdirs, counters):
+    """Tek bir dizini os.scandir ile akış halinde okur.
+
+    İsim ve uzantı filtreleri stat çağrısından ÖNCE uygulanır. DirEntry.is_dir/is_file
+    çoğu dosya sisteminde d_type bilgisini kullandığından, normal olmayan girdiler
+    stat yapılmadan elenir. Alt dizinler 'subdirs' listesine eklenir, eşleşen
+    dosyalar (tam_yol, stat_sonucu) olarak tek tek döndürülür.
+    """
+    allowed_extensions = scan_filter["extensions"]
+    ignore_hidden = scan_filter["ignore_hidden"]
+    ignore_zero_byte = scan_filter["ignore_zero_byte"]
+    check_windows_hidden = ignore_hidden and platform.system() == "Windows"
+
+    try:
+        iterator = os.scandir(dir_path)
+    except OSError:
+        counters["errors"] += 1
+        return
+
+    # Dizin listesi belleğe alınmaz; milyonlarca girdili dizinler de akış halinde okunur.
+    with iterator:
+        for entry in iterator:
+            counters["entries"] += 1
+            name = entry.name
+
+            # Gizli dosya ve dizinleri atlama (stat gerekmez)
+            if ignore_hidden and name.startswith('.'):
+                continue
+
+            try:
+                # os.walk gibi sembolik bağlantılı dizinleri takip etme
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+
+                # UZANTI FİLTRELEME: stat'tan önce, sadece isim üzerinden
+                if os.path.splitext(name)[1].lower() not in allowed_extensions:
+                    continue
+
+                if not entry.is_file():
+                    continue
+
+                # DirEntry.stat sonucu önbelleğe alır; aynı girdi için tekrar sistem çağrısı yapılmaz.
+                counters["stat_calls"] += 1
+                file_stats = entry.stat()
+            except OSError:
+                counters["errors"] += 1
+                continue
+
+            if ignore_zero_byte and file_stats.st_size == 0:
+                continue
+
+            if check_windows_hidden and file_stats.st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN:
+                continue
+
+            yield entry.path, file_stats
+
+def iter_image_files(base_dir, scan_filter, counters=None, is_running=None):
+    """base_dir altındaki filtreye uyan dosyaları (tam_yol, stat_sonucu) olarak akış halinde döndürür."""
+    if counters is None:
+        counters = new_traversal_counters()
+
+    pending_dirs = [base_dir]
+    while pending_dirs:
+        if is_running is not None and not is_running():
+            return
+
+        dir_path = pending_dirs.pop()
+        counters["dirs"] += 1
+        subdirs = []
+        yield from _iter_directory(dir_path, scan_filter, subdirs, counters)
+        # os.walk ile aynı (yukarıdan aşağı) sırayı korumak için ters sırada yığına ekle
+        pending_dirs.extend(reversed(subdirs))
+
+def _scan_directory_task(dir_path, scan_filter, is_running=None):
+    """Paralel tarama için tek bir dizini okur; (dosyalar, alt_dizinler, sayaçlar) döndürür."""
+    counters = new_traversal_counters()
+    counters["dirs"] = 1
+    subdirs = []
+    files = []
+    for item in _iter_directory(dir_path, scan_filter, subdirs, counters):
+        files.append(item)
+        # Çok büyük dizinlerde iptal isteğine hızlı yanıt ver
+        if not len(files) & 0x3FF and is_running is not None and not is_running():
+            break
+    return files, subdirs, counters
+
+def iter_image_files_parallel(base_dir, scan_filter, workers, counters=None, is_running=None):
+    """iter_image_files ile aynı sonuçları, dizinleri sınırlı bir iş parçacığı havuzuna dağıtarak üretir.
+
+    Her alt dizin havuzun ortak kuyruğuna ayrı bir iş olarak eklenir; boşta kalan iş
+    parçacığı sıradaki dizini alır. Böylece NFS/SMB gibi yüksek gecikmeli bağlamalarda
+    readdir/stat gidiş-dönüşleri birbirini beklemeden eşzamanlı yürütülür.
+    """
+    if counters is None:
+        counters = new_traversal_counters()
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="photoagent-scan")
+    pending = {executor.submit(_scan_directory_task, base_dir, scan_filter, is_running)}
+    try:
+        while pending:
+            if is_running is not None and not is_running():
+                return
+
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    files, subdirs, dir_counters = future.result()
+                except Exception:
+                    counters["errors"] += 1
+                    continue
+
+                for key, value in dir_counters.items():
+                    counters[key] += value
+                for subdir in subdirs:
+                    pending.add(executor.submit(_scan_directory_task, subdir, scan_filter, is_running))
+
+                yield from files
+    finally:
+        # İptal veya erken çıkışta kuyruktaki dizinleri bırak, çalışanları bekle
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+# Baş/son karşılaştırmasında dosyanın başından ve sonundan okunacak bayt miktarı
+PARTIAL_HASH_SAMPLE = 64 * 1024
+# Akış modunda bir pakette gönderilecek en fazla grup ve paketler arası en uzun süre (sn)
+STREAM_BATCH_GROUPS = 200
+STREAM_BATCH_INTERVAL = 0.5
+
+def new_stage_counters():
+    """Hash aşamalarından biri için boş sayaç sözlüğü döndürür."""
+    return {"files": 0, "eliminated": 0, "bytes_read": 0}
+
+def calculate_partial_hash(filepath, file_size, algorithm=DEFAULT_HASH_ALGORITHM, sample_size=PARTIAL_HASH_SAMPLE):
+    """Dosyanın yalnızca başından ve sonundan sample_size bayt okuyarak ucuz bir ön hash hesaplar.
+
+    Aynı boyuttaki farklı fotoğrafların çoğu ilk birkaç KB içinde ayrıştığından, tam
+    içerik hash'i sadece bu aşamada da çakışan dosyalar için gerekir. Dosya 2*sample_size
+    kadar veya daha küçükse tamamı okunur ve sonuç calculate_hash ile aynıdır.
+    Dönüş: (hash, tam_içerik_mi, okunan_bayt). Hata durumunda hash None olur.
+    """
+    if file_size <= 2 * sample_size:
+        file_hash = calculate_hash(filepath, algorithm)
+        return file_hash, True, file_size if file_hash else 0
+
+    hasher = new_hasher(algorithm)
+    try:
+        with open(filepath, 'rb', buffering=0) as file:
+            bytes_read = _update_from_file(hasher, file, sample_size, limit=sample_size)
+            file.seek(-sample_size, os.SEEK_END)
+            bytes_read += _update_from_file(hasher, file, sample_size, limit=sample_size)
+    except (IOError, OSError):
+        return None, False, 0
+
+    return hasher.hexdigest(), False, bytes_read
+
+def default_hash_workers():
+    """Eşzamanlı hash için varsayılan çalışan sayısı (işlemci çekirdeği sayısı, en fazla 32)."""
+    return max(1, min(32, os.cpu_count() or 1))
+
+class HashingEngine:
+    """Aday dosyaları bir iş parçacığı havuzunda (isteğe bağlı olarak süreç havuzunda) eşzamanlı hashler.
+
+    hashlib büyük update çağrılarında GIL'i bıraktığından iş parçacıkları hem çekirdekleri
+    hem de diskin kuyruk derinliğini kullanır. Tek çalışanla havuz açılmaz, işler sırayla yürütülür.
+    """
+
+    def __init__(self, workers=0, use_processes=False):
+        self.workers = workers or default_hash_workers()
+        self.use_processes = use_processes
+        self._executor = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            if self.use_processes:
+                # Qt iş parçacıkları çalışırken fork güvenli değildir; 'spawn' kullanılır.
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="photoagent-hash")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return False
+
+    def run_unordered(self, jobs, is_running=None):
+        """jobs içindeki (anahtar, fonksiyon, argümanlar) işlerini yürütür; sonuçları tamamlandıkça (anahtar, sonuç) olarak döndürür.
+
+        Aynı anda en fazla workers*4 iş kuyrukta bekler, böylece milyonlarca aday için
+        bellekte Future nesnesi birikmez. jobs her sonuç işlendikten sonra yeniden okunur;
+        bu sayede sonuçları tüketen taraf aynı yineleyiciye yeni işler ekleyebilir.
+        is_running False döndüğünde yeni iş gönderilmez.
+        """
+        if self._executor is None:
+            for key, func, args in jobs:
+                if is_running is not None and not is_running():
+                    return
+                yield key, func(*args)
+            return
+
+        jobs = iter(jobs)
+        window = self.workers * 4
+        pending = {}
+
+        def refill():
+            while len(pending) < window:
+                try:
+                    key, func, args = next(jobs)
+                except StopIteration:
+                    return
+                pending[self._executor.submit(func, *args)] = key
+
+        refill()
+        try:
+            while pending:
+                if is_running is not None and not is_running():
+                    return
+
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"HATA: Hash hesaplanamadı: {e}")
+                        result = None
+                    yield key, result
+                refill()
+        finally:
+            for future in pending:
+                future.cancel()
+
+class HashPipeline:
+    """Aday dosyaları boyut -> baş/son -> tam içerik (-> doğrulama) aşamalarından boru hattı şeklinde geçirir.
+
+    Bir boyut grubunun tüm baş/son özetleri tamamlandığında o grubun tam içerik işleri
+    hemen kuyruğa girer; bir alt grubun tüm tam özetleri tamamlandığında kesinleşen kopya
+    grupları on_group ile hemen bildirilir. Tam içerik ve doğrulama işleri baş/son
+    işlerinden önce çalıştırılır, böylece ilk sonuçlar ağacın tamamı bitmeden görünür.
+    Kalıcı hash dizininde geçerli özeti bulunan dosyalar hiç okunmaz.
+    Nesne, HashingEngine için iş yineleyicisi olarak da kullanılır.
+    """
+
+    def __init__(self, engine, algorithm, confirm_algorithm, counters, hash_index=None,
+                 file_identities=None, is_running=None, payload_sizes=None):
+        self.engine = engine
+        self.algorithm = algorithm
+        self.confirm_algorithm = confirm_algorithm
+        self.counters = counters
+        self.hash_index = hash_index
+        self.file_identities = file_identities or {}
+        self.is_running = is_running or (lambda: True)
+        # Meta verisi yok sayılan dosyalar: yol -> dosya boyutu. Bunlar calculate_payload_hash
+        # ile hashlenir ve grupları boyut yerine payload_bucket_key anahtarıyla oluşur.
+        self.payload_sizes = payload_sizes or {}
+
+        # Geri çağırmalar: kesinleşen grup, tamamlanan iş, baş/son aşamasının bitişi
+        self.on_group = lambda group: None
+        self.on_job_done = lambda stage, path: None
+        self.on_partials_done = lambda remaining_jobs: None
+
+        self.total_jobs = 0
+        self.done_jobs = 0
+        self._urgent_jobs = deque()   # tam içerik ve doğrulama işleri
+        self._partial_jobs = deque()  # baş/son işleri
+        self._ready = deque()         # dizinden okunan, hazır sonuçlar
+        self._partials_remaining = 0
+
+        self._partial_pending = {}    # boyut -> bekleyen baş/son işi
+        self._partial_buckets = {}    # boyut -> {baş/son özeti: [yollar]}
+        self._small_buckets = {}      # boyut -> {tam özet: [yollar]} (tamamı okunan küçük dosyalar)
+        self._full_pending = {}       # (boyut, baş/son özeti) -> bekleyen tam içerik işi
+        self._full_buckets = {}       # (boyut, baş/son özeti) -> {tam özet: [yollar]}
+        self._confirm_pending = {}    # grup no -> bekleyen doğrulama işi
+        self._confirm_buckets = {}    # grup no -> {güçlü özet: [yollar]}
+        self._unconfirmed_groups = {} # grup no -> grup
+        self._next_group_id = 0
+
+    # --- HashingEngine için iş yineleyicisi ---
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._urgent_jobs:
+            return self._urgent_jobs.popleft()
+        if self._partial_jobs:
+            return self._partial_jobs.popleft()
+        raise StopIteration
+
+    def run(self, candidate_groups, payload_groups=None):
+        """Tüm adayları işler. Tamamlanırsa True, iptal edilirse False döndürür.
+
+        payload_groups ({anahtar: [yollar]}) baş/son aşamasını atlayıp doğrudan görüntü
+        verisi hash'ine gider (baş/son örnekleri meta veriyi de içerdiğinden işe yaramaz).
+        """
+        for bucket_key, paths in (payload_groups or {}).items():
+            self._full_pending[(bucket_key, None)] = len(paths)
+            for path in paths:
+                self._enqueue("full", bucket_key, path, None)
+
+        for size, paths in candidate_groups.items():
+            self._partial_pending[size] = len(paths)
+            self._partials_remaining += len(paths)
+            for path in paths:
+                self._enqueue("partial", size, path, None)
+
+        for key, result, from_index in self._results():
+            if not self.is_running(): return False
+
+            stage, size, path, extra = key
+            self.done_jobs += 1
+            if not from_index:
+                self._store(stage, size, path, result)
+
+            if stage == "partial":
+                self._handle_partial(size, path, result)
+            elif stage == "full":
+                self._handle_full(size, path, extra, result, from_index)
+            else:
+                self._handle_confirm(size, path, extra, result, from_index)
+            self.on_job_done(stage, path)
+
+        return self.is_running()
+
+    def _results(self):
+        """Dizinden gelen hazır sonuçları ve havuzda hesaplananları tek akışta birleştirir."""
+        while True:
+            while self._ready:
+                yield self._ready.popleft()
+            if not self._urgent_jobs and not self._partial_jobs:
+                return
+            for item in self.engine.run_unordered(self, self.is_running):
+                yield item + (False,)
+                while self._ready:
+                    yield self._ready.popleft()
+            if not self.is_running():
+                return
+
+    # --- Kalıcı dizin ---
+    def _file_size(self, size, path):
+        # Görüntü verisi gruplarında 'size' bir kova anahtarıdır; gerçek boyut ayrıca tutulur
+        return self.payload_sizes.get(path, size)
+
+    def _index_kind(self, stage, size, path=None):
+        if path in self.payload_sizes:
+            # JPEG verisi artık EOI'de biter; eski (dosya sonuna kadarki) kayıtlar kullanılmaz
+            return "payload:eoi"
+        if stage == "partial" and size > 2 * PARTIAL_HASH_SAMPLE:
+            return f"partial:{PARTIAL_HASH_SAMPLE}"
+        # Küçük dosyalarda baş/son özeti tam içerik özetinin kendisidir
+        return "full"
+
+    def _algorithm_of(self, stage):
+        return self.confirm_algorithm if stage == "confirm" else self.algorithm
+
+    def _enqueue(self, stage, size, path, extra):
+        """İşi kuyruğa ekler; dizinde geçerli özet varsa dosyayı okumadan hazır sonuç üretir."""
+        self.total_jobs += 1
+        key = (stage, size, path, extra)
+        algorithm = self._algorithm_of(stage)
+
+        if self.hash_index is not None:
+            try:
+                digest = self.hash_index.lookup(path, self.file_identities.get(path), self._file_size(size, path),
+                                                self._index_kind(stage, size, path), algorithm)
+            except sqlite3.Error:
+                digest = None
+            if digest is not None:
+                result = (digest, size <= 2 * PARTIAL_HASH_SAMPLE, 0) if stage == "partial" else digest
+                self._ready.append((key, result, True))
+                return
+
+        if stage == "partial":
+            self._partial_jobs.append((key, calculate_partial_hash, (path, size, algorithm)))
+        elif path in self.payload_sizes:
+            self._urgent_jobs.append((key, calculate_payload_hash, (path, algorithm)))
+        else:
+            self._urgent_jobs.append((key, calculate_hash, (path, algorithm)))
+
+    def _store(self, stage, size, path, result):
+        if self.hash_index is None:
+            return
+        if stage == "partial":
+            digest, is_complete, _bytes_read = result or (None, False, 0)
+        else:
+            digest = result
+        try:
+            self.hash_index.store(path, self.file_identities.get(path), self._file_size(size, path),
+                                  self._index_kind(stage, size, path), self._algorithm_of(stage), digest)
+        except sqlite3.Error as e:
+            print(f"HATA: Hash dizinine yazılamadı: {e}")
+
+    # --- Aşama işleyicileri ---
+    def _handle_partial(self, size, path, result):
+        partial_counters = self.counters["partial"]
+        partial_hash, is_complete, bytes_read = result or (None, False, 0)
+        partial_counters["files"] += 1
+        partial_counters["bytes_read"] += bytes_read
+
+        if partial_hash:
+            # Küçük dosya tamamen okunduysa bu değer zaten tam içerik hash'idir.
+            buckets = self._small_buckets if is_complete else self._partial_buckets
+            buckets.setdefault(size, {}).setdefault(partial_hash, []).append(path)
+
+        self._partial_pending[size] -= 1
+        if self._partial_pending[size] == 0:
+            del self._partial_pending[size]
+            self._settle_size(size)
+
+        self._partials_remaining -= 1
+        if self._partials_remaining == 0:
+            self.on_partials_done(len(self._urgent_jobs))
+
+    def _settle_size(self, size):
+        """Bir boyut grubunun baş/son aşaması bitti: çakışanları tam içerik aşamasına gönder."""
+        partial_counters = self.counters["partial"]
+
+        for file_hash, paths in self._small_buckets.pop(size, {}).items():
+            if len(paths) > 1:
+                self._finalize_group(file_hash, size, paths)
+            else:
+                partial_counters["eliminated"] += 1
+
+        for partial_hash, paths in self._partial_buckets.pop(size, {}).items():
+            if len(paths) > 1:
+                self._full_pending[(size, partial_hash)] = len(paths)
+                for path in paths:
+                    self._enqueue("full", size, path, partial_hash)
+            else:
+                partial_counters["eliminated"] += 1
+
+    def _handle_full(self, size, path, partial_hash, file_hash, from_index):
+        full_counters = self.counters["full"]
+        full_counters["files"] += 1
+        bucket_key = (size, partial_hash)
+
+        if file_hash:
+            if not from_index:
+                full_counters["bytes_read"] += self._file_size(size, path)
+            self._full_buckets.setdefault(bucket_key, {}).setdefault(file_hash, []).append(path)
+
+        self._full_pending[bucket_key] -= 1
+        if self._full_pending[bucket_key] == 0:
+            del self._full_pending[bucket_key]
+            for file_hash, paths in self._full_buckets.pop(bucket_key, {}).items():
+                if len(paths) > 1:
+                    self._finalize_group(file_hash, size, paths)
+                else:
+                    full_counters["eliminated"] += 1
+
+    def _finalize_group(self, file_hash, size, paths):
+        if paths[0] in self.payload_sizes:
+            # Meta verisi farklı kopyaların dosya boyutları da farklıdır
+            file_sizes = {path: self.payload_sizes[path] for path in paths}
+            size = max(file_sizes.values())
+        else:
+            file_sizes = None
+        group = {
+            "hash": file_hash,
+            "hash_algorithm": self.algorithm,
+            "size_bytes": size,
+            "size": format_size(size),
+            "files": paths
+        }
+        if file_sizes is not None:
+            group["file_sizes"] = file_sizes
+            group["ignores_metadata"] = True
+        if not self.confirm_algorithm or self.confirm_algorithm == self.algorithm:
+            self.on_group(group)
+            return
+
+        # İsteğe bağlı doğrulama: grup, güçlü özetler de eşleşene kadar bekletilir
+        group_id = self._next_group_id
+        self._next_group_id += 1
+        self._unconfirmed_groups[group_id] = group
+        self._confirm_pending[group_id] = len(paths)
+        for path in paths:
+            self._enqueue("confirm", size, path, group_id)
+
+    def _handle_confirm(self, size, path, group_id, confirm_hash, from_index):
+        confirm_counters = self.counters["confirm"]
+        confirm_counters["files"] += 1
+
+        if confirm_hash:
+            if not from_index:
+                confirm_counters["bytes_read"] += self._file_size(size, path)
+            self._confirm_buckets.setdefault(group_id, {}).setdefault(confirm_hash, []).append(path)
+
+        self._confirm_pending[group_id] -= 1
+        if self._confirm_pending[group_id] == 0:
+            del self._confirm_pending[group_id]
+            group = self._unconfirmed_groups.pop(group_id)
+            # Güçlü hash'i farklı çıkan dosyalar gruptan ayrılır, tek kalanlar atılır.
+            for confirm_hash, paths in self._confirm_buckets.pop(group_id, {}).items():
+                if len(paths) > 1:
+                    confirmed = dict(group)
+                    confirmed["files"] = paths
+                    confirmed["confirm_hash"] = confirm_hash
+                    confirmed["confirm_algorithm"] = self.confirm_algorithm
+                    self.on_group(confirmed)
+                else:
+                    confirm_counters["eliminated"] += 1
+
+HASH_INDEX_PATH = os.path.join(os.path.expanduser('~/.photoagent'), 'hashindex.sqlite3')
+
+class HashIndex:
+    """Dosya özetlerini taramalar arasında saklayan kalıcı SQLite dizini.
+
+    Kayıtlar (yol, tür, algoritma) ile aranır ve yalnızca (aygıt, inode, boyut, mtime_ns)
+    kimliği değişmemişse kullanılır; aksi halde kayıt geçersiz sayılır ve dosya yeniden okunur.
+    Bağlantı, onu oluşturan iş parçacığında (tarama QThread'i) kullanılmalıdır.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS digests (
+            path TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            algorithm TEXT NOT NULL,
+            device INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            digest TEXT NOT NULL,
+            PRIMARY KEY (path, kind, algorithm)
+        ) WITHOUT ROWID
+    """
+    # Yazmalar bu sayıda kayıt biriktiğinde tek bir işlemde (transaction) diske aktarılır
+    WRITE_BATCH = 500
+
+    def __init__(self, db_path=HASH_INDEX_PATH):
+        self.db_path = db_path
+        self.counters = {"hits": 0, "misses": 0, "stale": 0, "stored": 0, "pruned": 0}
+        self._pending_writes = []
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=10)
+        # WAL: başka bir PhotoAgent örneği okurken yazma yapılabilir
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(self.SCHEMA)
+
+    def lookup(self, path, identity, size, kind, algorithm):
+        """Dosya değişmediyse kayıtlı özeti, aksi halde None döndürür. identity = (aygıt, inode, mtime_ns)."""
+        if identity is None:
+            self.counters["misses"] += 1
+            return None
+
+        row = self._conn.execute(
+            "SELECT device, inode, size, mtime_ns, digest FROM digests WHERE path = ? AND kind = ? AND algorithm = ?",
+            (path, kind, algorithm)).fetchone()
+        if row is None:
+            self.counters["misses"] += 1
+            return None
+        if tuple(row[:4]) != (identity[0], identity[1], size, identity[2]):
+            self.counters["stale"] += 1
+            return None
+
+        self.counters["hits"] += 1
+        return row[4]
+
+    def store(self, path, identity, size, kind, algorithm, digest):
+        """Yeni hesaplanan özeti yazma kuyruğuna ekler (eski kaydın yerine geçer)."""
+        if identity is None or not digest:
+            return
+        self._pending_writes.append((path, kind, algorithm, identity[0], identity[1], size, identity[2], digest))
+        if len(self._pending_writes) >= self.WRITE_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Bekleyen yazmaları tek bir işlemde uygular."""
+        if not self._pending_writes:
+            return
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._pending_writes)
+        self.counters["stored"] += len(self._pending_writes)
+        self._pending_writes = []
+
+    def prune(self, base_dir, seen_paths):
+        """base_dir altında olup bu taramada görülmeyen (silinmiş/taşınmış) dosyaların kayıtlarını siler."""
+        prefix = os.path.join(os.path.abspath(base_dir), '')
+        # Önek aralığı sorgusu birincil anahtar indeksini kullanır
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = self._conn.execute("SELECT DISTINCT path FROM digests WHERE path >= ? AND path < ?", (prefix, upper))
+        vanished = [(path,) for (path,) in rows if path not in seen_paths]
+        if vanished:
+            with self._conn:
+                self._conn.executemany("DELETE FROM digests WHERE path = ?", vanished)
+            self.counters["pruned"] += len(vanished)
+        return len(vanished)
+
+    def compact(self):
+        """Boş sayfalar veritabanının dörtte birini aşarsa dosyayı sıkıştırır ve WAL'ı boşaltır."""
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if page_count and freelist_count * 4 > page_count:
+            self._conn.execute("VACUUM")
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        try:
+            self.flush()
+            self._conn.execute("PRAGMA optimize")
+        finally:
+            self._conn.close()
+
+def format_stats(stats):
+    """Tarama sayaçlarını durum çubuğu ipucunda gösterilecek okunabilir metne çevirir."""
+    lines = []
+    for stage, counters in stats.items():
+        if not isinstance(counters, dict):
+            lines.append(f"{stage}: {counters}")
+            continue
+        parts = []
+        for key, value in counters.items():
+            if isinstance(value, dict):
+                value = ", ".join(f"{k}={format_size(v) if 'bytes' in k else v}" for k, v in value.items())
+                parts.append(f"{key} [{value}]")
+            elif "bytes" in key:
+                parts.append(f"{key}={format_size(value)}")
+            else:
+                parts.append(f"{key}={value}")
+        lines.append(f"{stage}: " + "; ".join(parts))
+    return "\n".join(lines)
+
 def format_size(size):
     """Bayt cinsinden boyutu okunabilir formata çevirir."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -348,257 +1528,2868 @@ class WorkerThread(QThread):
     progress_updated = Signal(int)
     status_message = Signal(str)
     scan_finished = Signal(list)
+    stats_updated = Signal(dict)
+    # Akış modu: kesinleşen kopya grupları tarama sürerken paketler halinde gönderilir
+    groups_found = Signal(list)
 
     def __init__(self, target_dirs, options, parent=None):
         super().__init__(parent)
         self.target_dirs = target_dirs
         self.options = options
         self._is_running = True
+        # Tarama motorunun sayaçları (aşama adı -> sayaç sözlüğü)
+        self.stats = {}
+
+    def is_running(self):
+        return self._is_running
 
     def run(self):
-        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI BAŞLANGICI (Sadece Görsel) ---
-        allowed_extensions = {ext.lower() for ext in EXTENSION_FILTERS.get("image", [])}
-        is_filtering_active = True
-        
-        # Hidden/System Dosya Kontrolü
-        ignore_hidden = self.options["ignore"]["ignore_system_hidden"]
-        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI SONU ---
+        # Kalıcı hash dizini tarama iş parçacığında açılır ve tarama bitince (iptal dahil) kapatılır.
+        self.hash_index = None
+        if self.options.get("performance", {}).get("use_hash_index", False):
+            try:
+                self.hash_index = HashIndex()
+            except (sqlite3.Error, OSError) as e:
+                print(f"HATA: Hash dizini açılamadı, dizinsiz devam ediliyor: {e}")
+
+        # Başlık bilgileri (_attach_file_info) tarama boyunca aynı iş parçacığı havuzunda okunur
+        self._info_engine = HashingEngine(self.options.get("performance", {}).get("hash_workers", 0))
+        try:
+            with self._info_engine:
+                self._scan()
+        finally:
+            if self.hash_index is not None:
+                try:
+                    # Silinen dosya kayıtları temizlendiyse veritabanını sıkıştır
+                    if self.hash_index.counters["pruned"]:
+                        self.hash_index.compact()
+                    self.hash_index.close()
+                except sqlite3.Error as e:
+                    print(f"HATA: Hash dizini kapatılamadı: {e}")
+
+    def _scan(self):
+        # --- FİLTRELEME İŞLEMİNİN HAZIRLANMASI (Sadece Görsel, Gizli/Sistem dosya kontrolü dahil) ---
+        scan_filter = make_scan_filter(self.options)
 
         self.status_message.emit(get_text("status_scanning"))
         all_files_by_size = {}
         total_files = 0
+        performance = self.options.get("performance", {})
+
+        for full_path, file_stats in self._collect_files(scan_filter):
+            file_size = file_stats.st_size
+            if file_size not in all_files_by_size:
+                all_files_by_size[file_size] = []
+            all_files_by_size[file_size].append(full_path)
+            total_files += 1
+
+        if not self._is_running: return
+
+        self._prune_index()
+        self.hardlinks = {}
+
+        # --- AŞAMA 0 (İSTEĞE BAĞLI): META VERİDEN BAĞIMSIZ ÖN GRUPLAMA ---
+        # JPEG/PNG dosyaları boyut yerine görüntü verisi anahtarıyla gruplanır; EXIF/XMP
+        # farkı olan kopyaların boyutları farklı olduğundan boyut aşamasına girmezler.
+        payload_groups, payload_sizes = {}, {}
+        payload_counters = None
+        if self.options["match"].get("ignore_metadata", False):
+            payload_counters = new_stage_counters()
+            payload_groups, payload_sizes = self._bucket_by_payload(all_files_by_size, payload_counters)
+            if payload_groups is None: return
+
+        # --- AŞAMA 1: BOYUT ---
+        # Aynı fiziksel dosyaya (aygıt, inode) işaret eden sabit bağlantılar tek aday olarak
+        # hashlenir. Bir boyutta birden fazla FARKLI dosya kalmazsa o boyut aday değildir.
+        candidate_groups = {}
+        naive_bytes = sum(payload_sizes.values())
+        for size, paths in all_files_by_size.items():
+            if len(paths) < 2:
+                continue
+            naive_bytes += size * len(paths)
+            representatives = self._collapse_hardlinks(paths)
+            if len(representatives) > 1:
+                candidate_groups[size] = representatives
+
+        total_candidates = len(payload_sizes) + sum(len(paths) for paths in candidate_groups.values())
+        # Tekil boyuttaki dosyaların kimlik bilgisine artık gerek yok
+        self.file_identities = {path: self.file_identities[path]
+                                for groups in (candidate_groups, payload_groups)
+                                for paths in groups.values() for path in paths}
+
+        self.stats["hardlinks"] = {
+            "shared_inodes": len(self.hardlinks),
+            "linked_paths": sum(len(aliases) for aliases in self.hardlinks.values()),
+        }
+        hashing_counters = {
+            "size": {"files": total_files, "eliminated": total_files - total_candidates, "bytes_read": 0},
+            "partial": new_stage_counters(),
+            "full": new_stage_counters(),
+            # Her yol (sabit bağlantılar dahil) tamamen okunsaydı okunacak bayt miktarı
+            "naive_bytes": naive_bytes,
+        }
+        if payload_counters is not None:
+            hashing_counters["payload_keys"] = payload_counters
+        self.stats["hashing"] = hashing_counters
+
+        if total_candidates == 0 and not self.hardlinks:
+            # {0} dosya bulundu
+            self.status_message.emit(get_text("status_finished_none").format(total_files))
+            self._emit_stats()
+            self.scan_finished.emit([])
+            return
+
+        # --- AŞAMA 2-4: BAŞ/SON, TAM İÇERİK VE (İSTEĞE BAĞLI) DOĞRULAMA ---
+        # {0} aday için dosya başı ve sonu karşılaştırılıyor...
+        self.status_message.emit(get_text("status_partial_hashing").format(total_candidates))
+
+        algorithm = resolve_hash_algorithm(performance.get("hash_algorithm"))
+        confirm_algorithm = resolve_hash_algorithm(performance.get("confirm_algorithm"), default="")
+        if confirm_algorithm and confirm_algorithm != algorithm:
+            hashing_counters["confirm"] = new_stage_counters()
+
+        self._final_duplicates = []
+        self._stream_results = performance.get("stream_results", True)
+        self._stream_buffer = []
+        self._last_stream_emit = time.monotonic()
+        self._last_progress = 0
+
+        with HashingEngine(performance.get("hash_workers", 0), performance.get("hash_use_processes", False)) as engine:
+            pipeline = HashPipeline(engine, algorithm, confirm_algorithm, hashing_counters,
+                                    self.hash_index, self.file_identities, self.is_running, payload_sizes)
+            pipeline.on_group = self._publish_group
+            pipeline.on_job_done = lambda stage, path: self._report_job(pipeline, stage, path)
+            pipeline.on_partials_done = self._report_partials_done
+
+            if not pipeline.run(candidate_groups, payload_groups): return
+
+        self._publish_hardlink_groups()
+        final_duplicates = self._final_duplicates
+        self._flush_stream()
+
+        # Tarama bitti. {0} kopya grubu bulundu.
+        self.status_message.emit(get_text("status_finished").format(len(final_duplicates)))
+
+        self.progress_updated.emit(100)
+        self._emit_stats()
+        self.scan_finished.emit(final_duplicates)
+
+    def _collect_files(self, scan_filter):
+        """Hedef dizinlerdeki görsel dosyaları (yol, stat) olarak döndürür.
+
+        Her dosyanın (aygıt, inode, mtime_ns) kimliği self.file_identities'e kaydedilir;
+        hash dizini bu kimlikle dosyanın değişip değişmediğini anlar. İptal edilince durur.
+        """
+        # Yol -> (aygıt, inode, mtime_ns)
+        self.file_identities = {}
+        traversal_counters = new_traversal_counters()
+        self.stats["traversal"] = traversal_counters
+        performance = self.options.get("performance", {})
+
+        for base_dir in self.target_dirs:
+            if not self._is_running: return
+
+            # 0 = otomatik: bağlama türüne göre paralel veya tek iş parçacıklı tarama
+            workers = performance.get("traversal_workers", 0) or default_traversal_workers(base_dir)
+            if workers > 1:
+                file_iterator = iter_image_files_parallel(base_dir, scan_filter, workers, traversal_counters, self.is_running)
+            else:
+                file_iterator = iter_image_files(base_dir, scan_filter, traversal_counters, self.is_running)
+
+            for full_path, file_stats in file_iterator:
+                if not self._is_running: return
+                self.file_identities[full_path] = (file_stats.st_dev, file_stats.st_ino, file_stats.st_mtime_ns)
+                yield full_path, file_stats
+
+    def _bucket_by_payload(self, all_files_by_size, counters):
+        """JPEG/PNG dosyalarını payload_bucket_key anahtarına göre gruplar.
+
+        Anahtarı okunabilen dosyalar all_files_by_size'dan çıkarılır (yerinde). Birden fazla
+        farklı fiziksel dosya içeren gruplar ({anahtar: [yollar]}) ve bu dosyaların
+        boyutları ({yol: boyut}) döndürülür. İptal edilirse (None, None).
+        """
+        file_sizes = {path: size for size, paths in all_files_by_size.items() for path in paths
+                      if os.path.splitext(path)[1].lower() in PAYLOAD_HASH_EXTENSIONS}
+        buckets = {}
+        performance = self.options.get("performance", {})
+        # Yalnızca başlıklar okunur; iş parçacıkları disk kuyruğunu doldurmaya yeter
+        with HashingEngine(performance.get("hash_workers", 0)) as engine:
+            jobs = ((path, payload_bucket_key, (path,)) for path in file_sizes)
+            for path, bucket_key in engine.run_unordered(jobs, self.is_running):
+                counters["files"] += 1
+                if bucket_key is not None:
+                    buckets.setdefault(bucket_key, []).append(path)
+        if not self._is_running:
+            return None, None
+
+        keyed_paths = {path for paths in buckets.values() for path in paths}
+        for size in list(all_files_by_size):
+            remaining = [path for path in all_files_by_size[size] if path not in keyed_paths]
+            if remaining:
+                all_files_by_size[size] = remaining
+            else:
+                del all_files_by_size[size]
+
+        payload_groups, payload_sizes = {}, {}
+        for bucket_key, paths in buckets.items():
+            representatives = self._collapse_hardlinks(paths) if len(paths) > 1 else paths
+            if len(representatives) > 1:
+                payload_groups[bucket_key] = representatives
+                payload_sizes.update((path, file_sizes[path]) for path in representatives)
+            else:
+                counters["eliminated"] += 1
+        return payload_groups, payload_sizes
+
+    def _prune_index(self):
+        if self.hash_index is None:
+            return
+        self.stats["index"] = self.hash_index.counters
+        # Tarama tamamlandı: bu dizinlerde artık bulunmayan dosyaların kayıtlarını temizle
+        try:
+            for base_dir in self.target_dirs:
+                self.hash_index.prune(base_dir, self.file_identities)
+        except sqlite3.Error as e:
+            print(f"HATA: Hash dizini temizlenemedi: {e}")
+
+    def _report_job(self, pipeline, stage, file_path):
+        """Tamamlanan her işte ilerleme çubuğunu ve durum mesajını günceller."""
+        # Toplam iş sayısı aşamalar ilerledikçe arttığından çubuk geri gitmesin
+        progress = max(self._last_progress, int(pipeline.done_jobs / pipeline.total_jobs * 100))
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_updated.emit(progress)
+        if stage != "partial":
+            # Hashleniyor: {0}
+            self.status_message.emit(get_text("status_hashing_file").format(os.path.basename(file_path)))
+
+    def _report_partials_done(self, remaining_jobs):
+        if remaining_jobs:
+            # {0} aday için hash hesaplanıyor...
+            self.status_message.emit(get_text("status_hashing").format(remaining_jobs))
+
+    def _publish_group(self, group):
+        """Kesinleşen bir kopya grubunu sonuçlara ekler ve akış modunda arayüze gönderir."""
+        self._attach_link_info(group)
+        self._final_duplicates.append(group)
+        # Başlık bilgileri paket halinde okunur; akış kapalıysa paket tarama sonunda işlenir
+        self._stream_buffer.append(group)
+        if not self._stream_results:
+            return
+
+        # Sinyal seline yol açmamak için gruplar paketler halinde gönderilir
+        if (len(self._stream_buffer) >= STREAM_BATCH_GROUPS
+                or time.monotonic() - self._last_stream_emit >= STREAM_BATCH_INTERVAL):
+            self._flush_stream()
+
+    def _flush_stream(self):
+        if self._stream_buffer:
+            self._attach_file_info(self._stream_buffer)
+            if self._stream_results:
+                self.groups_found.emit(self._stream_buffer)
+            self._stream_buffer = []
+        self._last_stream_emit = time.monotonic()
+
+    def _attach_file_info(self, groups):
+        """Gruplardaki dosyaların başlık bilgilerini (read_image_info) group["file_info"][yol] olarak ekler.
+
+        Başlıklar tarama boyunca açık kalan başlık okuma havuzunda (self._info_engine)
+        okunur; piksel verisi çözülmez. Taramada zaten bilinen değişiklik zamanı da
+        mtime_ns olarak eklenir. Sonuç listesi kopyaları bu bilgilerle gösterir, sıralar
+        ve otomatik işaretler.
+        """
+        paths = [path for group in groups for path in group["files"]]
+        file_info = {}
+        jobs = ((path, read_image_info, (path,)) for path in paths)
+        for path, info in self._info_engine.run_unordered(jobs, self.is_running):
+            if info is not None:
+                file_info[path] = info
+        for group in groups:
+            group["file_info"] = {}
+            for path in group["files"]:
+                info = file_info.get(path, {})
+                identity = self.file_identities.get(path)
+                if identity is not None:
+                    info["mtime_ns"] = identity[2]
+                if info:
+                    group["file_info"][path] = info
+
+    def _collapse_hardlinks(self, paths):
+        """Aynı (aygıt, inode) çiftine sahip yolları tek temsilciye indirger.
+
+        Temsilci dışındaki yollar self.hardlinks[temsilci] listesine eklenir. inode bilgisi
+        olmayan sistemlerde (st_ino == 0) her yol ayrı dosya sayılır.
+        """
+        representatives = {}
+        for path in paths:
+            device, inode, _mtime_ns = self.file_identities[path]
+            key = (device, inode) if inode else path
+            if key in representatives:
+                self.hardlinks.setdefault(representatives[key], []).append(path)
+            else:
+                representatives[key] = path
+        return list(representatives.values())
+
+    def _publish_hardlink_groups(self):
+        """Başka fiziksel kopyası bulunmayan sabit bağlantı kümelerini de sonuçlara ekler.
+
+        Her küme tek dosyalı bir gruptur (diğer yollar group["hardlinks"] altında);
+        silinecek ayrı bir kopya olmadığından reclaimable_bytes 0'dır. Bu dosyalar
+        hashlenmez; "hash" alanı (aygıt:inode) kimliğidir. Tarama sonunda çağrılır.
+        """
+        grouped_paths = {path for group in self._final_duplicates for path in group["files"]}
+        for path in sorted(self.hardlinks):
+            if path in grouped_paths:
+                continue
+            try:
+                file_stats = os.stat(path)
+            except OSError:
+                continue
+            self._publish_group({
+                "hash": f"{file_stats.st_dev}:{file_stats.st_ino}",
+                "hash_algorithm": "inode",
+                "size_bytes": file_stats.st_size,
+                "size": format_size(file_stats.st_size),
+                "files": [path],
+                "hardlinks_only": True,
+            })
+
+    def _attach_link_info(self, group):
+        """Gruba sabit bağlantı ilişkisini ve gerçekten geri kazanılabilecek alanı ekler.
+
+        group["files"] yalnızca farklı fiziksel dosyaları içerir; aynı dosyaya bağlı diğer
+        yollar group["hardlinks"][yol] altında "zaten paylaşılan" olarak listelenir. Bir kopya
+        dışındaki tüm fiziksel dosyalar silindiğinde boşalacak alan reclaimable_bytes'tır.
+        """
+        group["hardlinks"] = {path: self.hardlinks[path] for path in group["files"] if path in self.hardlinks}
+        if "file_sizes" in group:
+            # Boyutları farklı kopyalar (meta veri yok sayıldığında, benzer görsellerde): en büyüğü kalır.
+            # Piksel eşitliğinde kalite aynı olduğundan en küçük kodlama kalır.
+            sizes = [group["file_sizes"][path] for path in group["files"]]
+            kept_size = min(sizes) if group.get("pixel_identity") else max(sizes)
+            group["reclaimable_bytes"] = sum(sizes) - kept_size
+        else:
+            group["reclaimable_bytes"] = group["size_bytes"] * (len(group["files"]) - 1)
+
+    def _emit_stats(self):
+        """Aşama sayaçlarını arayüze gönderir ve hata ayıklama modunda konsola yazar."""
+        _debug_dump("scan", self.stats)
+        self.stats_updated.emit(self.stats)
+
+    def stop(self):
+        self._is_running = False
+
+# ----------------------------------------------------------------------
+# 1.1 BENZER GÖRSEL (ALGISAL HASH) MOTORU
+# ----------------------------------------------------------------------
+
+PERCEPTUAL_HASH_ALGORITHMS = ("ahash", "dhash", "phash")
+DEFAULT_PERCEPTUAL_HASH = "phash"
+# 8x8 = 64 bitlik parmak izleri
+PERCEPTUAL_HASH_SIZE = 8
+# pHash için DCT uygulanan gri tonlama matrisinin kenarı
+PERCEPTUAL_DCT_SIZE = 32
+# Görseller bu boyuta küçültülerek çözülür. EXIF IFD1 küçük resimleri (160 px, çoğu kez
+# siyah şeritli) bu sınırın altında kaldığından kullanılmaz; kırpılmış önizleme izleri bozmasın.
+PERCEPTUAL_DECODE_SIZE = 256
+# Çözülen görseller bu büyüklükte paketler halinde NumPy ile hashlenir
+PERCEPTUAL_BATCH = 256
+
+def load_perceptual_arrays(file_path):
+    """Görseli gri tonlamaya çevirip (32x32, 8x9) uint8 matrisleri olarak döndürür.
+
+    32x32 matris aHash (blok ortalaması) ve pHash (DCT), 8 satır x 9 sütunluk matris
+    dHash (yatay gradyan) içindir. İş parçacığı havuzunda çalışır; okunamazsa None.
+    """
+    image = load_scaled_image(file_path, PERCEPTUAL_DECODE_SIZE)
+    if image is None:
+        return None
+    return (_grayscale_matrix(image, PERCEPTUAL_DCT_SIZE, PERCEPTUAL_DCT_SIZE),
+            _grayscale_matrix(image, PERCEPTUAL_HASH_SIZE + 1, PERCEPTUAL_HASH_SIZE))
+
+def _grayscale_matrix(image, width, height):
+    # En-boy oranı gözetilmeden küçültülür: aynı fotoğrafın farklı boyutları aynı matrise iner.
+    # Yumuşak ölçekleme sonucu 32 bit döndürdüğünden gri tonlamaya ölçeklemeden sonra geçilir.
+    scaled = image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    scaled = scaled.convertToFormat(QImage.Format_Grayscale8)
+    bits = scaled.constBits()
+    bits.setsize(scaled.bytesPerLine() * height)
+    # Satır sonu hizalama baytları atılır
+    return np.frombuffer(bits, dtype=np.uint8).reshape(height, scaled.bytesPerLine())[:, :width].copy()
+
+_dct_matrix_cache = {}
+
+def _dct_matrix(size):
+    """Ortonormal DCT-II dönüşüm matrisi (C @ X @ C.T iki boyutlu DCT'yi verir)."""
+    matrix = _dct_matrix_cache.get(size)
+    if matrix is None:
+        k = np.arange(size)[:, None]
+        n = np.arange(size)[None, :]
+        matrix = np.sqrt(2.0 / size) * np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+        matrix[0, :] /= np.sqrt(2.0)
+        _dct_matrix_cache[size] = matrix
+    return matrix
+
+def _pack_fingerprints(bits):
+    """(N, 8, 8) bool dizisini N adet 64 bitlik işaretsiz tamsayıya paketler."""
+    packed = np.packbits(bits.reshape(len(bits), -1), axis=1)
+    return packed.view(">u8").reshape(-1).astype(np.uint64)
+
+def compute_perceptual_hashes(algorithm, dct_inputs, gradient_inputs):
+    """Bir paket görselin algısal hashlerini tek seferde hesaplar.
+
+    dct_inputs (N, 32, 32), gradient_inputs (N, 8, 9) uint8 dizileridir. Dönen değer
+    N uzunluğunda uint64 dizisidir. Tüm işlemler paket üzerinde vektöreldir.
+    """
+    size = PERCEPTUAL_HASH_SIZE
+    if algorithm == "dhash":
+        # Her piksel sağındakinden parlak mı?
+        bits = gradient_inputs[:, :, 1:] > gradient_inputs[:, :, :-1]
+        return _pack_fingerprints(bits)
+
+    pixels = dct_inputs.astype(np.float32)
+    if algorithm == "ahash":
+        block = PERCEPTUAL_DCT_SIZE // size
+        means = pixels.reshape(len(pixels), size, block, size, block).mean(axis=(2, 4))
+        bits = means > means.mean(axis=(1, 2), keepdims=True)
+        return _pack_fingerprints(bits)
+
+    # pHash: 2B DCT'nin sol üst 8x8 düşük frekans bloğu, medyanına göre bitlenir
+    dct = _dct_matrix(PERCEPTUAL_DCT_SIZE).astype(np.float32)
+    coefficients = (dct @ pixels @ dct.T)[:, :size, :size]
+    medians = np.median(coefficients.reshape(len(coefficients), -1), axis=1)
+    bits = coefficients > medians[:, None, None]
+    return _pack_fingerprints(bits)
+
+_POPCOUNT_TABLE = None
+
+def hamming_distances(fingerprints, value):
+    """uint64 parmak izi dizisinin her elemanının value'ya Hamming uzaklığını döndürür."""
+    global _POPCOUNT_TABLE
+    xor = np.bitwise_xor(fingerprints, np.uint64(value))
+    if hasattr(np, "bitwise_count"): # NumPy 2.0+
+        return np.bitwise_count(xor).astype(np.int32)
+    if _POPCOUNT_TABLE is None:
+        _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.int32)
+    return _POPCOUNT_TABLE[xor.view(np.uint8)].reshape(len(xor), 8).sum(axis=1)
+
+# Çoklu dizin hash (multi-index hashing): 64 bitlik iz dört adet 16 bitlik parçaya bölünür
+FINGERPRINT_CHUNKS = 4
+FINGERPRINT_CHUNK_BITS = 16
+# Parça başına arama yarıçapı bunu aşarsa (eşik >= 16 bit) doğrusal tarama daha ucuzdur
+MAX_CHUNK_PROBE_RADIUS = 3
+# Yeni eklenenler sıralanmamış bir kuyrukta bekler; kuyruk bu sınırı (veya dizinin
+# sekizde birini) aşınca parça tabloları yeniden sıralanır
+FINGERPRINT_TAIL_LIMIT = 4096
+
+_chunk_probe_masks = {}
+
+def _probe_masks(radius):
+    """16 bitlik, en fazla 'radius' biti 1 olan tüm maskeler (parça komşuluğunu üretmek için)."""
+    masks = _chunk_probe_masks.get(radius)
+    if masks is None:
+        values = np.arange(1 << FINGERPRINT_CHUNK_BITS, dtype=np.uint64)
+        masks = values[hamming_distances(values, 0) <= radius].astype(np.uint16)
+        _chunk_probe_masks[radius] = masks
+    return masks
+
+class FingerprintIndex:
+    """64 bitlik parmak izlerinde "d bit uzaklıktaki herkes" sorgusunu doğrusal taramadan yanıtlar.
+
+    Güvercin yuvası ilkesi: iki iz en fazla d bit farklıysa dört parçadan en az biri
+    en fazla d // 4 bit farklıdır. Her parça için (anahtar, kimlik) çiftleri sıralı
+    NumPy dizilerinde tutulur; sorgu parçanın d // 4 komşuluğundaki anahtarları
+    searchsorted ile bulur ve adayların gerçek uzaklığını popcount ile doğrular.
+    Ekleme artımlıdır: yeni izler kuyrukta doğrusal taranır, kuyruk büyüyünce
+    tablolara katılır (toplam maliyet O(n log n)). Kimlikler ekleme sırasıdır.
+    """
+
+    def __init__(self, capacity=1024):
+        self._values = np.empty(capacity, dtype=np.uint64)
+        self._size = 0
+        # Parça tablolarına katılmış ilk _indexed iz; gerisi kuyrukta
+        self._indexed = 0
+        self._chunk_keys = [np.empty(0, dtype=np.uint16) for _ in range(FINGERPRINT_CHUNKS)]
+        self._chunk_ids = [np.empty(0, dtype=np.uint32) for _ in range(FINGERPRINT_CHUNKS)]
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def values(self):
+        return self._values[:self._size]
+
+    def add(self, value):
+        """Tek bir izi ekler ve kimliğini döndürür."""
+        return int(self.add_many(np.array([value], dtype=np.uint64))[0])
+
+    def add_many(self, values):
+        """İzleri toplu ekler ve kimliklerini döndürür."""
+        values = np.asarray(values, dtype=np.uint64)
+        end = self._size + len(values)
+        if end > len(self._values):
+            grown = np.empty(max(end, 2 * len(self._values)), dtype=np.uint64)
+            grown[:self._size] = self._values[:self._size]
+            self._values = grown
+        self._values[self._size:end] = values
+        ids = np.arange(self._size, end)
+        self._size = end
+
+        if self._size - self._indexed > max(FINGERPRINT_TAIL_LIMIT, self._indexed // 8):
+            self._rebuild()
+        return ids
+
+    def _rebuild(self):
+        values = self._values[:self._size]
+        for chunk in range(FINGERPRINT_CHUNKS):
+            keys = ((values >> np.uint64(chunk * FINGERPRINT_CHUNK_BITS)) & np.uint64(0xFFFF)).astype(np.uint16)
+            order = np.argsort(keys, kind="stable")
+            self._chunk_keys[chunk] = keys[order]
+            self._chunk_ids[chunk] = order.astype(np.uint32)
+        self._indexed = self._size
+
+    def query(self, value, max_distance):
+        """value'ya en fazla max_distance bit uzaktaki izlerin (kimlikler, uzaklıklar) dizilerini döndürür."""
+        value = np.uint64(value)
+        radius = max_distance // FINGERPRINT_CHUNKS
+        if radius > MAX_CHUNK_PROBE_RADIUS:
+            candidates = np.arange(self._size)
+        else:
+            candidates = [self._chunk_candidates(value, radius),
+                          np.arange(self._indexed, self._size)] # Kuyruk doğrusal taranır
+            candidates = np.concatenate(candidates)
+
+        distances = hamming_distances(self._values[candidates], value)
+        matched = distances <= max_distance
+        # Bir iz birden fazla parçada eşleşebilir; tekrarlar yalnızca eşleşenlerde ayıklanır
+        ids, first = np.unique(candidates[matched], return_index=True)
+        return ids, distances[matched][first]
+
+    def _chunk_candidates(self, value, radius):
+        # Dönen adaylar tekrar içerebilir
+        if not self._indexed:
+            return np.empty(0, dtype=np.int64)
+        masks = _probe_masks(radius)
+        found = []
+        for chunk in range(FINGERPRINT_CHUNKS):
+            chunk_value = int((value >> np.uint64(chunk * FINGERPRINT_CHUNK_BITS)) & np.uint64(0xFFFF))
+            probes = np.bitwise_xor(masks, np.uint16(chunk_value))
+            keys = self._chunk_keys[chunk]
+            starts = np.searchsorted(keys, probes, side="left")
+            lengths = np.searchsorted(keys, probes, side="right") - starts
+            total = int(lengths.sum())
+            if not total:
+                continue
+            # Her [başlangıç, başlangıç + uzunluk) aralığını tek bir konum dizisine aç
+            offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            found.append(self._chunk_ids[chunk][np.repeat(starts, lengths) + offsets])
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(found).astype(np.int64)
+
+def group_similar_fingerprints(fingerprints, threshold):
+    """Parmak izlerini Hamming eşiğine göre yıldız kümelere ayırır.
+
+    Sırayla her atanmamış parmak izi bir kümenin merkezi olur ve kendisine en fazla
+    'threshold' bit uzaktaki atanmamış parmak izlerini alır. Zincirleme (A~B, B~C ama
+    A≁C) gruplar oluşmaz. Komşular FingerprintIndex ile bulunur. Dönen liste
+    [(merkez, [(üye, uzaklık), ...]), ...] biçimindedir.
+    """
+    index = FingerprintIndex(max(len(fingerprints), 1))
+    index.add_many(fingerprints)
+    unassigned = np.ones(len(fingerprints), dtype=bool)
+    groups = []
+    for seed in range(len(fingerprints)):
+        if not unassigned[seed]:
+            continue
+        unassigned[seed] = False
+        neighbours, distances = index.query(fingerprints[seed], threshold)
+        free = unassigned[neighbours]
+        members, distances = neighbours[free], distances[free]
+        if len(members):
+            unassigned[members] = False
+            groups.append((seed, [(int(member), int(distance)) for member, distance in zip(members, distances)]))
+    return groups
+
+class SimilarityWorkerThread(WorkerThread):
+    """Yeniden boyutlandırılmış, yeniden sıkıştırılmış veya dışa aktarılmış kopyaları bulan tarama.
+
+    WorkerThread ile aynı dizin taramasını, sinyalleri ve akış modunu kullanır; bayt
+    eşitliği yerine algısal hashlerin Hamming uzaklığıyla gruplar. Parmak izleri hash
+    dizininde ("perceptual:8" türüyle) saklanır, değişmeyen dosyalar yeniden çözülmez.
+    """
+
+    def _scan(self):
+        scan_filter = make_scan_filter(self.options)
+        performance = self.options.get("performance", {})
+        algorithm = performance.get("similarity_hash", DEFAULT_PERCEPTUAL_HASH)
+        if algorithm not in PERCEPTUAL_HASH_ALGORITHMS:
+            print(f"HATA: Bilinmeyen algısal hash '{algorithm}', {DEFAULT_PERCEPTUAL_HASH} kullanılıyor.")
+            algorithm = DEFAULT_PERCEPTUAL_HASH
+        threshold = max(0, min(64, performance.get("similarity_threshold", 10)))
+
+        self.status_message.emit(get_text("status_scanning"))
+        self.file_sizes = {}
+        for full_path, file_stats in self._collect_files(scan_filter):
+            self.file_sizes[full_path] = file_stats.st_size
+        if not self._is_running: return
+
+        self._prune_index()
+        total_files = len(self.file_sizes)
+
+        # Sabit bağlantılar aynı içeriktir; her fiziksel dosya bir kez çözülür
+        self.hardlinks = {}
+        candidates = self._collapse_hardlinks(list(self.file_sizes))
+        counters = {"files": total_files, "candidates": len(candidates), "decoded": 0,
+                    "failed": 0, "index_hits": 0, "groups": 0}
+        self.stats["perceptual"] = counters
+        self.stats["hardlinks"] = {
+            "shared_inodes": len(self.hardlinks),
+            "linked_paths": sum(len(aliases) for aliases in self.hardlinks.values()),
+        }
+
+        # {0} görsel için parmak izi hesaplanıyor...
+        self.status_message.emit(get_text("status_fingerprinting").format(len(candidates)))
+        fingerprints = self._compute_fingerprints(candidates, algorithm, counters)
+        if fingerprints is None: return
+
+        # --- GRUPLAMA ---
+        self.status_message.emit(get_text("status_grouping_similar"))
+        # Büyük dosyalar önce gelir: kümenin merkezi (ve ilk satırı) en kaliteli kopya olur
+        paths = sorted(fingerprints, key=lambda path: (-self.file_sizes[path], path))
+        fingerprint_array = np.array([fingerprints[path] for path in paths], dtype=np.uint64)
+
+        self._final_duplicates = []
+        self._stream_results = performance.get("stream_results", True)
+        self._stream_buffer = []
+        self._last_stream_emit = time.monotonic()
+
+        for seed, members in group_similar_fingerprints(fingerprint_array, threshold):
+            if not self._is_running: return
+            self._publish_group(self._make_group(paths, fingerprint_array, seed, members, algorithm))
+        self._publish_hardlink_groups()
+        counters["groups"] = len(self._final_duplicates)
+        self._flush_stream()
+
+        # Tarama bitti. {0} kopya grubu bulundu.
+        self.status_message.emit(get_text("status_finished").format(len(self._final_duplicates)))
+        self.progress_updated.emit(100)
+        self._emit_stats()
+        self.scan_finished.emit(self._final_duplicates)
+
+    def _compute_fingerprints(self, candidates, algorithm, counters):
+        """Adayların parmak izlerini {yol: int} olarak döndürür; iptal edilirse None.
+
+        Dizinde bulunanlar okunmaz. Diğerleri iş parçacığı havuzunda çözülür ve
+        PERCEPTUAL_BATCH büyüklüğündeki paketler halinde NumPy ile hashlenir.
+        """
+        kind = f"perceptual:{PERCEPTUAL_HASH_SIZE}"
+        fingerprints = {}
+        to_decode = []
+        for path in candidates:
+            digest = None
+            if self.hash_index is not None:
+                digest = self.hash_index.lookup(path, self.file_identities.get(path), self.file_sizes[path], kind, algorithm)
+            if digest is not None:
+                fingerprints[path] = int(digest, 16)
+                counters["index_hits"] += 1
+            else:
+                to_decode.append(path)
+
+        total = len(candidates)
+        batch_paths, dct_inputs, gradient_inputs = [], [], []
+
+        def flush_batch():
+            hashes = compute_perceptual_hashes(algorithm, np.stack(dct_inputs), np.stack(gradient_inputs))
+            for path, value in zip(batch_paths, hashes.tolist()):
+                fingerprints[path] = value
+                if self.hash_index is not None:
+                    self.hash_index.store(path, self.file_identities.get(path), self.file_sizes[path],
+                                          kind, algorithm, f"{value:016x}")
+            del batch_paths[:], dct_inputs[:], gradient_inputs[:]
+
+        # Çözme Qt (C++) içinde GIL dışında yürür; varsayılan iş parçacıkları yeterlidir.
+        # hash_use_processes açıksa piksel eşitliği taraması gibi süreç havuzu kullanılır.
+        performance = self.options.get("performance", {})
+        jobs = ((path, load_perceptual_arrays, (path,)) for path in to_decode)
+        done = total - len(to_decode)
+        last_progress = -1
+        with HashingEngine(performance.get("hash_workers", 0), performance.get("hash_use_processes", False)) as engine:
+            for path, arrays in engine.run_unordered(jobs, self.is_running):
+                done += 1
+                if arrays is None:
+                    counters["failed"] += 1
+                else:
+                    counters["decoded"] += 1
+                    batch_paths.append(path)
+                    dct_inputs.append(arrays[0])
+                    gradient_inputs.append(arrays[1])
+                    if len(batch_paths) >= PERCEPTUAL_BATCH:
+                        flush_batch()
+
+                progress = int(done / total * 100)
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_updated.emit(progress)
+
+        if not self._is_running: return None
+        if batch_paths:
+            flush_batch()
+        return fingerprints
+
+    def _make_group(self, paths, fingerprint_array, seed, members, algorithm):
+        """Bir yıldız kümeyi sonuç listesinin kullandığı kopya grubu sözlüğüne çevirir.
+
+        Bayt eşitliğindeki gruplardan farkı: dosyaların boyutları file_sizes'ta ayrı
+        ayrı tutulur, distances her dosyanın merkeze uzaklığını (bit) ve similarity
+        gruptaki en uzak dosyanın benzerlik yüzdesini verir.
+        """
+        seed_path = paths[seed]
+        files = [seed_path] + [paths[member] for member, _distance in members]
+        distances = {seed_path: 0}
+        distances.update((paths[member], distance) for member, distance in members)
+        max_distance = max(distances.values())
+        fingerprint_bits = PERCEPTUAL_HASH_SIZE * PERCEPTUAL_HASH_SIZE
+        return {
+            "hash": f"{int(fingerprint_array[seed]):016x}",
+            "hash_algorithm": algorithm,
+            "size_bytes": self.file_sizes[seed_path],
+            "size": format_size(self.file_sizes[seed_path]),
+            "files": files,
+            "file_sizes": {path: self.file_sizes[path] for path in files},
+            "distances": distances,
+            "similarity": round(100.0 * (1 - max_distance / fingerprint_bits), 1),
+        }
+
+# ----------------------------------------------------------------------
+# 1.2 PİKSEL EŞİTLİĞİ (ÇÖZÜLMÜŞ GÖRÜNTÜ) MOTORU
+# ----------------------------------------------------------------------
+
+# Başlık okuma sonuçlarının hash dizinindeki türü ("GENİŞLİKxYÜKSEKLİK" olarak saklanır)
+DIMENSIONS_INDEX_KIND = "dimensions"
+# Piksel özetlerinin hash dizinindeki türü; kanonik biçim değişirse eski kayıtlar kullanılmaz
+PIXEL_INDEX_KIND = "pixels:rgba2"
+# Kanal başına 8 bitten fazla bilgi taşıyan biçimler; bunlar RGBA64'e çevrilir.
+# Derinliğe bakmak yetmez: 16 bit gri (Format_Grayscale16) yalnızca 16 bit derinliktedir.
+HIGH_PRECISION_IMAGE_FORMATS = frozenset(
+    getattr(QImage, name) for name in (
+        "Format_Grayscale16", "Format_RGBX64", "Format_RGBA64", "Format_RGBA64_Premultiplied",
+        "Format_BGR30", "Format_A2BGR30_Premultiplied", "Format_RGB30", "Format_A2RGB30_Premultiplied",
+    ) if hasattr(QImage, name) and hasattr(QImage, "Format_RGBA64")
+)
+
+def read_image_dimensions(file_path):
+    """Görselin (genişlik, yükseklik) değerini yalnızca başlığını okuyarak döndürür.
+
+    QImageReader.size() görüntü verisini çözmez; okunamayan veya Qt'nin tanımadığı
+    (ör. RAW) dosyalar için None döner. İş parçacığı havuzunda çalışır.
+    """
+    reader = QImageReader(file_path)
+    size = reader.size()
+    if not size.isValid() or size.isEmpty():
+        return None
+    return size.width(), size.height()
+
+def calculate_pixel_hash(file_path, algorithm=DEFAULT_HASH_ALGORITHM):
+    """Görseli tam çözüp kanonik piksel biçimindeki ham arabelleğin özetini döndürür.
+
+    8 bitlik görseller RGBA8888'e, 8 bitten hassas kanallı görseller (ör. 48 bit veya
+    16 bit gri PNG, 30 bit biçimler) hassasiyet kaybolmasın diye RGBA64'e çevrilir. Boyutlar ve biçim özete dahildir; satır sonu
+    hizalama baytları atlanır. Süreç havuzunda çalışır, çözülemezse None döndürür.
+    """
+    image = QImageReader(file_path).read()
+    if image.isNull():
+        return None
+    if image.format() in HIGH_PRECISION_IMAGE_FORMATS:
+        image = image.convertToFormat(QImage.Format_RGBA64)
+    else:
+        image = image.convertToFormat(QImage.Format_RGBA8888)
+
+    width, height = image.width(), image.height()
+    row_bytes = width * image.depth() // 8
+    stride = image.bytesPerLine()
+    bits = image.constBits()
+    bits.setsize(stride * height)
+    buffer = memoryview(bits)
+
+    hasher = new_hasher(algorithm)
+    hasher.update(f"{width}x{height}:{image.depth()}:".encode("ascii"))
+    if stride == row_bytes:
+        hasher.update(buffer)
+    else:
+        for offset in range(0, stride * height, stride):
+            hasher.update(buffer[offset:offset + row_bytes])
+    return hasher.hexdigest()
+
+class PixelIdentityWorkerThread(WorkerThread):
+    """Farklı biçim veya kodlayıcıyla kaydedilmiş, pikselleri birebir aynı görselleri bulan tarama.
+
+    BMP'den dışa aktarılmış bir PNG veya PNG'nin kayıpsız WebP'si bayt olarak farklıdır
+    ve boyutları tutmadığından boyut aşamasında elenir. Bu tarama dosyaları başlıktaki
+    görüntü boyutlarına göre kovalar; yalnızca aynı boyutta başka bir görseli olanlar
+    süreç havuzunda çözülüp hashlenir. Boyutlar ve piksel özetleri hash dizininde saklanır.
+    """
+
+    def _scan(self):
+        scan_filter = make_scan_filter(self.options)
+        performance = self.options.get("performance", {})
+        algorithm = resolve_hash_algorithm(performance.get("hash_algorithm"))
+
+        self.status_message.emit(get_text("status_scanning"))
+        self.file_sizes = {}
+        for full_path, file_stats in self._collect_files(scan_filter):
+            self.file_sizes[full_path] = file_stats.st_size
+        if not self._is_running: return
+
+        self._prune_index()
+        total_files = len(self.file_sizes)
+
+        # Sabit bağlantılar aynı içeriktir; her fiziksel dosya bir kez okunur
+        self.hardlinks = {}
+        candidates = self._collapse_hardlinks(list(self.file_sizes))
+        counters = {"files": total_files, "candidates": len(candidates), "unreadable": 0,
+                    "eliminated": 0, "decoded": 0, "failed": 0, "index_hits": 0, "groups": 0}
+        self.stats["pixels"] = counters
+        self.stats["hardlinks"] = {
+            "shared_inodes": len(self.hardlinks),
+            "linked_paths": sum(len(aliases) for aliases in self.hardlinks.values()),
+        }
+
+        # --- AŞAMA 1: BAŞLIKTAN GÖRÜNTÜ BOYUTLARI ---
+        # {0} görselin boyutları okunuyor...
+        self.status_message.emit(get_text("status_reading_dimensions").format(len(candidates)))
+        buckets = self._bucket_by_dimensions(candidates, counters)
+        if buckets is None: return
+
+        # Boyutu başka hiçbir görselle eşleşmeyen dosyalar çözülmez
+        to_decode = []
+        for paths in buckets.values():
+            if len(paths) > 1:
+                to_decode.extend(paths)
+            else:
+                counters["eliminated"] += 1
+
+        # --- AŞAMA 2: ÇÖZME VE PİKSEL HASH ---
+        # Boyutları eşleşen {0} görsel çözülüyor...
+        self.status_message.emit(get_text("status_decoding_pixels").format(len(to_decode)))
+        digests = self._compute_pixel_hashes(to_decode, algorithm, counters)
+        if digests is None: return
+
+        # --- GRUPLAMA ---
+        by_digest = {}
+        for path, digest in digests.items():
+            by_digest.setdefault(digest, []).append(path)
+
+        self._final_duplicates = []
+        self._stream_results = performance.get("stream_results", True)
+        self._stream_buffer = []
+        self._last_stream_emit = time.monotonic()
+
+        for digest, paths in by_digest.items():
+            if len(paths) < 2:
+                continue
+            if not self._is_running: return
+            self._publish_group(self._make_group(digest, paths, algorithm))
+        self._publish_hardlink_groups()
+        counters["groups"] = len(self._final_duplicates)
+        self._flush_stream()
+
+        # Tarama bitti. {0} kopya grubu bulundu.
+        self.status_message.emit(get_text("status_finished").format(len(self._final_duplicates)))
+        self.progress_updated.emit(100)
+        self._emit_stats()
+        self.scan_finished.emit(self._final_duplicates)
+
+    def _bucket_by_dimensions(self, candidates, counters):
+        """Adayları başlıktaki (genişlik, yükseklik) değerine göre {boyut: [yollar]} olarak kovalar.
+
+        Dizinde bulunan boyutlar dosya açılmadan kullanılır; diğer başlıklar iş parçacığı
+        havuzunda okunur. Boyutu okunamayan dosyalar atlanır. İptal edilirse None.
+        """
+        buckets = {}
+        to_read = []
+        for path in candidates:
+            dimensions = None
+            if self.hash_index is not None:
+                dimensions = self.hash_index.lookup(path, self.file_identities.get(path), self.file_sizes[path],
+                                                    DIMENSIONS_INDEX_KIND, "header")
+            if dimensions is not None:
+                buckets.setdefault(dimensions, []).append(path)
+            else:
+                to_read.append(path)
+
+        performance = self.options.get("performance", {})
+        with HashingEngine(performance.get("hash_workers", 0)) as engine:
+            jobs = ((path, read_image_dimensions, (path,)) for path in to_read)
+            for path, dimensions in engine.run_unordered(jobs, self.is_running):
+                if dimensions is None:
+                    counters["unreadable"] += 1
+                    continue
+                dimensions = f"{dimensions[0]}x{dimensions[1]}"
+                buckets.setdefault(dimensions, []).append(path)
+                if self.hash_index is not None:
+                    self.hash_index.store(path, self.file_identities.get(path), self.file_sizes[path],
+                                          DIMENSIONS_INDEX_KIND, "header", dimensions)
+        if not self._is_running: return None
+        return buckets
+
+    def _compute_pixel_hashes(self, paths, algorithm, counters):
+        """Görsellerin piksel özetlerini {yol: özet} olarak döndürür; iptal edilirse None.
+
+        Tam çözme işlemci yoğun olduğundan özetler süreç havuzunda hesaplanır ve
+        süreçler arasında yalnızca yol ile özet taşınır. Dizinde bulunanlar çözülmez.
+        """
+        digests = {}
+        to_decode = []
+        for path in paths:
+            digest = None
+            if self.hash_index is not None:
+                digest = self.hash_index.lookup(path, self.file_identities.get(path), self.file_sizes[path],
+                                                PIXEL_INDEX_KIND, algorithm)
+            if digest is not None:
+                digests[path] = digest
+                counters["index_hits"] += 1
+            else:
+                to_decode.append(path)
+
+        total = len(paths)
+        done = total - len(to_decode)
+        last_progress = -1
+        performance = self.options.get("performance", {})
+        jobs = ((path, calculate_pixel_hash, (path, algorithm)) for path in to_decode)
+        with HashingEngine(performance.get("hash_workers", 0), use_processes=True) as engine:
+            for path, digest in engine.run_unordered(jobs, self.is_running):
+                done += 1
+                if digest is None:
+                    counters["failed"] += 1
+                else:
+                    counters["decoded"] += 1
+                    digests[path] = digest
+                    if self.hash_index is not None:
+                        self.hash_index.store(path, self.file_identities.get(path), self.file_sizes[path],
+                                              PIXEL_INDEX_KIND, algorithm, digest)
+
+                progress = int(done / total * 100)
+                if progress != last_progress:
+                    last_progress = progress
+                    self.progress_updated.emit(progress)
+
+        if not self._is_running: return None
+        return digests
+
+    def _make_group(self, digest, paths, algorithm):
+        """Aynı piksel özetine sahip dosyaları kopya grubu sözlüğüne çevirir.
+
+        Dosyalar küçükten büyüğe sıralanır: ilk satır (korunan kopya) aynı pikselleri
+        en az yer kaplayan kodlamadır. Boyutlar file_sizes'ta ayrı ayrı tutulur.
+        """
+        files = sorted(paths, key=lambda path: (self.file_sizes[path], path))
+        return {
+            "hash": digest,
+            "hash_algorithm": algorithm,
+            "size_bytes": self.file_sizes[files[0]],
+            "size": format_size(self.file_sizes[files[0]]),
+            "files": files,
+            "file_sizes": {path: self.file_sizes[path] for path in files},
+            "pixel_identity": True,
+        }
+
+# ----------------------------------------------------------------------
+# 1.3 GÖRSEL BAŞLIK BİLGİLERİ (BOYUT, YÖN, ÇEKİM TARİHİ, KAMERA)
+# ----------------------------------------------------------------------
+
+# TIFF/EXIF etiketleri (yalnızca hangi kopyanın tutulacağını seçmek için gerekenler)
+TIFF_NEW_SUBFILE_TYPE = 0x00FE
+TIFF_IMAGE_WIDTH = 0x0100
+TIFF_IMAGE_LENGTH = 0x0101
+TIFF_MAKE = 0x010F
+TIFF_MODEL = 0x0110
+TIFF_ORIENTATION = 0x0112
+TIFF_DATETIME = 0x0132
+TIFF_SUB_IFDS = 0x014A
+TIFF_EXIF_IFD = 0x8769
+EXIF_DATETIME_ORIGINAL = 0x9003
+_TIFF_INFO_TAGS = {TIFF_NEW_SUBFILE_TYPE, TIFF_IMAGE_WIDTH, TIFF_IMAGE_LENGTH, TIFF_MAKE, TIFF_MODEL,
+                   TIFF_ORIENTATION, TIFF_DATETIME, TIFF_SUB_IFDS, TIFF_EXIF_IFD, EXIF_DATETIME_ORIGINAL}
+_TIFF_DIMENSION_TAGS = {TIFF_NEW_SUBFILE_TYPE, TIFF_IMAGE_WIDTH, TIFF_IMAGE_LENGTH}
+# NewSubfileType bit 0: IFD asıl görüntünün küçültülmüş bir kopyasıdır
+TIFF_SUBFILE_REDUCED = 0x1
+# Görüntü boyutlarını taşıyan JPEG SOF işaretçileri (C4 DHT, C8 JPG, CC DAC değildir)
+JPEG_SOF_MARKERS = {marker for marker in range(0xC0, 0xD0) if marker not in (0xC4, 0xC8, 0xCC)}
+# PNG/WebP parça zincirinde en fazla bu kadar parça başlığı okunur
+MAX_IMAGE_CHUNKS = 256
+# WebP VP8X bayrağı: dosyada EXIF parçası var
+WEBP_FLAG_EXIF = 0x08
+
+def _exif_datetime(value):
+    """EXIF tarihini ('2021:05:03 14:22:10') sıralanabilir '2021-05-03 14:22:10' biçimine çevirir."""
+    if not value or len(value) < 19 or value[4] != ":" or value.startswith("0000"):
+        return None
+    return value[:4] + "-" + value[5:7] + "-" + value[8:10] + value[10:19]
+
+def _tiff_info(file, base, file_size, info):
+    """TIFF yapısının IFD0 ve EXIF IFD'sinden boyut, yön, tarih ve kamera bilgisini info'ya ekler.
+
+    base, TIFF başlığının dosyadaki konumudur (TIFF dosyaları için 0, JPEG/PNG/WebP
+    içindeki EXIF için bölümün başı). Boyutlar yalnızca daha önce bulunmadıysa yazılır.
+    IFD0 küçültülmüş bir önizlemeyse (NEF, DNG) boyutlar tam çözünürlüklü SubIFD'den
+    alınır; böyle bir SubIFD yoksa boyut yazılmaz.
+    """
+    header = _read_at(file, base, 8)
+    if header[:4] == b"II*\x00":
+        byte_order = "<"
+    elif header[:4] == b"MM\x00*":
+        byte_order = ">"
+    else:
+        return
+
+    (ifd_offset,) = struct.unpack(byte_order + "I", header[4:8])
+    tags, _next_offset = _read_tiff_ifd(file, base, byte_order, ifd_offset, file_size, _TIFF_INFO_TAGS)
+    dimension_tags = tags
+    if tags.get(TIFF_NEW_SUBFILE_TYPE, [0])[0] & TIFF_SUBFILE_REDUCED:
+        dimension_tags = {}
+        for sub_offset in tags.get(TIFF_SUB_IFDS, [])[:MAX_TIFF_IFDS]:
+            sub_tags, _next_offset = _read_tiff_ifd(file, base, byte_order, sub_offset, file_size,
+                                                    _TIFF_DIMENSION_TAGS)
+            if sub_tags and not sub_tags.get(TIFF_NEW_SUBFILE_TYPE, [0])[0] & TIFF_SUBFILE_REDUCED:
+                dimension_tags = sub_tags
+                break
+    exif_offset = tags.get(TIFF_EXIF_IFD, [0])[0]
+    if exif_offset and exif_offset != ifd_offset:
+        exif_tags, _next_offset = _read_tiff_ifd(file, base, byte_order, exif_offset, file_size, _TIFF_INFO_TAGS)
+        tags.update(exif_tags)
+
+    if TIFF_IMAGE_WIDTH in dimension_tags and TIFF_IMAGE_LENGTH in dimension_tags:
+        info.setdefault("width", dimension_tags[TIFF_IMAGE_WIDTH][0])
+        info.setdefault("height", dimension_tags[TIFF_IMAGE_LENGTH][0])
+    orientation = tags.get(TIFF_ORIENTATION, [0])[0]
+    if 1 <= orientation <= 8:
+        info["orientation"] = orientation
+    # Çekim tarihi yoksa dosyanın (çoğu kez düzenleme) tarihi kullanılır
+    taken = _exif_datetime(tags.get(EXIF_DATETIME_ORIGINAL)) or _exif_datetime(tags.get(TIFF_DATETIME))
+    if taken:
+        info["taken"] = taken
+    for tag, key in ((TIFF_MAKE, "make"), (TIFF_MODEL, "model")):
+        if isinstance(tags.get(tag), str) and tags[tag]:
+            info[key] = tags[tag]
+
+def _jpeg_info(file, file_size, info):
+    segments, _sos_position = _jpeg_header_segments(file)
+    if segments is None:
+        return
+    for marker, position, _length in segments:
+        if marker in JPEG_SOF_MARKERS:
+            # SOF: uzunluk (2), hassasiyet (1), yükseklik (2), genişlik (2)
+            info["height"], info["width"] = struct.unpack(">HH", _read_at(file, position + 5, 4))
+    tiff_base = _jpeg_exif_tiff_base(file, segments)
+    if tiff_base is not None:
+        _tiff_info(file, tiff_base, file_size, info)
+
+def _png_info(file, file_size, info):
+    # Parça başlıkları IDAT'a kadar okunur; piksel verisinin ardındaki parçalara bakılmaz
+    position = len(PNG_SIGNATURE)
+    for _ in range(MAX_IMAGE_CHUNKS):
+        length, chunk_type = struct.unpack(">I4s", _read_at(file, position, 8))
+        if chunk_type == b"IHDR":
+            info["width"], info["height"] = struct.unpack(">II", _read_at(file, position + 8, 8))
+        elif chunk_type == b"eXIf":
+            _tiff_info(file, position + 8, min(file_size, position + 8 + length), info)
+        elif chunk_type in (b"IDAT", b"IEND"):
+            return
+        position += 12 + length
+
+def _webp_info(file, file_size, info):
+    (riff_size,) = struct.unpack("<I", _read_at(file, 4, 4))
+    riff_end = min(file_size, 8 + riff_size)
+    position = 12
+    for _ in range(MAX_IMAGE_CHUNKS):
+        if position + 8 > riff_end:
+            return
+        chunk_type, length = struct.unpack("<4sI", _read_at(file, position, 8))
+        data_position = position + 8
+        if chunk_type == b"VP8X":
+            data = _read_at(file, data_position, 10)
+            info["width"] = 1 + int.from_bytes(data[4:7], "little")
+            info["height"] = 1 + int.from_bytes(data[7:10], "little")
+            if not data[0] & WEBP_FLAG_EXIF:
+                return
+        elif chunk_type == b"VP8 " and "width" not in info:
+            # Kayıplı: 3 bayt kare etiketi, 9D 01 2A başlangıç kodu, 14'er bitlik boyutlar
+            data = _read_at(file, data_position, 10)
+            if data[3:6] == b"\x9d\x01\x2a":
+                width, height = struct.unpack_from("<HH", data, 6)
+                info["width"], info["height"] = width & 0x3FFF, height & 0x3FFF
+            return
+        elif chunk_type == b"VP8L" and "width" not in info:
+            # Kayıpsız: 0x2F imzası, ardından 14'er bitlik (genişlik-1, yükseklik-1)
+            data = _read_at(file, data_position, 5)
+            if data[:1] == b"\x2f":
+                (bits,) = struct.unpack_from("<I", data, 1)
+                info["width"] = (bits & 0x3FFF) + 1
+                info["height"] = ((bits >> 14) & 0x3FFF) + 1
+            return
+        elif chunk_type == b"EXIF":
+            base = data_position
+            # Bazı kodlayıcılar JPEG'deki "Exif\0\0" önekini de yazar
+            if _read_at(file, base, 6) == b"Exif\x00\x00":
+                base += 6
+            _tiff_info(file, base, min(riff_end, data_position + length), info)
+            return
+        # Parçalar çift bayt sınırına hizalanır
+        position = data_position + length + (length & 1)
+
+def read_image_info(file_path):
+    """Görselin başlığından boyut, yön, çekim tarihi ve kamera bilgisini okur.
+
+    JPEG, PNG, GIF, BMP, TIFF ve WebP için yalnızca başlıklar ve meta veri bölümleri
+    okunur, piksel verisi çözülmez. Dönen sözlükte width, height, orientation, taken,
+    make ve model anahtarlarından bulunanlar yer alır; hiçbiri yoksa None.
+    Tarama iş parçacığı havuzunda çalışır.
+    """
+    info = {}
+    try:
+        with open(file_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            header = file.read(26)
+            if header[:2] == b"\xff\xd8":
+                _jpeg_info(file, file_size, info)
+            elif header[:8] == PNG_SIGNATURE:
+                _png_info(file, file_size, info)
+            elif header[:6] in (b"GIF87a", b"GIF89a"):
+                info["width"], info["height"] = struct.unpack_from("<HH", header, 6)
+            elif header[:2] == b"BM":
+                (dib_size,) = struct.unpack_from("<I", header, 14)
+                if dib_size == 12: # OS/2 BITMAPCOREHEADER
+                    info["width"], info["height"] = struct.unpack_from("<HH", header, 18)
+                else:
+                    # Negatif yükseklik: satırlar yukarıdan aşağı saklanmış
+                    width, height = struct.unpack_from("<ii", header, 18)
+                    info["width"], info["height"] = abs(width), abs(height)
+            elif header[:4] in (b"II*\x00", b"MM\x00*"):
+                _tiff_info(file, 0, file_size, info)
+            elif header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+                _webp_info(file, file_size, info)
+    except (OSError, struct.error):
+        pass
+    return info or None
+
+def display_dimensions(info):
+    """EXIF yönü 90° döndürme gerektiriyorsa (5-8) genişlik ve yüksekliği yer değiştirir."""
+    if "width" not in info:
+        return None
+    if info.get("orientation", 1) >= 5:
+        return info["height"], info["width"]
+    return info["width"], info["height"]
+
+def camera_name(info):
+    """Marka ve modeli birleştirir; model zaten markayla başlıyorsa marka tekrarlanmaz."""
+    make, model = info.get("make", ""), info.get("model", "")
+    if make and model.lower().startswith(make.split()[0].lower()):
+        return model
+    return f"{make} {model}".strip()
+
+# ----------------------------------------------------------------------
+# 2. FAKE TRASH YÖNETİM SINIFI (Aynı Kaldı)
+# ----------------------------------------------------------------------
+
+# Her diskin kök dizininde oluşturulan sahte çöp dizini
+TRASH_DIR_NAME = '.Photoagent-Trash-1000'
+# Dosya taşınmış tüm çöp dizinleri (bağlama noktası ve btrfs alt birimleri dahil); çöp
+# sekmesi taranan dizin ve ev dizini dışındaki diskleri de buradan listeler
+TRASH_DIRS_INDEX_PATH = os.path.join(os.path.expanduser('~/.photoagent'), 'trash_dirs.index')
+# Günlük (journal) en az bu kadar kayda ve anlık görüntüdeki kayıt sayısına ulaşınca katlanır;
+# böylece sıkıştırmanın maliyeti yazılan kayıtlar arasında paylaşılır (amortize O(1))
+TRASH_JOURNAL_COMPACT_RECORDS = 1000
+# İptal edilen toplu işlemde sırası gelmeden bırakılan dosyaların hata değeri
+TRASH_CANCELED = "canceled"
+# Arka plan çöp işleminde bir pakette bildirilecek en fazla dosya ve paketler arası en uzun süre (sn)
+TRASH_PROGRESS_BATCH_FILES = 500
+TRASH_PROGRESS_BATCH_INTERVAL = 0.2
+
+def _fsync_directory(directory):
+    """Yeniden adlandırmanın kalıcı olması için dizini diske yazar (desteklenmiyorsa sessizce geçer)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class TrashStore:
+    """Bir çöp dizininin meta verisi: trashdata.json anlık görüntüsü + trashdata.journal günlüğü.
+
+    Kayıtlar bellekte (trash_filename, original_path) anahtarlı bir sözlükte tutulur.
+    Her değişiklik günlüğe tek satırlık JSON kayıtları olarak eklenir ve fsync ile
+    kalıcı hale getirilir; dosyanın tamamı yeniden yazılmaz. Günlük büyüyünce anlık
+    görüntü geçici dosyaya yazılıp fsync + rename ile değiştirilir ve günlük boşaltılır.
+    Eski sürümlerin trashdata.json listesi anlık görüntü olarak doğrudan okunur.
+    """
+
+    SNAPSHOT_NAME = "trashdata.json"
+    JOURNAL_NAME = "trashdata.journal"
+
+    def __init__(self, trash_dir):
+        self.trash_dir = trash_dir
+        self.snapshot_path = os.path.join(trash_dir, self.SNAPSHOT_NAME)
+        self.journal_path = os.path.join(trash_dir, self.JOURNAL_NAME)
+        self.lock = threading.Lock()
+        self._entries = {}
+        self._journal_records = 0
+        self._snapshot_records = 0
+        self._signature = None
+        # Kayıtlar her değiştiğinde artar; görünümler yalnızca değişen dizinleri yeniden okur
+        self.version = 0
+        self.load()
+
+    @staticmethod
+    def _key(trash_filename, original_path):
+        return (trash_filename, original_path)
+
+    def _file_signature(self):
+        # Başka bir PhotoAgent örneği dosyaları değiştirdiyse bellekteki kopya yeniden yüklenir
+        signature = []
+        for path in (self.snapshot_path, self.journal_path):
+            try:
+                file_stats = os.stat(path)
+                signature.append((file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def load(self):
+        """Anlık görüntüyü okur ve günlüğü üzerine uygular.
+
+        Uygulama idempotenttir: sıkıştırma sırasında yarıda kalan bir günlük yeniden
+        oynatılsa da sonuç değişmez. Çökme nedeniyle yarım kalan son satır kesilip atılır;
+        aksi halde sonraki eklemeler o satırla birleşip okunamaz hale gelirdi.
+        """
+        entries = {}
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                for item in json.load(f):
+                    entries[self._key(item.get("trash_filename"), item.get("original_path"))] = item
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError, TypeError) as e:
+            print(f"HATA: Çöp meta verisi okunamadı ({self.snapshot_path}): {e}")
+        snapshot_records = len(entries)
+
+        records = 0
+        valid_length = 0
+        try:
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    valid_length += len(line)
+                    records += 1
+                    if record.get("op") == "add":
+                        entry = record["entry"]
+                        entries[self._key(entry.get("trash_filename"), entry.get("original_path"))] = entry
+                    elif record.get("op") == "remove":
+                        entries.pop(self._key(record.get("trash_filename"), record.get("original_path")), None)
+            if os.path.getsize(self.journal_path) > valid_length:
+                print(f"HATA: Çöp günlüğünün yarım kalan sonu atılıyor ({self.journal_path})")
+                os.truncate(self.journal_path, valid_length)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"HATA: Çöp günlüğü okunamadı ({self.journal_path}): {e}")
+
+        self._entries = entries
+        self._journal_records = records
+        self._snapshot_records = snapshot_records
+        self._signature = self._file_signature()
+        self.version += 1
+
+    def refresh(self):
+        """Dosyalar bu nesne dışında değiştiyse yeniden yükler."""
+        if self._file_signature() != self._signature:
+            self.load()
+
+    def entries(self):
+        return list(self._entries.values())
+
+    def get(self, trash_filename, original_path):
+        return self._entries.get(self._key(trash_filename, original_path))
+
+    def commit(self, added=(), removed=()):
+        """Eklenen kayıtları ve kaldırılan (trash_filename, original_path) anahtarlarını tek bir işlemde yazar.
+
+        Tüm satırlar tek write ile günlüğe eklenir ve bir kez fsync edilir. Bellekteki
+        sözlük yalnızca yazma başarılıysa güncellenir. Başarılıysa True döner.
+        """
+        lines = [json.dumps({"op": "add", "entry": entry}, ensure_ascii=False) for entry in added]
+        lines += [json.dumps({"op": "remove", "trash_filename": trash_filename, "original_path": original_path},
+                             ensure_ascii=False) for trash_filename, original_path in removed]
+        if not lines:
+            return True
+
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"HATA: Çöp günlüğü yazılamadı ({self.journal_path}): {e}")
+            return False
+
+        for entry in added:
+            self._entries[self._key(entry["trash_filename"], entry["original_path"])] = entry
+        for key in removed:
+            self._entries.pop(self._key(*key), None)
+        self._journal_records += len(lines)
+        self.version += 1
+        self._signature = self._file_signature()
+
+        if self._journal_records >= max(TRASH_JOURNAL_COMPACT_RECORDS, self._snapshot_records):
+            self.compact()
+        return True
+
+    def compact(self):
+        """Canlı kayıtları yeni anlık görüntüye yazar ve günlüğü boşaltır.
+
+        Anlık görüntü geçici dosyaya yazılıp fsync edilir ve os.replace ile atomik olarak
+        yerine konur; yarıda kesilen bir sıkıştırma eski dosyayı bozmaz.
+        """
+        temp_path = self.snapshot_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(list(self._entries.values()), f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            _fsync_directory(self.trash_dir)
+            # Anlık görüntü kalıcı olduktan sonra günlük boşaltılır
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_records = 0
+            self._snapshot_records = len(self._entries)
+        except OSError as e:
+            print(f"HATA: Çöp meta verisi sıkıştırılamadı ({self.snapshot_path}): {e}")
+        self._signature = self._file_signature()
+
+class FakeTrashManager:
+    """Sahte Çöp Kutusu dizinlerini ve metadata dosyasını DİSK BAZLI yönetir."""
+
+    def __init__(self, index_path=TRASH_DIRS_INDEX_PATH):
+        self.base_config_dir = os.path.join(os.path.expanduser('~'), '.photoagent')
+        self.index_path = index_path
+        # Çöp dizini -> TrashStore; her dizinin meta verisi bir kez okunup bellekte tutulur
+        self._stores = {}
+        self._stores_lock = threading.Lock()
+        # Dosya taşınmış çöp dizinleri (sıralı); ilk kullanımda dizin dosyasından okunur
+        self._known_dirs = None
+
+    def _load_known_dirs(self):
+        if self._known_dirs is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._known_dirs = list(dict.fromkeys(line.rstrip("\n") for line in f if line.strip()))
+            except OSError:
+                self._known_dirs = []
+        return self._known_dirs
+
+    def _remember_trash_dir(self, trash_dir):
+        """trash_dir'i taşıma yapılan çöp dizinleri listesine (ve dizin dosyasına) ekler."""
+        with self._stores_lock:
+            known_dirs = self._load_known_dirs()
+            if trash_dir in known_dirs:
+                return
+            known_dirs.append(trash_dir)
+            try:
+                os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(trash_dir + "\n")
+            except OSError as e:
+                print(f"HATA: Çöp dizinleri listesi yazılamadı {self.index_path}: {e}")
+
+    def known_trash_dirs(self):
+        """Bu veya önceki oturumlarda dosya taşınmış ve hâlâ var olan çöp dizinlerini döndürür.
+
+        Taranan dizinin altındaki bir bind mount veya btrfs alt biriminin kendi çöpü
+        de böylece çöp sekmesinde görünür. Bağlı olmayan diskler listelenmez.
+        """
+        with self._stores_lock:
+            trash_dirs = list(dict.fromkeys(self._load_known_dirs() + list(self._stores)))
+        return [trash_dir for trash_dir in trash_dirs if os.path.isdir(trash_dir)]
+
+    def _setup_disk_dirs(self, trash_dir):
+        """Belirtilen diske ait çöp dizinini ve metadata dosyasını oluşturur."""
+        metadata_path = os.path.join(trash_dir, 'trashdata.json')
+        try:
+            os.makedirs(trash_dir, exist_ok=True)
+            if not os.path.exists(metadata_path):
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump([], f, indent=4)
+        except Exception as e:
+            print(f"HATA: Disk Bazlı Fake Trash dizinleri oluşturulamadı: {e}")
+
+    def _store(self, trash_dir):
+        """trash_dir'in meta veri deposunu döndürür; dosyalar dışarıdan değiştiyse yeniden yükler."""
+        with self._stores_lock:
+            store = self._stores.get(trash_dir)
+            if store is None:
+                store = self._stores[trash_dir] = TrashStore(trash_dir)
+                return store
+        with store.lock:
+            store.refresh()
+        return store
+
+    def entries(self, trash_dir):
+        """Çöp dizinindeki kayıtları, her birine trash_dir alanı eklenmiş olarak döndürür."""
+        store = self._store(trash_dir)
+        with store.lock:
+            return self._tagged_entries(store, trash_dir)
+
+    def entries_if_changed(self, trash_dir, known_version):
+        """(sürüm, kayıtlar) döndürür; depo known_version'dan beri değişmediyse kayıtlar None'dır.
+
+        Değişiklik denetimi iki stat çağrısıdır; kayıtlar yalnızca gerektiğinde kopyalanır.
+        """
+        store = self._store(trash_dir)
+        with store.lock:
+            if store.version == known_version:
+                return known_version, None
+            return store.version, self._tagged_entries(store, trash_dir)
+
+    @staticmethod
+    def _tagged_entries(store, trash_dir):
+        entries = []
+        for item in store.entries():
+            if "trash_dir" not in item:
+                item = dict(item, trash_dir=trash_dir)
+            entries.append(item)
+        return entries
+
+    def _trash_dir_for(self, original_path, mount_cache):
+        # Aynı klasördeki dosyalar aynı bağlama noktasındadır; her klasör için bir kez aranır
+        directory = os.path.dirname(original_path)
+        mount_point = mount_cache.get(directory)
+        if mount_point is None:
+            mount_point = mount_cache[directory] = get_mount_point(directory)
+        return os.path.join(mount_point, TRASH_DIR_NAME)
+
+    @staticmethod
+    def _run_per_device(groups, worker, on_result=None, is_running=None):
+        """worker(çöp dizini, [(sıra, öğe)], on_result, is_running) işlerini çöp dizini (aygıt) başına bir iş parçacığında yürütür.
+
+        Farklı diskler birbirini beklemez. Her iş [(sıra, hata)] döndürür; sonuçlar
+        sıraya göre birleştirilir (hata None ise işlem başarılıdır). on_result(öğe, hata)
+        her dosya bittiğinde iş parçacığının kendisinden çağrılır; is_running() False
+        dönerse sıradaki dosyalar işlenmeden TRASH_CANCELED hatasıyla bırakılır.
+        """
+        results = []
+        if len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="photoagent-trash") as executor:
+                jobs = [executor.submit(worker, trash_dir, indexed_items, on_result, is_running)
+                        for trash_dir, indexed_items in groups.items()]
+                for job in jobs:
+                    results.extend(job.result())
+        else:
+            for trash_dir, indexed_items in groups.items():
+                results.extend(worker(trash_dir, indexed_items, on_result, is_running))
+        results.sort(key=lambda result: result[0])
+        return [error for _index, error in results]
+
+    def move_many(self, files, on_result=None, is_running=None):
+        """Dosyaları ([{"path": ..., "size_bytes": ...}]) kendi disklerindeki çöpe toplu olarak taşır.
+
+        Her çöp dizini için: dizin bir kez hazırlanır ve listelenir, kayıtların tamamı
+        taşımadan ÖNCE tek bir günlük işlemiyle yazılır (çökmede çöpte kayıtsız dosya
+        kalmaz), ardından dosyalar taşınır. Taşınamayanların kayıtları ikinci bir işlemle
+        geri alınır. Diskler eşzamanlı işlenir. Dönen [(öğe, hata)] listesi girdiyle aynı
+        sıradadır; hata None ise dosya taşınmıştır. on_result ve is_running için
+        bkz. _run_per_device.
+        """
+        mount_cache = {}
+        groups = {}
+        for index, file_data in enumerate(files):
+            trash_dir = self._trash_dir_for(os.path.abspath(file_data["path"]), mount_cache)
+            groups.setdefault(trash_dir, []).append((index, file_data))
+        errors = self._run_per_device(groups, self._move_group, on_result, is_running)
+        return list(zip(files, errors))
+
+    def _move_group(self, trash_dir, indexed_files, on_result=None, is_running=None):
+        self._setup_disk_dirs(trash_dir)
+        self._remember_trash_dir(trash_dir)
+        try:
+            taken_names = set(os.listdir(trash_dir))
+        except OSError as e:
+            return [(index, str(e)) for index, _file_data in indexed_files]
+
+        postfix = int(datetime.now().timestamp() * 1000)
+        deletion_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        planned = []
+        for index, file_data in indexed_files:
+            original_path = os.path.abspath(file_data["path"])
+            name, ext = os.path.splitext(os.path.basename(original_path))
+            trash_filename = f"{name}_{postfix}{ext}"
+            counter = 0
+            while trash_filename in taken_names:
+                counter += 1
+                trash_filename = f"{name}_{postfix}_{counter}{ext}"
+            taken_names.add(trash_filename)
+            planned.append((index, original_path, {
+                "trash_filename": trash_filename,
+                "original_path": original_path,
+                "deletion_date": deletion_date,
+                "size": format_size(file_data["size_bytes"]),
+                "size_bytes": file_data["size_bytes"],
+                "trash_dir": trash_dir
+            }))
+
+        store = self._store(trash_dir)
+        with store.lock:
+            if not store.commit(added=[entry for _index, _path, entry in planned]):
+                return [(index, "metadata") for index, _path, _entry in planned]
+
+        # Taşımalar kilit dışında yapılır: diskler arası kopyalama sürerken arayüz
+        # kayıtları okuyabilmeli. Taşınamayan veya iptal nedeniyle taşınmayan
+        # dosyaların önceden yazılan kayıtları sonda tek işlemle geri alınır.
+        results = []
+        failed_keys = []
+        for (index, original_path, entry), (_index, file_data) in zip(planned, indexed_files):
+            if is_running is not None and not is_running():
+                failed_keys.append((entry["trash_filename"], original_path))
+                results.append((index, TRASH_CANCELED))
+                continue
+            error = None
+            try:
+                shutil.move(original_path, os.path.join(trash_dir, entry["trash_filename"]))
+            except (OSError, shutil.Error) as e:
+                print(f"Taşıma Hatası (Disk Bazlı): {e}")
+                failed_keys.append((entry["trash_filename"], original_path))
+                error = str(e)
+            results.append((index, error))
+            if on_result is not None:
+                on_result(file_data, error)
+
+        with store.lock:
+            store.commit(removed=failed_keys)
+        return results
+
+    def restore_many(self, items, on_result=None, is_running=None):
+        """Çöp kayıtlarını ([{"trash_filename", "original_path", "trash_dir"}]) özgün yerlerine geri taşır.
+
+        Her çöp dizininde dosyalar taşındıktan sonra kayıtları tek işlemle silinir; diskler
+        eşzamanlı işlenir. Çöpte dosyası olmayan ama özgün yolu yerinde duran kayıt
+        (yarıda kalmış taşıma) yalnızca silinir. Girdiyle aynı sırada [(öğe, hata)] döner.
+        """
+        groups = {}
+        for index, item in enumerate(items):
+            groups.setdefault(item["trash_dir"], []).append((index, item))
+        errors = self._run_per_device(groups, self._restore_group, on_result, is_running)
+        return list(zip(items, errors))
+
+    def _restore_group(self, trash_dir, indexed_items, on_result=None, is_running=None):
+        results = []
+        restored_keys = []
+        created_dirs = set()
+        for index, item in indexed_items:
+            if is_running is not None and not is_running():
+                results.append((index, TRASH_CANCELED))
+                continue
+            trash_file_path = os.path.join(trash_dir, item["trash_filename"])
+            original_path = item["original_path"]
+            error = None
+            if not os.path.exists(trash_file_path):
+                # Taşıma, kaydı günlüğe yazıldıktan sonra ve dosya taşınmadan önce kesildiyse
+                # çöpte dosya hiç olmamıştır ve asıl dosya yerindedir: kayıt geri yüklenmiş sayılır
+                if os.path.lexists(original_path):
+                    restored_keys.append((item["trash_filename"], original_path))
+                else:
+                    error = "missing"
+            else:
+                try:
+                    original_dir = os.path.dirname(original_path)
+                    if original_dir not in created_dirs:
+                        os.makedirs(original_dir, exist_ok=True)
+                        created_dirs.add(original_dir)
+                    shutil.move(trash_file_path, original_path)
+                    restored_keys.append((item["trash_filename"], original_path))
+                except (OSError, shutil.Error) as e:
+                    print(f"Geri Yükleme Hatası: {e}")
+                    error = str(e)
+            results.append((index, error))
+            if on_result is not None:
+                on_result(item, error)
+
+        store = self._store(trash_dir)
+        with store.lock:
+            store.commit(removed=restored_keys)
+        return results
+
+    def purge_many(self, items, on_result=None, is_running=None):
+        """Çöp kayıtlarının dosyalarını kalıcı olarak siler; kayıtlar dizin başına tek işlemle kaldırılır.
+
+        Dosyası zaten olmayan kayıt da kaldırılır. Girdiyle aynı sırada [(öğe, hata)] döner.
+        """
+        groups = {}
+        for index, item in enumerate(items):
+            groups.setdefault(item["trash_dir"], []).append((index, item))
+        errors = self._run_per_device(groups, self._purge_group, on_result, is_running)
+        return list(zip(items, errors))
+
+    def _purge_group(self, trash_dir, indexed_items, on_result=None, is_running=None):
+        results = []
+        purged_keys = []
+        for index, item in indexed_items:
+            if is_running is not None and not is_running():
+                results.append((index, TRASH_CANCELED))
+                continue
+            error = None
+            try:
+                os.remove(os.path.join(trash_dir, item["trash_filename"]))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Kalıcı Silme Hatası: {e}")
+                error = str(e)
+            if error is None:
+                purged_keys.append((item["trash_filename"], item["original_path"]))
+            results.append((index, error))
+            if on_result is not None:
+                on_result(item, error)
+
+        store = self._store(trash_dir)
+        with store.lock:
+            store.commit(removed=purged_keys)
+        return results
+
+    def move_to_trash(self, filepath, file_size_bytes):
+        """Dosyayı kendi diskindeki FakeTrash'a taşır ve metadata kaydını oluşturur."""
+        return self.move_many([{"path": filepath, "size_bytes": file_size_bytes}])[0][1] is None
+
+    def get_trash_files(self):
+        """Bu metot artık kullanılmayacak veya FakeTrashApp tarafından yönetilecek."""
+        raise NotImplementedError("Disk bazlı yönetim nedeniyle bu metot artık DuplicateFinderApp tarafından yönetilmelidir.")
+
+    def restore_file(self, trash_filename, original_path, trash_dir):
+        """Dosyayı FakeTrash'tan orijinal konumuna geri yükler."""
+        item = {"trash_filename": trash_filename, "original_path": original_path, "trash_dir": trash_dir}
+        return self.restore_many([item])[0][1] is None
+
+    def purge_file(self, trash_filename, original_path, trash_dir):
+        """Dosyayı FakeTrash'tan kalıcı olarak siler (diskten siler)."""
+        item = {"trash_filename": trash_filename, "original_path": original_path, "trash_dir": trash_dir}
+        return self.purge_many([item])[0][1] is None
+
+
+class TrashOperationWorker(QThread):
+    """Çöpe taşıma, geri yükleme veya kalıcı silme işlemini arayüzü dondurmadan yürütür.
+
+    İşlem FakeTrashManager'ın toplu metotlarıyla yapılır. Biten dosyalar paketler halinde
+    files_done ile bildirilir; böylece listeler işlem sürerken güncellenir. stop()
+    çağrılınca sıradaki dosyaya geçilmez (üzerinde çalışılan dosya tamamlanır).
+    """
+    progress_updated = Signal(int)
+    # Biten dosyaların [(öğe, hata)] paketi; hata None ise işlem başarılıdır
+    files_done = Signal(list)
+    # Girdiyle aynı sırada tüm [(öğe, hata)] sonuçları; iptalde kalanlar TRASH_CANCELED ile döner
+    operation_finished = Signal(list)
+
+    def __init__(self, trash_manager, operation, items, parent=None):
+        super().__init__(parent)
+        self.trash_manager = trash_manager
+        self.operation = operation  # "move", "restore" veya "purge"
+        self.items = items
+        self._is_running = True
+        # on_result her diskin kendi iş parçacığından çağrılır
+        self._lock = threading.Lock()
+        self._pending = []
+        self._done_count = 0
+        self._last_progress = -1
+        self._last_emit = time.monotonic()
+
+    def stop(self):
+        self._is_running = False
+
+    def is_running(self):
+        return self._is_running
+
+    def run(self):
+        batch_methods = {
+            "move": self.trash_manager.move_many,
+            "restore": self.trash_manager.restore_many,
+            "purge": self.trash_manager.purge_many,
+        }
+        results = batch_methods[self.operation](self.items, on_result=self._on_result, is_running=self.is_running)
+        with self._lock:
+            self._flush_pending()
+        self.operation_finished.emit(results)
+
+    def _on_result(self, item, error):
+        with self._lock:
+            self._pending.append((item, error))
+            self._done_count += 1
+            progress = int(self._done_count * 100 / len(self.items))
+            if progress != self._last_progress:
+                self._last_progress = progress
+                self.progress_updated.emit(progress)
+            if (len(self._pending) >= TRASH_PROGRESS_BATCH_FILES
+                    or time.monotonic() - self._last_emit >= TRASH_PROGRESS_BATCH_INTERVAL):
+                self._flush_pending()
+
+    def _flush_pending(self):
+        self._last_emit = time.monotonic()
+        if self._pending:
+            self.files_done.emit(self._pending)
+            self._pending = []
+
+
+# ----------------------------------------------------------------------
+# 2.1 SONUÇ LİSTESİ MODELİ
+# ----------------------------------------------------------------------
 
-        for base_dir in self.target_dirs:
-            if not self._is_running: return
+# Otomatik işaretleme kuralları: her biri dosya için "küçük olan tutulur" anahtarı üretir
+AUTOMARK_RULES = ("oldest", "resolution", "priority", "shortest")
 
-            for root, dirs, files in os.walk(base_dir):
-                if not self._is_running: return
+def _automark_key_functions(rules, priority_prefixes):
+    """Kural adlarını (grup, yol) -> anahtar fonksiyonlarına çevirir."""
+    # "/a/b" öneki "/a/bc" klasörüyle eşleşmesin diye önekler ayraçla biter
+    prefixes = [os.path.join(os.path.abspath(os.path.expanduser(prefix)), '') for prefix in priority_prefixes]
 
-                # Gizli dizinleri atlama
-                if ignore_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith('.')]
+    def info(group, path):
+        return group.get("file_info", {}).get(path, {})
 
-                for file_name in files:
-                    full_path = os.path.join(root, file_name)
+    def oldest(group, path):
+        mtime_ns = info(group, path).get("mtime_ns")
+        if mtime_ns is None:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                return float("inf")
+        return mtime_ns
+
+    # Grup kimliği -> tüm dosyaların boyutu biliniyor mu; gruptaki her dosya için yeniden bakılmaz
+    dimensions_known = {}
+
+    def resolution(group, path):
+        # Boyutu okunamayan (ör. önizlemesi dışında boyut taşımayan RAW) bir dosya varsa
+        # kural bu grupta karar vermez; bilinmeyen boyut 0 sayılıp asıl dosya elenmesin
+        known = dimensions_known.get(id(group))
+        if known is None:
+            known = dimensions_known[id(group)] = all(
+                "width" in info(group, other) for other in group["files"])
+        if not known:
+            return 0
+        file_info = info(group, path)
+        return -file_info["width"] * file_info["height"]
+
+    def priority(group, path):
+        for rank, prefix in enumerate(prefixes):
+            if path.startswith(prefix):
+                return rank
+        return len(prefixes)
+
+    def shortest(group, path):
+        return len(path)
+
+    functions = {"oldest": oldest, "resolution": resolution, "priority": priority, "shortest": shortest}
+    return [functions[rule] for rule in rules]
+
+def auto_mark_groups(groups, rules, priority_prefixes=(), present=None):
+    """Her gruptan kurallara göre bir dosya tutar ve işaretlenecek diğer yolları döndürür.
+
+    Kurallar sırayla uygulanır: ilk kural eşit kalırsa sonraki karar verir, hepsi eşitse
+    grubun kendi sırasındaki ilk dosya tutulur. present verilirse yalnızca içindeki yollar
+    (ör. henüz silinmemiş satırlar) değerlendirilir. Tüm dosyalar tek geçişte, O(dosya x
+    kural) sürede işlenir; tek dosyası kalan gruplarda hiçbir şey işaretlenmez.
+    """
+    key_functions = _automark_key_functions(rules, priority_prefixes)
+    marked = []
+    for group in groups:
+        paths = group["files"] if present is None else [path for path in group["files"] if path in present]
+        if len(paths) < 2:
+            continue
+        keep = min(paths, key=lambda path: tuple(key(group, path) for key in key_functions))
+        marked.extend(path for path in paths if path != keep)
+    return marked
+
+class DuplicateResultsModel(QAbstractListModel):
+    """Kopya grup verisini doğrudan gösteren sanal liste modeli.
+
+    Her satır bir (grup no, dosya yolu) çiftidir. Metin, ipucu, renk ve küçük resim
+    öğe nesnesi olarak saklanmaz; görünüm yalnızca ekrandaki satırlar için data()
+    çağırdığında üretilir. İşaretli dosyalar yol -> boyut sözlüğünde tutulur.
+    """
+
+    # Önceki QListWidget öğelerindeki veri rolleriyle aynı
+    PathRole = Qt.UserRole
+    SizeRole = Qt.UserRole + 1
+    HashRole = Qt.UserRole + 2
 
-                    try:
-                        file_stats = os.stat(full_path)
-                        file_size = file_stats.st_size
-                    except:
-                        continue
+    GROUP_COLORS = [QColor("#3cb5ff"), QColor("#d7b981")] # Renkler koyu temaya uygun (açık mavi, kahverengi)
 
-                    if self.options["ignore"]["ignore_zero_byte"] and file_size == 0:
-                        continue
-                        
-                    # Gizli Dosya Kontrolü
-                    if ignore_hidden and (file_name.startswith('.') or 
-                                          (platform.system() == "Windows" and 
-                                           file_stats.st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)):
-                        continue
+    # Grup içindeki kopyaların sıralama ölçütleri ("default": taramanın verdiği sıra)
+    SORT_KEYS = ("default", "resolution", "date", "camera", "size", "path")
 
-                    # UZANTI FİLTRELEME UYGULAMASI
-                    if is_filtering_active:
-                        file_ext = os.path.splitext(file_name)[1].lower()
-                        if file_ext not in allowed_extensions:
-                            continue
+    def __init__(self, thumbnail_provider, parent=None):
+        super().__init__(parent)
+        # thumbnail_provider(yol) -> QIcon; yalnızca görünür satırlar için çağrılır
+        self._thumbnail_provider = thumbnail_provider
+        self._groups = []
+        self._rows = []
+        self._checked = {}
+        self._row_of_path = None
+        self._sort_key = "default"
+        self._brushes = [QBrush(color) for color in self.GROUP_COLORS]
+
+    # --- Qt model arayüzü ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        group_index, file_path = self._rows[index.row()]
+        group = self._groups[group_index]
+
+        if role == Qt.DisplayRole:
+            return self._item_text(group, file_path)
+        if role == Qt.DecorationRole:
+            return self._thumbnail_provider(file_path)
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if file_path in self._checked else Qt.Unchecked
+        if role == Qt.BackgroundRole:
+            return self._brushes[group_index % len(self._brushes)]
+        if role == Qt.ToolTipRole:
+            return self._item_tooltip(group, file_path)
+        if role == self.PathRole:
+            return file_path
+        if role == self.SizeRole:
+            return self._file_size(group, file_path)
+        if role == self.HashRole:
+            return group["hash"]
+        return None
 
-                    if file_size not in all_files_by_size:
-                        all_files_by_size[file_size] = []
-                    all_files_by_size[file_size].append(full_path)
-                    total_files += 1
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
 
-        candidate_groups = {size: paths for size, paths in all_files_by_size.items() if len(paths) > 1}
-        total_candidates = sum(len(paths) for paths in candidate_groups.values())
+        group_index, file_path = self._rows[index.row()]
+        if value == Qt.Checked:
+            self._checked[file_path] = self._file_size(self._groups[group_index], file_path)
+        else:
+            self._checked.pop(file_path, None)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
 
-        if total_candidates == 0:
-            # {0} dosya bulundu
-            self.status_message.emit(get_text("status_finished_none").format(total_files))
-            self.scan_finished.emit([])
+    @staticmethod
+    def _file_size(group, file_path):
+        # Benzer görsel gruplarında her dosyanın boyutu ayrıdır
+        file_sizes = group.get("file_sizes")
+        return file_sizes[file_path] if file_sizes else group["size_bytes"]
+
+    # --- Metin üretimi ---
+    def _item_text(self, group, file_path):
+        # Açıklama metni (Dosya adı, boyut, yol ve HASH). Tüm satırlar aynı yükseklikte
+        # kalsın diye sabit bağlantı ve benzerlik bilgisi boyut satırına eklenir.
+        if "file_sizes" in group:
+            size_line = f"({format_size(group['file_sizes'][file_path])})"
+        else:
+            size_line = f"({group['size']})"
+        if "similarity" in group:
+            size_line += " · " + get_text("similarity_label").format(self._file_similarity(group, file_path))
+        linked_paths = group.get("hardlinks", {}).get(file_path)
+        if linked_paths:
+            size_line += " · " + get_text("hardlinks_shared").format(len(linked_paths))
+        info = group.get("file_info", {}).get(file_path)
+        if info:
+            dimensions = display_dimensions(info)
+            size_line += "".join(f" · {part}" for part in (
+                dimensions and f"{dimensions[0]}×{dimensions[1]}", info.get("taken"), camera_name(info)) if part)
+        return (f"{os.path.basename(file_path)}\n{size_line}\n{os.path.dirname(file_path)}\n"
+                f"Hash ({group.get('hash_algorithm', 'md5')}): {group['hash']}")
+
+    @staticmethod
+    def _file_similarity(group, file_path):
+        """Dosyanın grup merkezine benzerlik yüzdesi (uzaklık yoksa grubun en düşük değeri)."""
+        distance = group.get("distances", {}).get(file_path)
+        if distance is None:
+            return group["similarity"]
+        return round(100.0 * (1 - distance / (PERCEPTUAL_HASH_SIZE * PERCEPTUAL_HASH_SIZE)), 1)
+
+    def _item_tooltip(self, group, file_path):
+        tooltip = f"{os.path.basename(file_path)}\n{os.path.dirname(file_path)}\nHash ({group.get('hash_algorithm', 'md5')}): {group['hash']}"
+        if group.get("confirm_hash"):
+            tooltip += f"\nHash ({group['confirm_algorithm']}): {group['confirm_hash']}"
+        if group.get("ignores_metadata"):
+            tooltip += "\n" + get_text("metadata_ignored_note")
+        if group.get("pixel_identity"):
+            tooltip += "\n" + get_text("pixel_identity_note")
+        if group.get("hardlinks_only"):
+            tooltip += "\n" + get_text("hardlinks_only_note")
+
+        info = group.get("file_info", {}).get(file_path)
+        if info:
+            dimensions = display_dimensions(info)
+            if dimensions:
+                tooltip += f"\n{get_text('sort_resolution')}: {dimensions[0]} × {dimensions[1]} px"
+            if "orientation" in info:
+                tooltip += f"\n{get_text('info_orientation')}: {info['orientation']}"
+            if "taken" in info:
+                tooltip += f"\n{get_text('sort_date')}: {info['taken']}"
+            if camera_name(info):
+                tooltip += f"\n{get_text('sort_camera')}: {camera_name(info)}"
+
+        # Aynı fiziksel dosyaya bağlı diğer yollar (silinmeleri alan kazandırmaz)
+        linked_paths = group.get("hardlinks", {}).get(file_path, [])
+        if linked_paths:
+            tooltip += "\n" + get_text("hardlinks_shared").format(len(linked_paths)) + ":\n" + "\n".join(linked_paths)
+        return tooltip
+
+    # --- Veri işlemleri ---
+    def set_groups(self, groups):
+        """Modeli verilen gruplarla baştan kurar."""
+        self.beginResetModel()
+        self._groups = []
+        self._rows = []
+        self._checked = {}
+        self._row_of_path = None
+        self._extend(groups)
+        self.endResetModel()
+
+    def append_groups(self, groups):
+        """Grupları tek bir toplu ekleme bildirimiyle listenin sonuna ekler."""
+        new_row_count = sum(len(group["files"]) for group in groups)
+        if not new_row_count:
+            self._groups.extend(groups)
+            return
+        first_row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + new_row_count - 1)
+        self._extend(groups)
+        self.endInsertRows()
+
+    def _extend(self, groups):
+        for group in groups:
+            group_index = len(self._groups)
+            self._groups.append(group)
+            self._rows.extend(self._group_rows(group_index, group["files"]))
+        self._row_of_path = None
+
+    def _group_rows(self, group_index, paths):
+        """Bir grubun satırlarını geçerli sıralama ölçütüne göre döndürür.
+
+        paths grubun özgün sırasındadır; sıralama kararlı olduğundan eşit değerli
+        kopyalar taramanın verdiği sırada kalır. Bilgisi olmayan dosyalar sona gider.
+        """
+        if self._sort_key != "default":
+            group = self._groups[group_index]
+            paths = sorted(paths, key=lambda file_path: self._sort_value(group, file_path))
+        return [(group_index, file_path) for file_path in paths]
+
+    def _sort_value(self, group, file_path):
+        info = group.get("file_info", {}).get(file_path, {})
+        if self._sort_key == "resolution":
+            return -info.get("width", 0) * info.get("height", 0)
+        if self._sort_key == "date":
+            # En eski çekim önce: çoğu kez özgün dosyadır
+            return "taken" not in info, info.get("taken", "")
+        if self._sort_key == "camera":
+            camera = camera_name(info).lower()
+            return not camera, camera
+        if self._sort_key == "size":
+            return -self._file_size(group, file_path)
+        return file_path.lower()
+
+    def sort_files(self, sort_key):
+        """Her grubun kopyalarını sort_key ölçütüne göre sıralar; grupların sırası değişmez.
+
+        Silinmiş satırlar geri gelmez. Seçim ve kalıcı indeksler yollarıyla birlikte taşınır.
+        """
+        if sort_key not in self.SORT_KEYS or sort_key == self._sort_key:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._sort_key = sort_key
+        persistent_indexes = self.persistentIndexList()
+        persistent_paths = [self._rows[index.row()][1] for index in persistent_indexes]
+
+        present_paths = {file_path for _group_index, file_path in self._rows}
+        rows = []
+        # Gruplar dict.fromkeys ile ilk görüldükleri sırada (liste sırası) gezilir
+        for group_index in dict.fromkeys(group_index for group_index, _file_path in self._rows):
+            paths = [path for path in self._groups[group_index]["files"] if path in present_paths]
+            rows.extend(self._group_rows(group_index, paths))
+        self._rows = rows
+        self._row_of_path = None
+
+        row_of_path = self._row_index()
+        self.changePersistentIndexList(persistent_indexes, [self.index(row_of_path[path]) for path in persistent_paths])
+        self.layoutChanged.emit()
+
+    def path_at(self, row):
+        return self._rows[row][1]
+
+    def refresh_path(self, file_path):
+        """Küçük resmi hazır olan satırın yeniden çizilmesini ister."""
+        row = self._row_index().get(file_path)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def set_checked_paths(self, paths):
+        """İşaretleri toplu olarak değiştirir: yalnızca paths içindeki (listede olan) yollar işaretli kalır.
+
+        Satır başına bildirim yerine tüm liste için tek bir dataChanged gönderilir.
+        """
+        row_of_path = self._row_index()
+        self._checked = {}
+        for path in paths:
+            row = row_of_path.get(path)
+            if row is not None:
+                group_index, _file_path = self._rows[row]
+                self._checked[path] = self._file_size(self._groups[group_index], path)
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.CheckStateRole])
+
+    def auto_mark(self, rules, priority_prefixes=()):
+        """Listede kalan dosyalara auto_mark_groups kurallarını uygular; (işaretli dosya, grup) sayısını döndürür."""
+        row_of_path = self._row_index()
+        marked = auto_mark_groups(self._groups, rules, priority_prefixes, present=row_of_path)
+        self.set_checked_paths(marked)
+        marked_groups = {self._rows[row_of_path[path]][0] for path in marked}
+        return len(marked), len(marked_groups)
+
+    def checked_files(self):
+        """İşaretli dosyaları [{"path": ..., "size_bytes": ...}] olarak döndürür."""
+        return [{"path": path, "size_bytes": size_bytes} for path, size_bytes in self._checked.items()]
+
+    def _row_index(self):
+        # Yol -> satır eşlemesi yalnızca gerektiğinde ve satırlar değiştikten sonra bir kez kurulur
+        if self._row_of_path is None:
+            self._row_of_path = {file_path: row for row, (_group_index, file_path) in enumerate(self._rows)}
+        return self._row_of_path
+
+    def remove_paths(self, paths):
+        """Verilen yolların satırlarını kaldırır; ardışık satırlar tek bildirimle silinir."""
+        row_of_path = self._row_index()
+        rows = sorted({row_of_path[path] for path in paths if path in row_of_path}, reverse=True)
+        if not rows:
             return
 
-        # {0} aday için hash hesaplanıyor...
-        self.status_message.emit(get_text("status_hashing").format(total_candidates))
-
-        files_by_hash = {}
-        processed_count = 0
+        # Sondan başa ardışık aralıklar halinde sil (önceki satır numaraları değişmez)
+        range_end = range_start = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == range_start - 1:
+                range_start = row
+                continue
+            self.beginRemoveRows(QModelIndex(), range_start, range_end)
+            for _group_index, file_path in self._rows[range_start:range_end + 1]:
+                self._checked.pop(file_path, None)
+            del self._rows[range_start:range_end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                range_end = range_start = row
+        self._row_of_path = None
+
+class TrashTableModel(QAbstractTableModel):
+    """Fake Trash sekmesinin sanal tablo modeli.
+
+    Satırlar çöp kayıtlarının kendisidir; metin ve ikonlar yalnızca görünür hücreler için
+    data() çağrıldığında üretilir. Her çöp dizininin kayıtları deposunun sürümüyle
+    saklanır: refresh() yalnızca değişen dizinleri yeniden okur, hiçbiri değişmediyse
+    görünüme dokunmaz. İşaretli satırlar anahtarlarıyla tutulur ve yenilemede korunur.
+    """
+
+    CHECK_COLUMN, FILE_COLUMN, ORIGINAL_PATH_COLUMN, DATE_COLUMN = range(4)
+    HEADER_KEYS = (None, "trash_col_file", "trash_col_original_path", "trash_col_deletion_date")
+
+    def __init__(self, trash_manager, icon_provider, parent=None):
+        super().__init__(parent)
+        self._trash_manager = trash_manager
+        # icon_provider(yol) -> QIcon; yalnızca görünür satırlar için çağrılır
+        self._icon_provider = icon_provider
+        # Çöp dizini -> (depo sürümü, [kayıt])
+        self._dir_cache = {}
+        self._trash_dirs = []
+        self._rows = []
+        # _rows ile paralel anahtar listesi ve anahtar -> satır eşlemesi (gerektiğinde kurulur)
+        self._row_keys = []
+        self._row_of_key = None
+        self._checked = set()
+
+    @staticmethod
+    def item_key(item):
+        return (item["trash_dir"], item["trash_filename"], item["original_path"])
+
+    # --- Qt model arayüzü ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_KEYS)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.CHECK_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+
+        item = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == self.FILE_COLUMN:
+                return item.get("trash_filename", "")
+            if column == self.ORIGINAL_PATH_COLUMN:
+                return item.get("original_path", "")
+            if column == self.DATE_COLUMN:
+                return item.get("deletion_date", "")
+        elif role == Qt.DecorationRole and column == self.FILE_COLUMN:
+            return self._icon_provider(os.path.join(item["trash_dir"], item.get("trash_filename", "")))
+        elif role == Qt.CheckStateRole and column == self.CHECK_COLUMN:
+            return Qt.Checked if self._row_keys[index.row()] in self._checked else Qt.Unchecked
+        return None
 
-        for size, file_paths in candidate_groups.items():
-            for file_path in file_paths:
-                if not self._is_running: return
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() != self.CHECK_COLUMN:
+            return False
 
-                processed_count += 1
-                progress = int((processed_count / total_candidates) * 100)
-                self.progress_updated.emit(progress)
-                # Hashleniyor: {0}
-                self.status_message.emit(get_text("status_hashing_file").format(os.path.basename(file_path)))
+        key = self._row_keys[index.row()]
+        if value == Qt.Checked:
+            self._checked.add(key)
+        else:
+            self._checked.discard(key)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
 
-                file_hash = calculate_md5(file_path)
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            text_key = self.HEADER_KEYS[section]
+            return get_text(text_key) if text_key else ""
+        return super().headerData(section, orientation, role)
 
-                if not file_hash:
-                    continue
+    def retranslate(self):
+        """Dil değişince başlıkları yeniden okutur."""
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.HEADER_KEYS) - 1)
 
-                if file_hash:
-                    if file_hash not in files_by_hash:
-                        files_by_hash[file_hash] = []
-                    files_by_hash[file_hash].append(file_path)
+    # --- Veri işlemleri ---
+    def refresh(self, trash_dirs):
+        """trash_dirs'in kayıtlarını gösterir; yalnızca deposu değişen dizinler yeniden okunur.
 
-        final_duplicates = []
-        for file_hash, file_paths in files_by_hash.items():
-            if len(file_paths) > 1:
-                try:
-                    file_size_bytes = os.stat(file_paths[0]).st_size
-                    final_duplicates.append({
-                        "hash": file_hash,
-                        "size_bytes": file_size_bytes, 
-                        "size": format_size(file_size_bytes),
-                        "files": file_paths
-                    })
-                except:
-                    continue
+        Hiçbir dizin değişmediyse model sıfırlanmaz (kaydırma ve seçim yerinde kalır).
+        Değişiklik olduysa True döner.
+        """
+        changed = list(trash_dirs) != self._trash_dirs
+        dir_cache = {}
+        for trash_dir in trash_dirs:
+            version, rows = self._dir_cache.get(trash_dir, (None, None))
+            new_version, entries = self._trash_manager.entries_if_changed(trash_dir, version)
+            if entries is not None:
+                version, rows = new_version, entries
+                changed = True
+            dir_cache[trash_dir] = (version, rows)
+        self._dir_cache = dir_cache
+        if not changed:
+            return False
 
-        # Tarama bitti. {0} kopya grubu bulundu.
-        self.status_message.emit(get_text("status_finished").format(len(final_duplicates)))
+        self.beginResetModel()
+        self._trash_dirs = list(trash_dirs)
+        self._rows = [item for trash_dir in self._trash_dirs for item in dir_cache[trash_dir][1]]
+        self._row_keys = [self.item_key(item) for item in self._rows]
+        self._row_of_key = None
+        self._checked &= set(self._row_keys)
+        self.endResetModel()
+        return True
 
-        self.progress_updated.emit(100)
-        self.scan_finished.emit(final_duplicates)
+    def item(self, row):
+        return self._rows[row]
+
+    def checked_items(self):
+        """İşaretli kayıtları tablodaki sırayla döndürür."""
+        return [item for item, key in zip(self._rows, self._row_keys) if key in self._checked]
+
+    def set_all_checked(self, checked):
+        """Tüm satırları tek bir bildirimle işaretler veya işaretlerini kaldırır."""
+        self._checked = set(self._row_keys) if checked else set()
+        if self._rows:
+            self.dataChanged.emit(self.index(0, self.CHECK_COLUMN),
+                                  self.index(len(self._rows) - 1, self.CHECK_COLUMN), [Qt.CheckStateRole])
+
+    def remove_items(self, items):
+        """Verilen kayıtların satırlarını kaldırır; ardışık satırlar tek bildirimle silinir."""
+        row_of_key = self._row_index()
+        rows = sorted({row_of_key[key] for key in map(self.item_key, items) if key in row_of_key}, reverse=True)
+        if not rows:
+            return
 
-    def stop(self):
-        self._is_running = False
+        # Sondan başa ardışık aralıklar halinde sil (önceki satır numaraları değişmez)
+        range_end = range_start = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == range_start - 1:
+                range_start = row
+                continue
+            self.beginRemoveRows(QModelIndex(), range_start, range_end)
+            self._checked.difference_update(self._row_keys[range_start:range_end + 1])
+            del self._rows[range_start:range_end + 1]
+            del self._row_keys[range_start:range_end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                range_end = range_start = row
+        self._row_of_key = None
+
+    def _row_index(self):
+        # Anahtar -> satır eşlemesi yalnızca gerektiğinde ve satırlar değiştikten sonra bir kez kurulur
+        if self._row_of_key is None:
+            self._row_of_key = {key: row for row, key in enumerate(self._row_keys)}
+        return self._row_of_key
 
 # ----------------------------------------------------------------------
-# 2. FAKE TRASH YÖNETİM SINIFI (Aynı Kaldı)
+# 2.2 ARKA PLAN KÜÇÜK RESİM YÜKLEYİCİ
 # ----------------------------------------------------------------------
 
-class FakeTrashManager:
-    """Sahte Çöp Kutusu dizinlerini ve metadata dosyasını DİSK BAZLI yönetir."""
+THUMBNAIL_SIZE = 80
+
+# Gömülü önizleme aranacak biçimler: EXIF'li JPEG'ler ve TIFF tabanlı RAW kapsayıcıları
+EMBEDDED_PREVIEW_EXTENSIONS = {".jpg", ".jpeg", ".tif", ".tiff", ".cr2", ".nef", ".arw", ".dng"}
+# Bozuk veya kötü niyetli dosyalarda sonsuz döngüye girmemek için sınırlar
+MAX_TIFF_IFDS = 32
+MAX_TIFF_IFD_ENTRIES = 1024
+MAX_JPEG_MARKERS = 256
+
+# TIFF etiketleri (yalnızca önizleme bulmak için gerekenler; NewSubfileType ve SubIFDs yukarıda)
+TIFF_COMPRESSION = 0x0103
+TIFF_STRIP_OFFSETS = 0x0111
+TIFF_STRIP_BYTE_COUNTS = 0x0117
+TIFF_JPEG_OFFSET = 0x0201
+TIFF_JPEG_LENGTH = 0x0202
+_TIFF_PREVIEW_TAGS = {TIFF_NEW_SUBFILE_TYPE, TIFF_COMPRESSION, TIFF_STRIP_OFFSETS, TIFF_STRIP_BYTE_COUNTS,
+                      TIFF_SUB_IFDS, TIFF_JPEG_OFFSET, TIFF_JPEG_LENGTH}
+# Tamsayı TIFF türleri: SHORT, LONG, IFD -> (bayt, struct biçimi)
+_TIFF_INT_TYPES = {3: (2, "H"), 4: (4, "I"), 13: (4, "I")}
+TIFF_ASCII = 2
+# Marka/model gibi metin etiketleri için üst sınır
+MAX_TIFF_ASCII_LENGTH = 256
+
+def _read_at(file, offset, size):
+    file.seek(offset)
+    return file.read(size)
+
+def _read_tiff_ifd(file, base, byte_order, ifd_offset, file_size, wanted_tags=_TIFF_PREVIEW_TAGS):
+    """Bir TIFF IFD'sinden istenen etiketleri {etiket: [değerler] veya metin} olarak okur.
+
+    Yalnızca wanted_tags içindeki tamsayı ve ASCII etiketler çözülür. Bir sonraki
+    IFD'nin göreli konumuyla birlikte döner; okunamazsa ({}, 0).
+    """
+    header = _read_at(file, base + ifd_offset, 2)
+    if len(header) < 2:
+        return {}, 0
+    (entry_count,) = struct.unpack(byte_order + "H", header)
+    if entry_count > MAX_TIFF_IFD_ENTRIES:
+        return {}, 0
+
+    data = _read_at(file, base + ifd_offset + 2, entry_count * 12 + 4)
+    if len(data) < entry_count * 12 + 4:
+        return {}, 0
+
+    tags = {}
+    for i in range(entry_count):
+        tag, value_type, count, value_field = struct.unpack_from(byte_order + "HHI4s", data, i * 12)
+        if tag not in wanted_tags or count == 0:
+            continue
+        if value_type == TIFF_ASCII and count <= MAX_TIFF_ASCII_LENGTH:
+            item_size, item_format = 1, None
+        elif value_type in _TIFF_INT_TYPES and count <= 64:
+            item_size, item_format = _TIFF_INT_TYPES[value_type]
+        else:
+            continue
+        if item_size * count <= 4:
+            raw = value_field[:item_size * count]
+        else:
+            (value_offset,) = struct.unpack(byte_order + "I", value_field)
+            if base + value_offset + item_size * count > file_size:
+                continue
+            raw = _read_at(file, base + value_offset, item_size * count)
+            if len(raw) < item_size * count:
+                continue
+        if item_format is None:
+            tags[tag] = raw.split(b"\x00", 1)[0].decode("utf-8", "replace").strip()
+        else:
+            tags[tag] = list(struct.unpack(byte_order + item_format * count, raw))
+
+    (next_offset,) = struct.unpack_from(byte_order + "I", data, entry_count * 12)
+    return tags, next_offset
+
+def _tiff_preview_candidates(file, base, file_size):
+    """TIFF yapısındaki (IFD zinciri ve SubIFD'ler) gömülü JPEG aralıklarını döndürür.
+
+    base, TIFF başlığının dosyadaki konumudur (JPEG içindeki EXIF için APP1 verisi,
+    RAW dosyaları için 0). Dönen aralıklar (mutlak konum, uzunluk) çiftleridir.
+    """
+    header = _read_at(file, base, 8)
+    if header[:4] == b"II*\x00":
+        byte_order = "<"
+    elif header[:4] == b"MM\x00*":
+        byte_order = ">"
+    else:
+        return []
+
+    candidates = []
+    pending = [struct.unpack(byte_order + "I", header[4:8])[0]]
+    visited = set()
+    while pending and len(visited) < MAX_TIFF_IFDS:
+        ifd_offset = pending.pop(0)
+        if ifd_offset == 0 or ifd_offset in visited or base + ifd_offset >= file_size:
+            continue
+        visited.add(ifd_offset)
+
+        tags, next_offset = _read_tiff_ifd(file, base, byte_order, ifd_offset, file_size)
+        pending.append(next_offset)
+        pending.extend(tags.get(TIFF_SUB_IFDS, []))
+
+        # EXIF IFD1 / ARW / NEF: JPEGInterchangeFormat etiketleri
+        if TIFF_JPEG_OFFSET in tags and TIFF_JPEG_LENGTH in tags:
+            candidates.append((base + tags[TIFF_JPEG_OFFSET][0], tags[TIFF_JPEG_LENGTH][0]))
+
+        # CR2 IFD0 / DNG önizleme IFD'leri: tek şerit halinde JPEG sıkıştırmalı görüntü.
+        # Ana RAW verisi de (kayıpsız) JPEG olabilir; bunlar SOF kontrolünde elenir.
+        strip_offsets = tags.get(TIFF_STRIP_OFFSETS, [])
+        strip_lengths = tags.get(TIFF_STRIP_BYTE_COUNTS, [])
+        if tags.get(TIFF_COMPRESSION, [0])[0] in (6, 7) and len(strip_offsets) == 1 and len(strip_lengths) == 1:
+            candidates.append((base + strip_offsets[0], strip_lengths[0]))
+
+    return [(offset, length) for offset, length in candidates if length > 0 and offset + length <= file_size]
+
+def _jpeg_frame_size(file, offset, length):
+    """Gömülü JPEG'in SOF başlığını bulup (genişlik, yükseklik) döndürür.
+
+    Qt'nin açabildiği baseline/progressive (SOF0-2) dışındaki kareler (ör. RAW
+    içindeki kayıpsız JPEG) için None döner. Yalnızca işaretçi başlıkları okunur.
+    """
+    segments, _sos_position = _jpeg_header_segments(file, offset, offset + length)
+    for marker, position, _length in segments or ():
+        if marker in (0xC0, 0xC1, 0xC2):
+            frame = _read_at(file, position + 5, 4)
+            if len(frame) < 4:
+                return None
+            height, width = struct.unpack(">HH", frame)
+            return (width, height) if width and height else None
+        if marker in JPEG_SOF_MARKERS:
+            return None # Desteklenmeyen kodlama (kayıpsız, aritmetik ...)
+    return None
 
-    def __init__(self):
-        self.base_config_dir = os.path.join(os.path.expanduser('~'), '.photoagent')
+def _jpeg_exif_tiff_base(file, segments):
+    """_jpeg_header_segments bölümlerinden APP1 'Exif' içindeki TIFF başlığının konumunu döndürür (yoksa None)."""
+    for marker, position, _length in segments or ():
+        if marker == 0xE1 and _read_at(file, position + 4, 6) == b"Exif\x00\x00":
+            return position + 10
+    return None
 
-    def _get_trash_paths(self, filepath):
-        """Dosyanın bulunduğu diske (mount noktasına) göre çöp dizini ve metadata yollarını döndürür."""
-        
-        mount_point = get_mount_point(filepath) 
-        # Program adıyla uyumlu yeni Fake Trash yolu
-        trash_dir = os.path.join(mount_point, '.Photoagent-Trash-1000') 
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
-        
-        return trash_dir, metadata_path
+def read_embedded_preview(file_path, size=THUMBNAIL_SIZE):
+    """Dosyaya gömülü JPEG önizlemeyi (EXIF IFD1 küçük resmi veya RAW önizlemesi) okur.
 
-    def _setup_disk_dirs(self, trash_dir):
-        """Belirtilen diske ait çöp dizinini ve metadata dosyasını oluşturur."""
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
-        try:
-            os.makedirs(trash_dir, exist_ok=True)
-            if not os.path.exists(metadata_path):
-                with open(metadata_path, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4)
-        except Exception as e:
-            print(f"HATA: Disk Bazlı Fake Trash dizinleri oluşturulamadı: {e}")
+    Yalnızca başlıklar ve seçilen önizlemenin bayt aralığı okunur. Uzun kenarı
+    'size' değerine ulaşan en küçük önizleme seçilir; uygun önizleme yoksa None.
+    """
+    if os.path.splitext(file_path)[1].lower() not in EMBEDDED_PREVIEW_EXTENSIONS:
+        return None
 
-    def _load_metadata(self, metadata_path):
-        """Belirtilen metadata dosyasını okur ve JSON listesi döndürür."""
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+    try:
+        with open(file_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            signature = file.read(4)
+            if signature[:2] == b"\xff\xd8":
+                tiff_base = _jpeg_exif_tiff_base(file, _jpeg_header_segments(file)[0])
+                if tiff_base is None:
+                    return None
+            elif signature in (b"II*\x00", b"MM\x00*"):
+                tiff_base = 0
+            else:
+                return None
 
-    def _save_metadata(self, data, metadata_path):
-        """Metadata listesini belirtilen dosyaya yazar."""
-        try:
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"HATA: Metadata yazılamadı: {e}")
-            return False
+            best = None
+            for offset, length in _tiff_preview_candidates(file, tiff_base, file_size):
+                frame_size = _jpeg_frame_size(file, offset, length)
+                if frame_size is None or max(frame_size) < size:
+                    continue
+                if best is None or max(frame_size) < best[0]:
+                    best = (max(frame_size), offset, length)
+
+            if best is None:
+                return None
+            _long_edge, offset, length = best
+            return _read_at(file, offset, length)
+    except (OSError, struct.error):
+        return None
 
-    def move_to_trash(self, filepath, file_size_bytes):
-        """Dosyayı kendi diskindeki FakeTrash'a taşır ve metadata kaydını oluşturur."""
-        original_path = os.path.abspath(filepath)
-        
-        trash_dir, metadata_path = self._get_trash_paths(original_path)
-        self._setup_disk_dirs(trash_dir) 
-        
-        target_filename = os.path.basename(original_path)
-        
-        counter = 0
-        name, ext = os.path.splitext(target_filename)
-        postfix = int(datetime.now().timestamp() * 1000) 
-        trash_filename = f"{name}_{postfix}{ext}"
+def _read_scaled(reader, size):
+    original_size = reader.size()
+    if original_size.isValid() and (original_size.width() > size or original_size.height() > size):
+        reader.setScaledSize(original_size.scaled(size, size, Qt.KeepAspectRatio))
 
-        while os.path.exists(os.path.join(trash_dir, trash_filename)):
-            counter += 1
-            trash_filename = f"{name}_{postfix}_{counter}{ext}"
+    image = reader.read()
+    if image.isNull():
+        return None
 
-        target_path = os.path.join(trash_dir, trash_filename)
-        
-        try:
-            shutil.move(original_path, target_path)
+    # Boyutu başlıktan okunamayan biçimler tam boyutta gelir; burada küçültülür
+    if image.width() > size or image.height() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+def load_scaled_image(file_path, size=THUMBNAIL_SIZE):
+    """Resmi doğrudan küçük boyutta çözer (QImage iş parçacığı güvenlidir).
+
+    Önce dosyaya gömülü önizleme (EXIF küçük resmi, RAW önizlemesi) denenir; yoksa
+    QImageReader.setScaledSize ile JPEG'ler tam çözünürlükte açılmadan, çözücü
+    tarafından okunurken küçültülür. Okunamayan dosyalar için None döner.
+    """
+    preview = read_embedded_preview(file_path, size)
+    if preview is not None:
+        buffer = QBuffer()
+        buffer.setData(QByteArray(preview))
+        buffer.open(QIODevice.ReadOnly)
+        image = _read_scaled(QImageReader(buffer, b"jpeg"), size)
+        buffer.close()
+        if image is not None:
+            return image
+
+    return _read_scaled(QImageReader(file_path), size)
+
+THUMBNAIL_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser('~/.cache'), 'thumbnails')
+THUMBNAIL_NORMAL_SIZE = 128
+THUMBNAIL_LARGE_SIZE = 256
+# Spesifikasyona göre başarısız denemeler uygulamaya özel bir alt dizine yazılır
+THUMBNAIL_FAIL_DIR_NAME = "PhotoAgent-1.0"
+# Boyut sınırı her bu kadar yeni kayıtta bir yeniden kontrol edilir
+THUMBNAIL_EVICT_CHECK_INTERVAL = 64
+# Paylaşılan önbelleğe PhotoAgent'ın yazdığı kayıtların adları (yalnızca bunlar silinebilir)
+THUMBNAIL_INDEX_PATH = os.path.join(os.path.expanduser('~/.photoagent'), 'thumbnails.index')
+
+def file_uri(file_path):
+    """Dosya yolunu freedesktop küçük resim spesifikasyonunun kullandığı file:// URI'sine çevirir.
+
+    Kaçış kuralları GLib'in g_filename_to_uri fonksiyonuyla aynıdır; böylece dosya
+    yöneticilerinin ürettiği önbellek adlarıyla birebir eşleşir.
+    """
+    return "file://" + quote(os.fsencode(os.path.abspath(file_path)), safe="/!$&'()*+,:=@")
+
+class ThumbnailCache:
+    """freedesktop.org küçük resim spesifikasyonuyla uyumlu disk önbelleği.
+
+    Kayıtlar ~/.cache/thumbnails/{normal,large}/<URI'nin MD5'i>.png dosyalarıdır ve
+    Thumb::MTime metniyle doğrulanır; dosya yöneticilerinin ürettikleri doğrudan
+    kullanılır, bizim ürettiklerimiz de onlarla paylaşılır. Okunamayan dosyalar
+    fail/ altına işaretlenir. Boyut sınırı yalnızca bu uygulamanın yazdığı kayıtlar
+    için geçerlidir: adları ayrı bir dizin dosyasında tutulur, sınır aşılınca
+    bunların en uzun süredir kullanılmayanları silinir. Diğer uygulamaların
+    kayıtlarına dokunulmaz. Metotlar iş parçacıkları arasında güvenlidir.
+    """
+
+    def __init__(self, cache_dir=THUMBNAIL_CACHE_DIR, max_bytes=256 * 1024 * 1024, index_path=THUMBNAIL_INDEX_PATH):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_path = index_path
+        # Bizim yazdığımız normal/ kayıtlarının adları; ilk kullanımda dizin dosyasından okunur
+        self._own_entries = None
+        self._normal_dir = os.path.join(cache_dir, "normal")
+        self._large_dir = os.path.join(cache_dir, "large")
+        self._fail_dir = os.path.join(cache_dir, "fail", THUMBNAIL_FAIL_DIR_NAME)
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        self._bytes_estimate = None
+        self._stores_since_check = 0
+        self.counters = {"hits": 0, "misses": 0, "stale": 0, "failed_hits": 0,
+                         "stored": 0, "evicted": 0, "evicted_bytes": 0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.counters[key] += amount
+
+    def stats(self):
+        """Sayaçların bir kopyasını isabet oranıyla birlikte döndürür."""
+        with self._lock:
+            stats = dict(self.counters)
+        lookups = stats["hits"] + stats["failed_hits"] + stats["misses"] + stats["stale"]
+        stats["hit_rate"] = f"{100.0 * (stats['hits'] + stats['failed_hits']) / lookups:.0f}%" if lookups else "-"
+        return stats
+
+    @staticmethod
+    def _entry_name(uri):
+        return hashlib.md5(uri.encode("utf-8")).hexdigest() + ".png"
+
+    def lookup(self, file_path, file_stat):
+        """Geçerli bir kayıt varsa (True, QImage veya None) döndürür; yoksa (False, None).
+
+        None, dosyanın daha önce okunamadığını (fail kaydı) belirtir. Önce normal,
+        ardından large boyutlu kayıtlara bakılır.
+        """
+        if file_path.startswith(self.cache_dir + os.sep):
+            return False, None # Spesifikasyon: önbelleğin kendisi küçük resimlenmez
+
+        uri = file_uri(file_path)
+        name = self._entry_name(uri)
+        mtime = str(int(file_stat.st_mtime))
+        found_stale = False
+
+        for directory in (self._normal_dir, self._large_dir, self._fail_dir):
+            entry_path = os.path.join(directory, name)
+            image = QImage(entry_path)
+            if image.isNull():
+                continue
+            # URI, MD5 çakışmalarına karşı; MTime (ve varsa Size) güncelliğe karşı kontrol edilir
+            if image.text("Thumb::URI") != uri or image.text("Thumb::MTime") != mtime:
+                found_stale = True
+                continue
+            stored_size = image.text("Thumb::Size")
+            if stored_size and stored_size != str(file_stat.st_size):
+                found_stale = True
+                continue
 
-            metadata = self._load_metadata(metadata_path)
-            new_entry = {
-                "trash_filename": trash_filename,
-                "original_path": original_path,
-                "deletion_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "size": format_size(file_size_bytes),
-                "size_bytes": file_size_bytes,
-                "trash_dir": trash_dir 
-            }
-            metadata.append(new_entry)
-            self._save_metadata(metadata, metadata_path)
-            
-            return True
-        except Exception as e:
-            print(f"Taşıma Hatası (Disk Bazlı): {e}")
-            return False
+            try:
+                os.utime(entry_path) # LRU için son kullanım zamanını güncelle
+            except OSError:
+                pass
+            if directory == self._fail_dir:
+                self._count("failed_hits")
+                return True, None
+            self._count("hits")
+            return True, image
+
+        self._count("stale" if found_stale else "misses")
+        return False, None
+
+    def store(self, file_path, file_stat, image):
+        """Küçük resmi normal boyutta (128 px) kaydeder; image None ise fail kaydı yazar."""
+        if file_path.startswith(self.cache_dir + os.sep):
+            return
 
-    def get_trash_files(self):
-        """Bu metot artık kullanılmayacak veya FakeTrashApp tarafından yönetilecek."""
-        raise NotImplementedError("Disk bazlı yönetim nedeniyle bu metot artık DuplicateFinderApp tarafından yönetilmelidir.")
+        uri = file_uri(file_path)
+        if image is None:
+            directory = self._fail_dir
+            image = QImage(1, 1, QImage.Format_ARGB32)
+            image.fill(Qt.transparent)
+        else:
+            directory = self._normal_dir
+            if image.width() > THUMBNAIL_NORMAL_SIZE or image.height() > THUMBNAIL_NORMAL_SIZE:
+                image = image.scaled(THUMBNAIL_NORMAL_SIZE, THUMBNAIL_NORMAL_SIZE,
+                                     Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            else:
+                image = image.copy() # Metin alanları çağıranın nesnesini değiştirmesin
+            image.setText("Thumb::Size", str(file_stat.st_size))
 
-    def restore_file(self, trash_filename, original_path, trash_dir):
-        """Dosyayı FakeTrash'tan orijinal konumuna geri yükler."""
-        trash_file_path = os.path.join(trash_dir, trash_filename)
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
-        
-        if not os.path.exists(trash_file_path):
-            return False 
+        image.setText("Thumb::URI", uri)
+        image.setText("Thumb::MTime", str(int(file_stat.st_mtime)))
+        image.setText("Software", "PhotoAgent")
 
+        entry_path = os.path.join(directory, self._entry_name(uri))
+        # Önce geçici dosyaya yazılıp atomik olarak yeniden adlandırılır (yarım dosya okunmasın)
+        temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            original_dir = os.path.dirname(original_path)
-            os.makedirs(original_dir, exist_ok=True)
+            if not os.path.isdir(directory):
+                # Spesifikasyon: önbellek dizinleri yalnızca kullanıcıya açık (0700) olmalı
+                for parent in (self.cache_dir, os.path.dirname(directory), directory):
+                    os.makedirs(parent, mode=0o700, exist_ok=True)
+            if not image.save(temp_path, "PNG"):
+                return
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, entry_path)
+            entry_size = os.path.getsize(entry_path)
+        except OSError as e:
+            print(f"HATA: Küçük resim önbelleğe yazılamadı {entry_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
 
-            shutil.move(trash_file_path, original_path)
+        with self._lock:
+            if directory == self._normal_dir:
+                self._add_own_entry(os.path.basename(entry_path))
+            self.counters["stored"] += 1
+            self._stores_since_check += 1
+            if self._bytes_estimate is not None:
+                self._bytes_estimate += entry_size
+            needs_check = (self._bytes_estimate is None or self._bytes_estimate > self.max_bytes
+                           or self._stores_since_check >= THUMBNAIL_EVICT_CHECK_INTERVAL)
+        if needs_check:
+            self.evict()
+
+    # --- Bizim yazdığımız kayıtların dizini (self._lock altında çağrılır) ---
+    def _load_own_entries(self):
+        if self._own_entries is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._own_entries = {line.strip() for line in f if line.strip()}
+            except OSError:
+                self._own_entries = set()
+        return self._own_entries
+
+    def _add_own_entry(self, entry_name):
+        own_entries = self._load_own_entries()
+        if entry_name in own_entries:
+            return
+        own_entries.add(entry_name)
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(entry_name + "\n")
+        except OSError as e:
+            print(f"HATA: Küçük resim dizini yazılamadı {self.index_path}: {e}")
+
+    def _rewrite_own_entries(self):
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write("".join(entry_name + "\n" for entry_name in self._own_entries))
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"HATA: Küçük resim dizini yazılamadı {self.index_path}: {e}")
 
-            metadata = self._load_metadata(metadata_path)
-            metadata = [item for item in metadata if not (item["trash_filename"] == trash_filename and item["original_path"] == original_path)]
-            self._save_metadata(metadata, metadata_path)
-            
-            return True
-        except Exception as e:
-            print(f"Geri Yükleme Hatası: {e}")
-            return False
+    def evict(self):
+        """Bizim kayıtlarımız sınırı aşıyorsa en uzun süredir kullanılmayanlarını siler.
 
-    def purge_file(self, trash_filename, original_path, trash_dir):
-        """Dosyayı FakeTrash'tan kalıcı olarak siler (diskten siler)."""
-        trash_file_path = os.path.join(trash_dir, trash_filename)
-        metadata_path = os.path.join(trash_dir, 'trashdata.json')
-        
+        Yalnızca dizindeki kayıtlara stat yapılır. Başka bir uygulamanın aynı adla
+        yeniden ürettiği (Software metni bizim olmayan) kayıtlar silinmez, dizinden çıkarılır.
+        """
+        # Aynı anda yalnızca bir iş parçacığı kayıtları tarar; diğerleri beklemez
+        if not self._evict_lock.acquire(blocking=False):
+            return
         try:
-            if os.path.exists(trash_file_path):
-                os.remove(trash_file_path)
-
-            metadata = self._load_metadata(metadata_path)
-            metadata = [item for item in metadata if not (item["trash_filename"] == trash_filename and item["original_path"] == original_path)]
-            self._save_metadata(metadata, metadata_path)
-            
-            return True
-        except Exception as e:
-            print(f"Kalıcı Silme Hatası: {e}")
-            return False
+            with self._lock:
+                entry_names = list(self._load_own_entries())
+            entries = []
+            total_bytes = 0
+            dropped = set()
+            for entry_name in entry_names:
+                try:
+                    entry_stat = os.stat(os.path.join(self._normal_dir, entry_name))
+                except OSError:
+                    dropped.add(entry_name) # Başka bir uygulama veya kullanıcı silmiş
+                    continue
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry_name))
+                total_bytes += entry_stat.st_size
+
+            evicted = 0
+            evicted_bytes = 0
+            if total_bytes > self.max_bytes:
+                # Sınırın biraz altına inilir ki her yeni kayıtta tekrar silme gerekmesin
+                target_bytes = self.max_bytes * 0.9
+                entries.sort()
+                for _mtime, entry_size, entry_name in entries:
+                    if total_bytes <= target_bytes:
+                        break
+                    entry_path = os.path.join(self._normal_dir, entry_name)
+                    # Yalnızca başlık okunur; görüntü çözülmez
+                    if QImageReader(entry_path).text("Software") == "PhotoAgent":
+                        try:
+                            os.remove(entry_path)
+                        except OSError:
+                            continue
+                        evicted += 1
+                        evicted_bytes += entry_size
+                    dropped.add(entry_name)
+                    total_bytes -= entry_size
+
+            with self._lock:
+                if dropped:
+                    self._own_entries -= dropped
+                    self._rewrite_own_entries()
+                self._bytes_estimate = total_bytes
+                self._stores_since_check = 0
+                self.counters["evicted"] += evicted
+                self.counters["evicted_bytes"] += evicted_bytes
+            if evicted:
+                _debug_dump("thumbnail_cache", self.stats())
+        finally:
+            self._evict_lock.release()
+
+def file_stamp(file_path):
+    """Önbellek geçerliliği için dosyanın (mtime_ns, boyut) damgası; dosya yoksa None."""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+class PixmapCache:
+    """Küçük resim ikonları için bayt bütçeli, en uzun süredir kullanılmayanı atan (LRU) önbellek.
+
+    Kayıtlar yol anahtarıyla ve (mtime_ns, boyut) damgasıyla tutulur. Damga her
+    erişimde değil, en fazla revalidate_interval saniyede bir diskten kontrol
+    edilir; dosya değişmişse kayıt geçersiz sayılıp atılır. Yalnızca GUI iş
+    parçacığından kullanılır.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, revalidate_interval=5.0):
+        self.max_bytes = max_bytes
+        self.revalidate_interval = revalidate_interval
+        self._entries = OrderedDict() # yol -> [damga, ikon, bayt, son kontrol zamanı]
+        self.total_bytes = 0
+        self.counters = {"hits": 0, "misses": 0, "invalidated": 0, "evictions": 0}
+
+    @staticmethod
+    def pixmap_cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, file_path):
+        entry = self._entries.get(file_path)
+        if entry is None:
+            self.counters["misses"] += 1
+            return None
+
+        now = time.monotonic()
+        if now - entry[3] >= self.revalidate_interval:
+            if file_stamp(file_path) != entry[0]:
+                self._remove(file_path)
+                self.counters["invalidated"] += 1
+                self.counters["misses"] += 1
+                return None
+            entry[3] = now
+
+        self._entries.move_to_end(file_path)
+        self.counters["hits"] += 1
+        return entry[1]
+
+    def put(self, file_path, stamp, pixmap):
+        """Pixmap'i ikon olarak ekler ve bütçe aşıldıysa en eski kayıtları atar."""
+        if file_path in self._entries:
+            self._remove(file_path)
+
+        icon = QIcon(pixmap)
+        cost = self.pixmap_cost(pixmap)
+        self._entries[file_path] = [stamp, icon, cost, time.monotonic()]
+        self.total_bytes += cost
+
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _path, (_stamp, _icon, evicted_cost, _checked) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_cost
+            self.counters["evictions"] += 1
+        return icon
+
+    def _remove(self, file_path):
+        self.total_bytes -= self._entries.pop(file_path)[2]
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        stats = dict(self.counters)
+        stats["entries"] = len(self._entries)
+        stats["used_bytes"] = self.total_bytes
+        stats["budget_bytes"] = self.max_bytes
+        return stats
+
+class _ThumbnailSignals(QObject):
+    # (dosya yolu, istek no, (QImage veya None, dosya damgası))
+    finished = Signal(str, int, object)
+
+class _ThumbnailTask(QRunnable):
+    """Tek bir küçük resmi havuzdaki bir iş parçacığında çözer."""
+
+    def __init__(self, loader, file_path, request_id):
+        super().__init__()
+        self._loader = loader
+        self._file_path = file_path
+        self._request_id = request_id
 
+    def run(self):
+        # Kuyrukta beklerken iptal edilen istekler hiç çözülmez
+        if not self._loader.is_wanted(self._file_path, self._request_id):
+            return
+        try:
+            file_stat = os.stat(self._file_path)
+        except OSError:
+            self._loader.signals.finished.emit(self._file_path, self._request_id, (None, None))
+            return
+        try:
+            image = self._load(file_stat)
+        except Exception:
+            image = None
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        self._loader.signals.finished.emit(self._file_path, self._request_id, (image, stamp))
+
+    def _load(self, file_stat):
+        size = self._loader.size
+        cache = self._loader.cache
+        if cache is None:
+            return load_scaled_image(self._file_path, size)
+
+        found, image = cache.lookup(self._file_path, file_stat)
+        if not found:
+            # Önbellek için normal boyutta çözülür; gösterim boyutuna aşağıda küçültülür
+            image = load_scaled_image(self._file_path, max(size, THUMBNAIL_NORMAL_SIZE))
+            cache.store(self._file_path, file_stat, image)
+
+        if image is not None and (image.width() > size or image.height() > size):
+            image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+class ThumbnailLoader(QObject):
+    """Küçük resimleri GUI iş parçacığını bloklamadan, öncelik sırasıyla yükler.
+
+    Son istenen (yani şu an ekranda görünen) satırlar havuzda en yüksek önceliği
+    alır. Görünümden çıkan satırların istekleri iptal edilebilir; sonuç
+    thumbnail_ready sinyaliyle GUI iş parçacığına gelir (başarısızsa boş QImage);
+    yanında okunduğu andaki dosya damgası (mtime_ns, boyut) da gönderilir.
+    """
+
+    thumbnail_ready = Signal(str, QImage, object)
+
+    def __init__(self, size=THUMBNAIL_SIZE, cache=None, parent=None):
+        super().__init__(parent)
+        self.size = size
+        # ThumbnailCache (isteğe bağlı): küçük resimler diskten paylaşımlı önbellekten gelir
+        self.cache = cache
+        self.signals = _ThumbnailSignals(self)
+        self.signals.finished.connect(self._on_task_finished)
+        self._pool = QThreadPool(self)
+        self._wanted = {}
+        self._next_request_id = 0
+
+    def is_wanted(self, file_path, request_id):
+        return self._wanted.get(file_path) == request_id
+
+    def request(self, file_path):
+        """Yolu kuyruğa alır; zaten bekleyen bir istek varsa önceliğini yükseltir."""
+        if not self._wanted:
+            self._next_request_id = 0
+        self._next_request_id += 1
+        request_id = self._next_request_id
+
+        # Eski istek (varsa) kuyrukta kalır ama is_wanted ile boşa çıkar
+        self._wanted[file_path] = request_id
+        self._pool.start(_ThumbnailTask(self, file_path, request_id), min(request_id, 2**31 - 1))
+
+    def is_pending(self, file_path):
+        return file_path in self._wanted
+
+    def retain_only(self, file_paths):
+        """Verilen yollar dışındaki bekleyen istekleri iptal eder."""
+        for file_path in [path for path in self._wanted if path not in file_paths]:
+            del self._wanted[file_path]
+
+    def cancel_all(self):
+        self._wanted.clear()
+
+    @Slot(str, int, object)
+    def _on_task_finished(self, file_path, request_id, result):
+        if self._wanted.get(file_path) != request_id:
+            return
+        del self._wanted[file_path]
+        image, stamp = result
+        self.thumbnail_ready.emit(file_path, image if image is not None else QImage(), stamp)
 
 # ----------------------------------------------------------------------
 # 3. ANA PENCERE (PhotoFinderApp)
@@ -606,8 +4397,6 @@ class FakeTrashManager:
 
 class PhotoFinderApp(QMainWindow):
 
-    GROUP_COLORS = [QColor("#3cb5ff"), QColor("#d7b981")] # Renkler koyu temaya uygun (açık mavi, kahverengi)
-
     def __init__(self):
         global CURRENT_LANG
         super().__init__()
@@ -615,10 +4404,26 @@ class PhotoFinderApp(QMainWindow):
         self.icon_path = _find_icon_path()
         self.trash_manager = FakeTrashManager() 
         self.duplicate_data = [] 
+
+        # Küçük resimler arka planda yüklenir; hazır olana kadar yer tutucu gösterilir
+        performance = load_performance_settings()
+        thumbnail_cache = None
+        if performance["thumbnail_cache"]:
+            thumbnail_cache = ThumbnailCache(max_bytes=performance["thumbnail_cache_max_mb"] * 1024 * 1024)
+        self.thumbnail_loader = ThumbnailLoader(THUMBNAIL_SIZE, thumbnail_cache, self)
+        self._last_scan_stats = {}
+        self._stats_tooltip_time = 0.0
+        self._stats_tooltip_pending = False
+        self.pixmap_cache = PixmapCache(performance["pixmap_cache_mb"] * 1024 * 1024)
+        # Çöp kutusu sekmesi için dosya türü ikonları uzantıya göre bir kez üretilir
+        self._icon_provider = QFileIconProvider()
+        self._file_type_icons = {}
+        self._thumbnail_placeholder = self._icon_provider.icon(QFileIconProvider.File)
         
         # Daha minimalist bir boyut
         self.setGeometry(100, 100, 850, 650) 
         self.worker_thread = None
+        self.trash_worker = None
 
         if self.icon_path:
             self.setWindowIcon(QIcon(self.icon_path))
@@ -653,24 +4458,14 @@ class PhotoFinderApp(QMainWindow):
 
     # <<< YARDIMCI METOT: DOSYA İKONUNU GETİRME (Aynı Kaldı) >>>
     def _get_file_icon(self, file_path):
-        """Dosya yoluna göre sistemin varsayılan dosya ikonunu döndürür."""
-        file_info = QFileInfo(file_path)
-        provider = QFileIconProvider()
-        return provider.icon(file_info)
-
-    # <<< YENİ METOT: THUMBNAIL OLUŞTURMA (Aynı Kaldı) >>>
-    def _create_thumbnail(self, file_path, size=80): # DEFAULT BOYUT 80'E DÜŞÜRÜLDÜ
-        """Dosya yolundan QPixmap oluşturur ve yeniden boyutlandırır."""
-        try:
-            pixmap = QPixmap(file_path)
-            if pixmap.isNull():
-                return self._get_file_icon(file_path).pixmap(size, size) 
-                
-            return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        except Exception:
-            # Hata durumunda (e.g., dosya kilitli) varsayılan ikon
-            return self._get_file_icon(file_path).pixmap(size, size) 
-    # <<< YENİ METOT SONU >>>
+        """Dosya yoluna göre sistemin varsayılan dosya ikonunu döndürür (uzantı başına bir kez üretilir)."""
+        suffix = os.path.splitext(file_path)[1].lower()
+        icon = self._file_type_icons.get(suffix)
+        if icon is None:
+            icon = self._icon_provider.icon(QFileInfo(file_path))
+            self._file_type_icons[suffix] = icon
+        return icon
+
 
 
     @Slot()
@@ -705,9 +4500,14 @@ class PhotoFinderApp(QMainWindow):
             
             # Sonuçlar Listesi
             self.found_label.setText(get_text("found_duplicates", lang))
+            self.sort_label.setText(get_text("sort_label", lang))
+            for index, sort_key in enumerate(DuplicateResultsModel.SORT_KEYS):
+                self.sort_combo.setItemText(index, get_text(f"sort_{sort_key}", lang))
             
             # Tarama/Silme Butonları (Sonuçlar sekmesinde)
             self.delete_button.setText(get_text("delete_selected", lang))
+            self.auto_mark_button.setText(get_text("auto_mark", lang))
+            self.auto_mark_button.setToolTip(get_text("auto_mark_tooltip", lang))
             # Delete butonunun rengi QSS tarafından yönetilir.
             self.delete_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; min-height: 35px;") 
 
@@ -743,13 +4543,21 @@ class PhotoFinderApp(QMainWindow):
             self.language_button.setText(get_text("language", lang))
             self.about_button.setText(get_text("about", lang))
 
+            self.similar_checkbox.setText(get_text("similar_mode", lang))
+            self.similar_checkbox.setToolTip(get_text("similar_mode_tooltip" if np is not None else "similar_mode_unavailable", lang))
+            self.ignore_metadata_checkbox.setText(get_text("ignore_metadata_mode", lang))
+            self.ignore_metadata_checkbox.setToolTip(get_text("ignore_metadata_tooltip", lang))
+            self.pixel_checkbox.setText(get_text("pixel_mode", lang))
+            self.pixel_checkbox.setToolTip(get_text("pixel_mode_tooltip", lang))
+
             # Fake Trash Tablosu
             # KRİTİK: Tablo başlıkları güncellenmeli.
-            self.trash_table.setHorizontalHeaderLabels(["", get_text("trash_col_file", lang), get_text("trash_col_original_path", lang), get_text("trash_col_deletion_date", lang)])
+            self.trash_model.retranslate()
             self.restore_button.setText(get_text("trash_restore", lang))
             self.purge_button.setText(get_text("trash_purge", lang))
             self.select_all_trash_button.setText(get_text("select_all", lang))
             self.unselect_all_trash_button.setText(get_text("unselect_all", lang))
+            self.cancel_trash_button.setText(get_text("cancel_operation", lang))
 
 
             current_status = self.status_label.text()
@@ -888,17 +4696,47 @@ class PhotoFinderApp(QMainWindow):
         scan_results_page = QWidget()
         results_layout = QVBoxLayout(scan_results_page)
         self.found_label = QLabel()
+
+        # Grup içindeki kopyaları başlık bilgilerine göre sırala (metinler _update_gui_texts'te)
+        self.sort_label = QLabel()
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems(DuplicateResultsModel.SORT_KEYS)
+        results_header_layout = QHBoxLayout()
+        results_header_layout.addWidget(self.found_label)
+        results_header_layout.addStretch(1)
+        results_header_layout.addWidget(self.sort_label)
+        results_header_layout.addWidget(self.sort_combo)
         
-        # QListWidget
-        self.results_list = QListWidget() 
-        self.results_list.setViewMode(QListWidget.ListMode)      
-        self.results_list.setResizeMode(QListWidget.Adjust)
-        self.results_list.setIconSize(QSize(80, 80))             
+        # QListView + DuplicateResultsModel: satırlar sanal, yalnızca görünenler çizilir
+        self.results_model = DuplicateResultsModel(self._result_thumbnail, self)
+        self.results_list = QListView() 
+        self.results_list.setModel(self.results_model)
+        self.results_list.setViewMode(QListView.ListMode)      
+        self.results_list.setResizeMode(QListView.Adjust)
+        self.results_list.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))             
         self.results_list.setSelectionMode(QAbstractItemView.ExtendedSelection) 
         self.results_list.setSpacing(5)                          
+        # Tüm satırlar aynı yükseklikte: görünüm her satırı tek tek ölçmez
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(500)
         
         # Scan/Rescan butonu ve Delete butonu için yatay düzen
         action_buttons_layout = QHBoxLayout()
+
+        # Benzer görsel modu: bayt eşitliği yerine algısal hash ile gruplar (NumPy gerekir)
+        self.similar_checkbox = QCheckBox()
+        self.similar_checkbox.setEnabled(np is not None)
+        action_buttons_layout.addWidget(self.similar_checkbox)
+        # Yalnızca EXIF/XMP gibi meta verisi farklı JPEG/PNG kopyalarını da eşleştir
+        self.ignore_metadata_checkbox = QCheckBox()
+        action_buttons_layout.addWidget(self.ignore_metadata_checkbox)
+        # Piksel eşitliği modu: farklı biçimde kaydedilmiş aynı görselleri çözerek karşılaştırır
+        self.pixel_checkbox = QCheckBox()
+        action_buttons_layout.addWidget(self.pixel_checkbox)
+        # Benzer ve piksel modları ayrı tarama motorlarıdır; aynı anda yalnızca biri seçilebilir
+        self.similar_checkbox.toggled.connect(lambda checked: checked and self.pixel_checkbox.setChecked(False))
+        self.pixel_checkbox.toggled.connect(lambda checked: checked and self.similar_checkbox.setChecked(False))
         action_buttons_layout.addStretch(1) # Butonları sağa yaslamak için
 
         # 1. Scan/Rescan Butonu 
@@ -906,6 +4744,12 @@ class PhotoFinderApp(QMainWindow):
         self.start_button.setMinimumHeight(35)
         self.start_button.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
         
+        # Otomatik işaretleme: her gruptan kurallara göre bir kopya tutup diğerlerini işaretler
+        self.auto_mark_button = QPushButton()
+        self.auto_mark_button.setEnabled(False)
+        self.auto_mark_button.setMinimumHeight(35)
+        self.auto_mark_button.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
+
         # 2. Sahte Çöpe Gönder butonu 
         self.delete_button = QPushButton()
         self.delete_button.setEnabled(False)
@@ -914,19 +4758,21 @@ class PhotoFinderApp(QMainWindow):
         self.delete_button.setStyleSheet("background-color: #f44336; color: white; font-weight: bold; min-height: 35px;")
 
         action_buttons_layout.addWidget(self.start_button)
+        action_buttons_layout.addWidget(self.auto_mark_button)
         action_buttons_layout.addWidget(self.delete_button)
 
-        results_layout.addWidget(self.found_label)
+        results_layout.addLayout(results_header_layout)
         results_layout.addWidget(self.results_list) 
         results_layout.addLayout(action_buttons_layout) # Yatay düzeni ekle
         
         # 2.2 FAKE TRASH SEKME İÇERİĞİ (Aynı kaldı)
         fake_trash_page = QWidget()
         trash_layout = QVBoxLayout(fake_trash_page)
-        self.trash_table = QTableWidget()
-        self.trash_table.setColumnCount(4)
-        # Başlıklar _update_gui_texts'te ayarlanacak
-        self.trash_table.setHorizontalHeaderLabels(["", get_text("trash_col_file"), get_text("trash_col_original_path"), get_text("trash_col_deletion_date")])
+        # Sanal tablo: satırlar ve ikonlar yalnızca görünür oldukça üretilir
+        self.trash_model = TrashTableModel(self.trash_manager, self._get_file_icon, self)
+        self.trash_table = QTableView()
+        self.trash_table.setModel(self.trash_model)
+        # Başlıklar modelden okunur; dil değişince _update_gui_texts yeniler
         self.trash_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.trash_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.trash_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
@@ -978,6 +4824,12 @@ class PhotoFinderApp(QMainWindow):
 
         progress_bar_layout.addWidget(self.progress_bar)
 
+        # Çöp işlemleri sürerken görünen iptal düğmesi
+        self.cancel_trash_button = QPushButton()
+        self.cancel_trash_button.setStyleSheet("background-color: #FFA500; color: white; font-weight: bold;")
+        self.cancel_trash_button.setVisible(False)
+        progress_bar_layout.addWidget(self.cancel_trash_button)
+
         status_layout.addLayout(status_label_layout)
         status_layout.addLayout(progress_bar_layout)
         
@@ -993,18 +4845,24 @@ class PhotoFinderApp(QMainWindow):
     def _connect_signals(self):
         self.start_button.clicked.connect(self._start_scan)
         self.delete_button.clicked.connect(self._delete_files_to_fake_trash) 
+        self.auto_mark_button.clicked.connect(self._show_auto_mark_menu)
         self.language_button.clicked.connect(self._show_language_menu) # DİL BAĞLANTISI
         self.about_button.clicked.connect(self._show_about)
-        self.results_list.itemDoubleClicked.connect(self._handle_list_double_click) 
+        self.results_list.doubleClicked.connect(self._handle_list_double_click) 
+        self.results_list.verticalScrollBar().valueChanged.connect(self._cancel_offscreen_thumbnails)
+        self.thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self.sort_combo.currentIndexChanged.connect(
+            lambda index: self.results_model.sort_files(DuplicateResultsModel.SORT_KEYS[index]))
         
         # Fake Trash Sekmesi
         self.tab_widget.currentChanged.connect(self._handle_tab_change)
         self.restore_button.clicked.connect(self._restore_selected_files)
         self.purge_button.clicked.connect(self._purge_selected_files)
+        self.cancel_trash_button.clicked.connect(self._cancel_trash_operation)
         self.select_all_trash_button.clicked.connect(self._select_all_trash_files) 
         self.unselect_all_trash_button.clicked.connect(self._unselect_all_trash_files) 
         
-        self.trash_table.cellDoubleClicked.connect(self._handle_trash_double_click)
+        self.trash_table.doubleClicked.connect(self._handle_trash_double_click)
 
     @Slot(int)
     def _handle_tab_change(self, index):
@@ -1012,11 +4870,11 @@ class PhotoFinderApp(QMainWindow):
         if self.tab_widget.tabText(index) == get_text("tab_trash"):
             self.update_trash_tab()
 
-    @Slot(QListWidgetItem)
-    def _handle_list_double_click(self, item):
+    @Slot(QModelIndex)
+    def _handle_list_double_click(self, index):
         """Tarama Sonuçları listesinde çift tıklama (Klasörü açar)."""
         try:
-            full_path = item.data(Qt.UserRole)
+            full_path = index.data(DuplicateResultsModel.PathRole)
             if not full_path: return
             
             folder_path = os.path.dirname(full_path).rstrip(os.path.sep)
@@ -1032,15 +4890,13 @@ class PhotoFinderApp(QMainWindow):
         except Exception as e:
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_error_general")}: {get_text("status_error_double_click")}. ({e})')
             
-    @Slot(int, int)
-    def _handle_trash_double_click(self, row, column):
+    @Slot(QModelIndex)
+    def _handle_trash_double_click(self, index):
         """Fake Trash tablosunda çift tıklama (Orijinal Klasör Yolu açılır)."""
         try:
-            if column == 2: # Orijinal Yol sütunu
-                original_path_item = self.trash_table.item(row, 2)
-                if not original_path_item: return
-
-                original_path = original_path_item.text()
+            if index.column() == TrashTableModel.ORIGINAL_PATH_COLUMN:
+                original_path = self.trash_model.item(index.row()).get("original_path", "")
+                if not original_path: return
                 
                 folder_path_to_open = os.path.dirname(original_path).rstrip(os.path.sep)
 
@@ -1108,12 +4964,18 @@ class PhotoFinderApp(QMainWindow):
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_canceled")}')
             return
 
+        # Çöp işlemi sürerken yeni tarama başlatılmaz (taşınmakta olan dosyalar taranırdı)
+        if self.trash_worker is not None:
+            return
+
         # Minimalist sürümde ayarlar sabit: MD5 + Boyut eşleşmesi. Sadece Görsel dosyalar.
         match_options = {
             "content": True, 
             "size": True,    
             "name": False,
             "extension": False,
+            # JPEG/PNG'de yalnızca sıkıştırılmış görüntü verisini karşılaştır (EXIF/XMP yok sayılır)
+            "ignore_metadata": self.ignore_metadata_checkbox.isChecked(),
         }
 
         # Gizli/Sistem dosyalarını yoksayma varsayılan olarak TRUE
@@ -1129,7 +4991,11 @@ class PhotoFinderApp(QMainWindow):
             "custom": False, "custom_extensions": ""
         }
 
-        options = {"match": match_options, "ignore": ignore_options, "filter": filter_options}
+        # Motor ayarları settings.ini -> [PERFORMANCE] bölümünden okunur
+        performance_options = load_performance_settings()
+
+        options = {"match": match_options, "ignore": ignore_options, "filter": filter_options,
+                   "performance": performance_options}
 
         target_dir = self.dir_input.text().strip()
         if not target_dir or not os.path.exists(target_dir):
@@ -1138,16 +5004,26 @@ class PhotoFinderApp(QMainWindow):
             
         target_dirs = [target_dir]
 
-        self.results_list.clear() 
+        self.results_model.set_groups([]) 
+        self.thumbnail_loader.cancel_all()
+        self.duplicate_data = []
         self.progress_bar.setValue(0)
         self.delete_button.setEnabled(False)
+        self.auto_mark_button.setEnabled(False)
         self.start_button.setText(get_text("cancel_scan"))
         self.start_button.setStyleSheet("background-color: #FFA500; color: white; font-weight: bold; min-height: 35px;")
 
-        self.worker_thread = WorkerThread(target_dirs, options)
+        if self.similar_checkbox.isChecked():
+            self.worker_thread = SimilarityWorkerThread(target_dirs, options)
+        elif self.pixel_checkbox.isChecked():
+            self.worker_thread = PixelIdentityWorkerThread(target_dirs, options)
+        else:
+            self.worker_thread = WorkerThread(target_dirs, options)
         self.worker_thread.progress_updated.connect(self._update_progress)
         self.worker_thread.status_message.connect(self._update_status)
+        self.worker_thread.groups_found.connect(self._append_results)
         self.worker_thread.scan_finished.connect(self._display_results)
+        self.worker_thread.stats_updated.connect(self._show_scan_stats)
         self.worker_thread.finished.connect(self._scan_finished_cleanup)
         self.worker_thread.start()
 
@@ -1161,109 +5037,149 @@ class PhotoFinderApp(QMainWindow):
         # get_text("status_prefix") eklenir.
         self.status_label.setText(f'{get_text("status_prefix")}: {message.split(":", 1)[1].strip() if ":" in message else message}')
 
+    @Slot(dict)
+    def _show_scan_stats(self, stats):
+        """Son taramanın aşama sayaçlarını durum etiketinin ipucunda gösterir."""
+        self._last_scan_stats = stats
+        self._refresh_stats_tooltip()
+
+    def _refresh_stats_tooltip(self):
+        self._stats_tooltip_pending = False
+        stats = dict(self._last_scan_stats)
+        stats["pixmap_cache"] = self.pixmap_cache.stats()
+        if self.thumbnail_loader.cache is not None:
+            stats["thumbnail_cache"] = self.thumbnail_loader.cache.stats()
+        self._stats_tooltip_time = time.monotonic()
+        self.status_label.setToolTip(format_stats(stats))
+
     @Slot()
     def _scan_finished_cleanup(self):
+        self.start_button.setEnabled(self.trash_worker is None)
         self.start_button.setText(get_text("rescan"))
         self.start_button.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold; min-height: 35px;")
 
+    @Slot(list)
+    def _append_results(self, duplicate_groups):
+        """Akış modunda, tarama sürerken kesinleşen kopya gruplarını listeye ekler."""
+        self.results_model.append_groups(duplicate_groups)
+        self.duplicate_data.extend(duplicate_groups)
+        self._update_found_label()
+        # Arka planda çöp işlemi sürerken ikinci bir işlem başlatılamaz
+        can_delete = self.results_model.rowCount() > 0 and self.trash_worker is None
+        self.delete_button.setEnabled(can_delete)
+        self.auto_mark_button.setEnabled(can_delete)
+
     @Slot(list)
     def _display_results(self, duplicate_groups):
         
-        self.results_list.clear()
+        # Akış modunda gruplar zaten eklendi; değilse (veya eksikse) modeli baştan kur.
+        if len(self.duplicate_data) != len(duplicate_groups):
+            self.results_model.set_groups(duplicate_groups)
         self.duplicate_data = duplicate_groups 
         
+        self._update_found_label()
+
+        is_any_file = self.results_model.rowCount() > 0 and self.trash_worker is None
+        self.delete_button.setEnabled(is_any_file)
+        self.auto_mark_button.setEnabled(is_any_file)
+        self.tab_widget.setCurrentIndex(0) 
+
+    def _update_found_label(self):
+        duplicate_groups = self.duplicate_data
         total_files_found = sum(len(group['files']) for group in duplicate_groups)
         total_duplicates = total_files_found - len(duplicate_groups)
 
-        self.found_label.setText(get_text("found_duplicates").format(len(duplicate_groups), total_duplicates))
-        
-        # BELLEK TÜKETİMİNİ ENGELLEMEK İÇİN LİMİT (2000 dosya/öğe)
-        MAX_DISPLAY_ITEMS = 2000
-        items_displayed_count = 0
-        
-        for group_index, group in enumerate(duplicate_groups):
-            group_color = self.GROUP_COLORS[group_index % len(self.GROUP_COLORS)]
+        reclaimable_bytes = sum(group.get("reclaimable_bytes", group["size_bytes"] * (len(group["files"]) - 1)) for group in duplicate_groups)
+        self.found_label.setText(get_text("found_duplicates").format(len(duplicate_groups), total_duplicates)
+                                 + " " + get_text("found_reclaimable").format(format_size(reclaimable_bytes)))
 
-            for file_index, file_path in enumerate(group["files"]):
-                
-                if items_displayed_count >= MAX_DISPLAY_ITEMS:
-                    break # Sınır aşıldı, iç döngüyü kır.
-                
-                # 1. Gerekli verileri al
-                file_name = os.path.basename(file_path)
-                # folder_path = os.path.dirname(file_path) 
-                
-                # 2. Thumbnail ve İkon oluştur
-                thumbnail = self._create_thumbnail(file_path, size=80) 
-                list_item = QListWidgetItem()
-                list_item.setIcon(QIcon(thumbnail))
-                
-                # Açıklama metni (Dosya adı, boyut, yol ve HASH)
-                item_text = f"{file_name}\n({group['size']})\n{os.path.dirname(file_path)}\nHash: {group['hash']}"
-                list_item.setText(item_text)
-                list_item.setToolTip(f"{file_name}\n{os.path.dirname(file_path)}\nHash: {group['hash']}")
-                
-                # 3. Öğeye özel verileri sakla 
-                list_item.setData(Qt.UserRole, file_path)        # Tam yolu sakla
-                list_item.setData(Qt.UserRole + 1, group["size_bytes"]) # Boyut (bytes)
-                list_item.setData(Qt.UserRole + 2, group["hash"])       # Hash
-                
-                # 4. Arka plan rengini ayarla
-                list_item.setBackground(QBrush(group_color))
+    def _result_thumbnail(self, file_path):
+        """Sonuç modelinin görünür satırlar için istediği küçük resim.
 
-                # Tüm öğeler seçilebilir ve işaretlenebilir olmalı
-                list_item.setFlags(list_item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsSelectable)
-                
-                # 5. Checkbox durumunu ayarla: Tümü işaretsiz 
-                list_item.setCheckState(Qt.CheckState.Unchecked) 
-                
+        Hazır değilse arka planda yüklemeyi başlatır ve yer tutucu ikon döndürür.
+        """
+        # Yüklemesi sürenler önbellek sayaçlarını şişirmesin diye önce bekleyenlere bakılır
+        if self.thumbnail_loader.is_pending(file_path):
+            return self._thumbnail_placeholder
+        icon = self.pixmap_cache.get(file_path)
+        if icon is not None:
+            return icon
+        self.thumbnail_loader.request(file_path)
+        return self._thumbnail_placeholder
+
+    @Slot(str, QImage, object)
+    def _on_thumbnail_ready(self, file_path, image, stamp):
+        # QPixmap yalnızca GUI iş parçacığında oluşturulabilir
+        if image.isNull():
+            pixmap = self._get_file_icon(file_path).pixmap(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        else:
+            pixmap = QPixmap.fromImage(image)
+        self.pixmap_cache.put(file_path, stamp, pixmap)
+        self.results_model.refresh_path(file_path)
 
-                self.results_list.addItem(list_item)
-                items_displayed_count += 1
-            
-            if items_displayed_count >= MAX_DISPLAY_ITEMS:
-                break # Sınır aşıldı, dış döngüyü kır.
-
-        # UYARI MESAJI
-        if items_displayed_count < total_files_found:
-            QMessageBox.warning(
-                self, 
-                get_text("warning_title"), 
-                get_text("warning_too_many_results").format(MAX_DISPLAY_ITEMS, total_files_found)
-            )
-
-        is_any_file = self.results_list.count() > 0
-        self.delete_button.setEnabled(is_any_file)
-        self.tab_widget.setCurrentIndex(0) 
+        # Önbellek sayaçları ipucunda en fazla saniyede bir güncellenir; son durum gecikmeli yazılır
+        if not self._stats_tooltip_pending:
+            self._stats_tooltip_pending = True
+            delay = max(0, int((self._stats_tooltip_time + 1.0 - time.monotonic()) * 1000))
+            QTimer.singleShot(delay, self._refresh_stats_tooltip)
+
+    @Slot(int)
+    def _cancel_offscreen_thumbnails(self, _value):
+        """Kaydırma sonrası artık görünmeyen satırların bekleyen yüklemelerini iptal eder."""
+        viewport = self.results_list.viewport()
+        top_index = self.results_list.indexAt(QPoint(0, 0))
+        if not top_index.isValid():
+            return
+        bottom_index = self.results_list.indexAt(QPoint(0, viewport.height() - 1))
+        last_row = bottom_index.row() if bottom_index.isValid() else self.results_model.rowCount() - 1
+
+        visible_paths = {self.results_model.path_at(row) for row in range(top_index.row(), last_row + 1)}
+        self.thumbnail_loader.retain_only(visible_paths)
+
+    def _show_auto_mark_menu(self):
+        """Otomatik işaretleme menüsünü açar ve seçilen kuralları tüm gruplara uygular."""
+        settings = load_automark_settings()
+        menu = QMenu(self)
+        menu.setToolTipsVisible(True)
+
+        rules_action = menu.addAction(get_text("auto_mark_rules"))
+        rules_action.setData(settings["rules"])
+        rules_action.setEnabled(bool(settings["rules"]))
+        menu.addSeparator()
+        for rule in AUTOMARK_RULES:
+            action = menu.addAction(get_text(f"auto_mark_{rule}"))
+            # Seçilen kural önce uygulanır; ayarlardaki diğer kurallar eşitlikleri bozar
+            action.setData([rule] + [other for other in settings["rules"] if other != rule])
+            if rule == "priority" and not settings["priority_prefixes"]:
+                action.setEnabled(False)
+                action.setToolTip(get_text("auto_mark_priority_unset"))
+        menu.addSeparator()
+        clear_action = menu.addAction(get_text("auto_mark_clear"))
+
+        action = menu.exec(self.auto_mark_button.mapToGlobal(self.auto_mark_button.rect().bottomLeft()))
+        if action is None:
+            return
+        if action is clear_action:
+            self.results_model.set_checked_paths([])
+            return
+
+        marked_count, group_count = self.results_model.auto_mark(action.data(), settings["priority_prefixes"])
+        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("auto_mark_done").format(marked_count, group_count)}')
 
     def _remove_deleted_rows(self, deleted_files_paths):
         
-        deleted_set = set(deleted_files_paths)
-        
-        for i in range(self.results_list.count() - 1, -1, -1):
-            item = self.results_list.item(i)
-            full_path = item.data(Qt.UserRole)
-            
-            if full_path in deleted_set:
-                self.results_list.takeItem(i)
+        self.results_model.remove_paths(deleted_files_paths)
 
-        if self.results_list.count() == 0:
+        if self.results_model.rowCount() == 0:
             self.delete_button.setEnabled(False)
+            self.auto_mark_button.setEnabled(False)
             
     # <<< FAKE TRASH KULLANIMI (Aynı Kaldı) >>>
     @Slot()
     def _delete_files_to_fake_trash(self):
         """Seçilen dosyaları Sahte Çöp Kutusu'na taşır."""
-        selected_files = []
-        
-        # QListWidget'taki işaretli öğeleri al
-        for i in range(self.results_list.count()):
-            item = self.results_list.item(i)
-            # Yalnızca işaretli ve kullanıcı tarafından işaretlenebilir olanlar dikkate alınır
-            if (item.flags() & Qt.ItemIsUserCheckable) and item.checkState() == Qt.CheckState.Checked:
-                full_path = item.data(Qt.UserRole)
-                size_bytes = item.data(Qt.UserRole + 1)
-                selected_files.append({"path": full_path, "size_bytes": size_bytes})
+        # Modeldeki işaretli dosyaları al (satırları tek tek dolaşmadan)
+        selected_files = self.results_model.checked_files()
 
         if not selected_files:
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("trash_error_select")}')
@@ -1281,143 +5197,147 @@ class PhotoFinderApp(QMainWindow):
             self.status_label.setText(f'{get_text("status_prefix")}: {get_text("trash_canceled")}')
             return
 
-        moved_count = 0
-        error_count = 0
-        moved_paths = []
+        # Disk başına tek meta veri işlemi; farklı diskler eşzamanlı işlenir
+        self._start_trash_operation("move", selected_files, get_text("delete_selected"))
+
+    # Çöp işlemi -> (onay penceresi başlığı, başarı metni, hata metni)
+    TRASH_OPERATION_TEXTS = {
+        "move": ("delete_confirm_title", "trash_success", "trash_error"),
+        "restore": ("restore_confirm_title", "restore_success", "restore_error"),
+        "purge": ("purge_confirm_title", "purge_success", "purge_error"),
+    }
+
+    def _start_trash_operation(self, operation, items, status_text):
+        """Çöp işlemini arka planda başlatır; sürerken çakışabilecek düğmeler kapatılır."""
+        if self.trash_worker is not None:
+            return
+        self._trash_status_text = status_text
+        self._trash_done_count = 0
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f'{get_text("status_prefix")}: {status_text} (0/{len(items)})')
+        self._set_trash_controls_busy(True)
+
+        self.trash_worker = TrashOperationWorker(self.trash_manager, operation, items)
+        self.trash_worker.progress_updated.connect(self._update_progress)
+        self.trash_worker.files_done.connect(self._trash_files_done)
+        self.trash_worker.operation_finished.connect(self._trash_operation_finished)
+        self.trash_worker.start()
+
+    def _set_trash_controls_busy(self, busy):
+        self.cancel_trash_button.setText(get_text("cancel_operation"))
+        self.cancel_trash_button.setEnabled(busy)
+        self.cancel_trash_button.setVisible(busy)
+        # Süren bir tarama çöp işlemi sırasında da iptal edilebilmeli
+        scan_running = self.worker_thread is not None and self.worker_thread.isRunning()
+        self.start_button.setEnabled(not busy or scan_running)
+        self.select_all_trash_button.setEnabled(not busy)
+        self.unselect_all_trash_button.setEnabled(not busy)
+        has_results = self.results_model.rowCount() > 0
+        self.delete_button.setEnabled(not busy and has_results)
+        self.auto_mark_button.setEnabled(not busy and has_results)
+        if busy:
+            self.restore_button.setEnabled(False)
+            self.purge_button.setEnabled(False)
+
+    @Slot()
+    def _cancel_trash_operation(self):
+        if self.trash_worker is not None and self.trash_worker.isRunning():
+            self.trash_worker.stop()
+            self.cancel_trash_button.setEnabled(False)
 
-        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("delete_selected")}')
+    @Slot(list)
+    def _trash_files_done(self, done):
+        """Biten dosyaları işlem sürerken sonuç listesinden veya çöp tablosundan kaldırır."""
+        self._trash_done_count += len(done)
+        total = len(self.trash_worker.items)
+        self.status_label.setText(f'{get_text("status_prefix")}: {self._trash_status_text} ({self._trash_done_count}/{total})')
+
+        succeeded = [item for item, error in done if error is None]
+        if self.trash_worker.operation == "move":
+            self.results_model.remove_paths([file_data["path"] for file_data in succeeded])
+        else:
+            self.trash_model.remove_items(succeeded)
+
+    @Slot(list)
+    def _trash_operation_finished(self, results):
+        operation = self.trash_worker.operation
+        self.trash_worker.wait()
+        self.trash_worker = None
 
-        for file_data in selected_files:
-            if self.trash_manager.move_to_trash(file_data["path"], file_data["size_bytes"]):
-                moved_count += 1
-                moved_paths.append(file_data["path"])
+        done_count = 0
+        error_count = 0
+        canceled_count = 0
+        for _item, error in results:
+            if error is None:
+                done_count += 1
+            elif error == TRASH_CANCELED:
+                canceled_count += 1
             else:
                 error_count += 1
 
-        self._remove_deleted_rows(moved_paths)
-        self.update_trash_tab() 
+        self._set_trash_controls_busy(False)
+        self.update_trash_tab()
+
+        title_key, success_key, error_key = self.TRASH_OPERATION_TEXTS[operation]
+        if error_count == 0:
+            final_message = get_text(success_key).format(done_count)
+        else:
+            final_message = get_text(error_key).format(done_count, error_count)
+        if canceled_count:
+            final_message = f'{final_message} {get_text("trash_operation_canceled").format(canceled_count)}'
 
         if error_count == 0:
-            final_message = get_text("trash_success").format(moved_count)
-            QMessageBox.information(self, get_text("delete_confirm_title"), final_message)
+            QMessageBox.information(self, get_text(title_key), final_message)
         else:
-            final_message = get_text("trash_error").format(moved_count, error_count)
-            QMessageBox.warning(self, get_text("delete_confirm_title"), final_message)
+            QMessageBox.warning(self, get_text(title_key), final_message)
 
         self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
         
     # <<< FAKE TRASH SEKMESİ YÖNETİMİ (Aynı Kaldı) >>>
     @Slot()
     def update_trash_tab(self):
-        """Fake Trash sekmesindeki tabloyu günceller (DİSK BAZLI)."""
-        all_trash_data = []
+        """Fake Trash sekmesindeki tabloyu günceller (DİSK BAZLI).
 
+        Sekme ve dil değişimlerinde de çağrılır; değişmeyen çöp dizinleri yeniden okunmaz.
+        """
         target_dirs = [self.dir_input.text()] # Tek dizinden al
         target_dirs.append(os.path.expanduser('~')) 
 
-        known_mount_points = set()
+        known_mount_points = []
         for d in target_dirs:
             try:
                 if d and os.path.exists(d):
-                    known_mount_points.add(get_mount_point(d))
+                    mount_point = get_mount_point(d)
+                    if mount_point not in known_mount_points:
+                        known_mount_points.append(mount_point)
             except Exception as e:
                 continue
 
-        for mount_point in known_mount_points:
-            # Yeni Fake Trash yolu
-            trash_dir = os.path.join(mount_point, '.Photoagent-Trash-1000') 
-            metadata_path = os.path.join(trash_dir, 'trashdata.json')
-
-            if os.path.exists(metadata_path):
-                disk_trash_data = self.trash_manager._load_metadata(metadata_path)
-                
-                for item in disk_trash_data:
-                    if "trash_dir" not in item:
-                         item["trash_dir"] = trash_dir
-                    all_trash_data.append(item)
-
-        trash_data = all_trash_data
-        self.trash_table.setRowCount(0)
-        row_count = 0
-
-        for item in trash_data:
-            self.trash_table.insertRow(row_count)
-            
-            # 0. Sütun: CheckBox
-            check_item = QTableWidgetItem()
-            check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            check_item.setCheckState(Qt.CheckState.Unchecked)
-            self.trash_table.setItem(row_count, 0, check_item)
-            
-            # 1. Çöp Dosya Adı
-            trash_filename = item.get("trash_filename", "")
-            trash_dir = item.get("trash_dir", "") 
-            trash_name_item = QTableWidgetItem(trash_filename)
-
-            # İKON EKLEME
-            trash_file_path = os.path.join(trash_dir, trash_filename)
-            file_icon = self._get_file_icon(trash_file_path)
-            trash_name_item.setIcon(file_icon)
-
-            self.trash_table.setItem(row_count, 1, trash_name_item)
-            
-            # 2. Orijinal Yolu
-            original_path = item.get("original_path", "")
-            original_path_item = QTableWidgetItem(original_path)
-            
-            original_path_item.setData(Qt.UserRole, trash_filename)
-            original_path_item.setData(Qt.UserRole + 1, trash_dir) 
+        # Yeni Fake Trash yolu; iç içe bağlama noktalarının çöpleri taşıma yapılan dizinler listesinden gelir
+        trash_dirs = [os.path.join(mount_point, TRASH_DIR_NAME) for mount_point in known_mount_points]
+        trash_dirs = [trash_dir for trash_dir in trash_dirs if os.path.isdir(trash_dir)]
+        trash_dirs += [trash_dir for trash_dir in self.trash_manager.known_trash_dirs() if trash_dir not in trash_dirs]
+        self.trash_model.refresh(trash_dirs)
 
-            self.trash_table.setItem(row_count, 2, original_path_item)
-            
-            # 3. Silinme Tarihi
-            date_item = QTableWidgetItem(item.get("deletion_date", ""))
-            self.trash_table.setItem(row_count, 3, date_item)
-            
-            row_count += 1
-            
-        self.trash_table.setRowCount(row_count)
-        is_any_file = row_count > 0
+        # Arka planda çöp işlemi sürerken düğmeler kapalı kalır
+        is_any_file = self.trash_model.rowCount() > 0 and self.trash_worker is None
         self.restore_button.setEnabled(is_any_file)
         self.purge_button.setEnabled(is_any_file)
         
     @Slot()
     def _select_all_trash_files(self):
         """Çöp tablosundaki tüm dosyaları işaretler."""
-        for row in range(self.trash_table.rowCount()):
-            item = self.trash_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        self.trash_model.set_all_checked(True)
 
     @Slot()
     def _unselect_all_trash_files(self):
         """Çöp tablosundaki tüm dosyaların işaretini kaldırır."""
-        for row in range(self.trash_table.rowCount()):
-            item = self.trash_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        self.trash_model.set_all_checked(False)
 
 
-    @Slot()
     def _get_selected_trash_items(self):
         """Çöp tablosunda seçilen dosyaların listesini döndürür."""
-        selected_items = []
-        for row in range(self.trash_table.rowCount()):
-            check_item = self.trash_table.item(row, 0)
-            if check_item and check_item.checkState() == Qt.CheckState.Checked:
-                trash_filename = self.trash_table.item(row, 1).text() 
-                original_path_item = self.trash_table.item(row, 2)
-                
-                if original_path_item:
-                    original_path = original_path_item.text()
-                    trash_dir = original_path_item.data(Qt.UserRole + 1)
-                    
-                    selected_items.append({
-                        "trash_filename": trash_filename, 
-                        "original_path": original_path,
-                        "trash_dir": trash_dir 
-                    })
-        return selected_items
+        return self.trash_model.checked_items()
 
     @Slot()
     def _restore_selected_files(self):
@@ -1437,26 +5357,7 @@ class PhotoFinderApp(QMainWindow):
 
         if reply == QMessageBox.StandardButton.No: return
 
-        restored_count = 0
-        error_count = 0
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_restoring_files")}')
-        for file_data in selected_files:
-            if self.trash_manager.restore_file(file_data["trash_filename"], file_data["original_path"], file_data["trash_dir"]):
-                restored_count += 1
-            else:
-                error_count += 1
-
-        self.update_trash_tab()
-        
-        if error_count == 0:
-            final_message = get_text("restore_success").format(restored_count)
-            QMessageBox.information(self, get_text("restore_confirm_title"), final_message)
-        else:
-            final_message = get_text("restore_error").format(restored_count, error_count)
-            QMessageBox.warning(self, get_text("restore_confirm_title"), final_message)
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
+        self._start_trash_operation("restore", selected_files, get_text("status_restoring_files"))
 
 
     @Slot()
@@ -1477,26 +5378,7 @@ class PhotoFinderApp(QMainWindow):
 
         if reply == QMessageBox.StandardButton.No: return
 
-        purged_count = 0
-        error_count = 0
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {get_text("status_purging_files")}')
-        for file_data in selected_files:
-            if self.trash_manager.purge_file(file_data["trash_filename"], file_data["original_path"], file_data["trash_dir"]):
-                purged_count += 1
-            else:
-                error_count += 1
-
-        self.update_trash_tab()
-
-        if error_count == 0:
-            final_message = get_text("purge_success").format(purged_count)
-            QMessageBox.information(self, get_text("purge_confirm_title"), final_message)
-        else:
-            final_message = get_text("purge_error").format(purged_count, error_count)
-            QMessageBox.warning(self, get_text("purge_confirm_title"), final_message)
-
-        self.status_label.setText(f'{get_text("status_prefix")}: {final_message}')
+        self._start_trash_operation("purge", selected_files, get_text("status_purging_files"))
 
 #----Riders on the Storm----        
 #Riders on the storm